@@ -0,0 +1,340 @@
+# benchmarks/run.py
+"""
+Бенчмарк цикла опроса: разбор vehicleStatus и отрисовка сущностей
+
+Запуск из корня репозитория:
+
+    python -m benchmarks.run                    # замер и сравнение с baseline.json
+    python -m benchmarks.run --save-baseline    # записать текущие соотношения как baseline
+    python -m benchmarks.run --cars 50 --filter render
+
+Корпус - benchmarks/corpus/*.json (стоянка, движение, AC и DC зарядка,
+разрядка V2L). Для каждого ответа замеряются:
+- parser.<сценарий>.<метод> - методы VehicleDataParser (get_*_info и т.д.);
+- snapshot.<сценарий> - VehicleSnapshot.from_status;
+- render.<N>cars - native_value / is_on / extra_state_attributes всех
+  сущностей sensor и binary_sensor для N машин (сценарии по кругу).
+
+Для каждой операции печатается лучшее время ns на вызов и пик памяти
+(tracemalloc) за один вызов.
+
+Абсолютное время зависит от машины и ее загрузки, поэтому с baseline
+сравнивается не оно, а отношение ко времени эталонного парсера
+(reference_parse - простой обход ответа, замороженный вместе с baseline).
+Эталон замеряется в том же запуске сериями вперемешку с операцией, так
+что общая скорость машины и фоновая нагрузка сокращаются. Операция
+считается регрессией, если ее отношение выросло больше чем в --threshold
+раз (по умолчанию 1.25: разброс отношений между запусками на загруженной
+машине - до ~5% у разбора целого ответа и до ~15% у операций короче
+микросекунды), код выхода - 1. Отношения все же зависят от версии
+Python - baseline пересохраняется при ее смене и при изменении эталона.
+"""
+import argparse
+import asyncio
+import gc
+import glob
+import inspect
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Tuple
+
+from custom_components.zeekr import binary_sensor, sensor
+from custom_components.zeekr.const import DOMAIN
+from custom_components.zeekr.vehicle_parser import VehicleDataParser, VehicleSnapshot
+from custom_components.zeekr.zeekr_api import METRIC_ENDPOINTS
+from custom_components.zeekr.zeekr_metrics import ApiMetrics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS_DIR = os.path.join(BENCH_DIR, 'corpus')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baseline.json')
+
+# Методы парсера, которым нужны аргументы - в замер не входят
+SKIP_PARSER_METHODS = ('get_field', 'get_code')
+
+
+def load_corpus(directory: str = CORPUS_DIR) -> Dict[str, Dict[str, Any]]:
+    """Ответы корпуса: имя файла без .json -> vehicleStatus"""
+    corpus = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            corpus[os.path.splitext(os.path.basename(path))[0]] = json.load(f)
+    return corpus
+
+
+# ==================== ЭТАЛОН ====================
+# Не менять: baseline хранит время операций в единицах этого эталона.
+# После любого изменения baseline нужно пересохранить (--save-baseline)
+
+
+def reference_parse(status: Dict[str, Any]) -> Dict[str, Any]:
+    """Эталонный парсер: все листья ответа, числа - float, остальное - str"""
+    result = {}
+    stack = [('', status)]
+    while stack:
+        prefix, section = stack.pop()
+        for key, value in section.items():
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                stack.append((path, value))
+                continue
+            try:
+                result[path] = float(value)
+            except (TypeError, ValueError):
+                result[path] = str(value)
+    return result
+
+
+# ==================== ЗАМЕР ====================
+
+
+def _batch_size(func: Callable[[], Any], seconds: float) -> int:
+    """Сколько вызовов подряд занимают не меньше seconds"""
+    number = 1
+    while True:
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        if time.perf_counter_ns() - start >= seconds * 1e9:
+            return number
+        number *= 2
+
+
+def _time_batch(func: Callable[[], Any], number: int) -> float:
+    """ns на вызов за серию из number вызовов"""
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        func()
+    return (time.perf_counter_ns() - start) / number
+
+
+def time_op(func: Callable[[], Any], reference: Callable[[], Any],
+            min_time: float = 0.2, repeats: int = 21) -> Tuple[float, float]:
+    """
+    Время операции: лучшее абсолютное и относительно эталона
+
+    Серии эталона и операции чередуются (каждая около min_time / repeats / 2
+    секунд), для каждой пары считается отношение. Соседние серии идут в
+    одинаковых условиях, поэтому медиана отношений почти не зависит от
+    фоновой нагрузки, в отличие от абсолютного времени. GC на время замера
+    отключается.
+
+    Returns:
+        (лучшее время серии в ns на вызов, медиана отношений к эталону)
+    """
+    seconds = min_time / repeats / 2
+    number = _batch_size(func, seconds)
+    reference_number = _batch_size(reference, seconds)
+
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        samples = []
+        ratios = []
+        for _ in range(repeats):
+            reference_ns = _time_batch(reference, reference_number)
+            ns = _time_batch(func, number)
+            samples.append(ns)
+            ratios.append(ns / reference_ns)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return min(samples), statistics.median(ratios)
+
+
+def peak_bytes(func: Callable[[], Any]) -> int:
+    """Пик выделенной памяти за один вызов (tracemalloc)"""
+    func()  # Прогрев кэшей, чтобы не считать разовые выделения
+    tracemalloc.start()
+    try:
+        base, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return max(0, peak - base)
+
+
+# ==================== ОПЕРАЦИИ ====================
+
+
+class BenchVehicleCoordinator:
+    """
+    Координатор с готовым снимком - то, что читают сущности
+
+    Повторяет атрибуты ZeekrVehicleCoordinator, которые используют
+    свойства сущностей, без HA event loop и сети.
+    """
+
+    def __init__(self, vin: str, status: Dict[str, Any]):
+        self.vin = vin
+        self.data = status
+        self.snapshot = VehicleSnapshot.from_status(status)
+        self.last_update_success = True
+        self.data_fetched_at = time.time()
+        self.restored = False
+        self.is_stale = False
+        self.has_recent_data = True
+
+
+class _BenchApi:
+    user_id = 'benchmark'
+
+    def __init__(self):
+        self.metrics = ApiMetrics(METRIC_ENDPOINTS)
+
+
+class _BenchAccount:
+    def __init__(self, vehicles: Dict[str, BenchVehicleCoordinator]):
+        self.vehicles = vehicles
+        self.api_client = _BenchApi()
+
+
+class _BenchEntry:
+    entry_id = 'benchmark'
+
+
+class _BenchHass:
+    def __init__(self, account: _BenchAccount):
+        self.data = {DOMAIN: {_BenchEntry.entry_id: account}}
+
+
+def build_entities(corpus: Dict[str, Dict[str, Any]], cars: int) -> List[Any]:
+    """
+    Сущности sensor и binary_sensor для cars машин
+
+    Создаются через async_setup_entry платформ - список тот же, что и в HA.
+    """
+    statuses = list(corpus.values())
+    vehicles = {}
+    for number in range(cars):
+        vin = f"BENCH{number:012d}"
+        vehicles[vin] = BenchVehicleCoordinator(vin, statuses[number % len(statuses)])
+
+    hass = _BenchHass(_BenchAccount(vehicles))
+    entities: List[Any] = []
+    for platform in (sensor, binary_sensor):
+        asyncio.run(platform.async_setup_entry(hass, _BenchEntry(), entities.extend))
+    return entities
+
+
+def render_entities(entities: List[Any]) -> None:
+    """Читает все, что HA читает при записи состояния сущности"""
+    for entity in entities:
+        if hasattr(entity, 'is_on'):
+            entity.is_on
+        else:
+            entity.native_value
+        entity.extra_state_attributes
+
+
+def collect_ops(corpus: Dict[str, Dict[str, Any]], cars: int) -> List[Tuple[str, Callable[[], Any]]]:
+    """Все замеряемые операции: (имя, функция без аргументов)"""
+    methods = [
+        (name, method)
+        for name, method in inspect.getmembers(VehicleDataParser, inspect.isfunction)
+        if name.startswith('get_') and name not in SKIP_PARSER_METHODS
+    ]
+
+    ops = []
+    for scenario, status in corpus.items():
+        parser = VehicleDataParser(status)
+        for name, method in methods:
+            ops.append((f"parser.{scenario}.{name}", lambda m=method, p=parser: m(p)))
+        ops.append((f"snapshot.{scenario}", lambda s=status: VehicleSnapshot.from_status(s)))
+
+    entities = build_entities(corpus, cars)
+    ops.append((f"render.{cars}cars", lambda e=entities: render_entities(e)))
+    return ops
+
+
+# ==================== ОТЧЕТ ====================
+
+
+def run(ops: List[Tuple[str, Callable[[], Any]]], min_time: float,
+        reference: Callable[[], Any]) -> Dict[str, Dict[str, float]]:
+    """
+    Замеряет операции
+
+    relative - время операции в единицах эталона (см. time_op)
+    """
+    results = {}
+    for name, func in ops:
+        ns, relative = time_op(func, reference, min_time)
+        results[name] = {'ns': ns, 'relative': relative, 'peak_bytes': peak_bytes(func)}
+    return results
+
+
+def report(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+           threshold: float) -> List[str]:
+    """Печатает таблицу и возвращает имена операций с регрессией"""
+    regressions = []
+    width = max(len(name) for name in results)
+    print(f"{'operation':<{width}}  {'ns/op':>12}  {'x ref':>8}  {'peak KiB':>9}  {'vs baseline':>11}")
+    for name, result in results.items():
+        line = (f"{name:<{width}}  {result['ns']:>12,.0f}  {result['relative']:>8.3f}"
+                f"  {result['peak_bytes'] / 1024:>9.1f}")
+        base = baseline.get(name)
+        if base and base.get('relative'):
+            ratio = result['relative'] / base['relative']
+            line += f"  {ratio:>10.2f}x"
+            if ratio > threshold:
+                line += '  REGRESSION'
+                regressions.append(name)
+        print(line)
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--cars', type=int, default=10, help='Машин для замера отрисовки сущностей')
+    parser.add_argument('--filter', default='', help='Замерять только операции с этой подстрокой')
+    parser.add_argument('--min-time', type=float, default=0.2, help='Секунд на замер одной операции')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Допустимый рост времени относительно эталона к baseline')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='Папка с ответами vehicleStatus')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='Файл baseline')
+    parser.add_argument('--save-baseline', action='store_true', help='Записать результаты как baseline')
+    args = parser.parse_args(argv)
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"No payloads in {args.corpus}", file=sys.stderr)
+        return 2
+
+    ops = [(name, func) for name, func in collect_ops(corpus, args.cars) if args.filter in name]
+    reference_status = corpus[sorted(corpus)[0]]
+    results = run(ops, args.min_time, lambda: reference_parse(reference_status))
+
+    baseline = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        # Абсолютное время не сохраняется - на другой машине оно бессмысленно
+        saved = {
+            name: {'relative': round(result['relative'], 6), 'peak_bytes': result['peak_bytes']}
+            for name, result in results.items()
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(saved, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline saved: {args.baseline}")
+        return 0
+
+    if regressions:
+        print(f"{len(regressions)} regressions over {args.threshold}x baseline", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
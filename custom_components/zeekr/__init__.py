@@ -1,20 +1,29 @@
 # custom_components/zeekr/__init__.py
 """Zeekr integration for Home Assistant"""
 
-import logging
-import os
 import json
+import logging
 from typing import Final
-from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN, CONF_MAX_CONCURRENT_REQUESTS, CONF_DEBUG_LOG_SAMPLE_RATE, CONF_ARCHIVE_RESPONSES,
+    CONF_RECORD_HISTORY, CONF_PROFILE_CYCLES, CONF_TOKEN_REFRESH, PROFILE_MAX_CYCLES, PROFILE_DUMP_FILE,
+)
 from .zeekr_api import ZeekrAPI
-from .coordinator import ZeekrDataCoordinator
+from .coordinator import ZeekrAccountCoordinator, ZeekrPollingScheduler
 from .zeekr_storage import token_storage
+from .zeekr_archive import ResponseArchive
+from .zeekr_history import HistoryStore
+from .zeekr_profiler import CycleProfiler
+from .zeekr_config import (
+    MAX_CONCURRENT_REQUESTS, DEBUG_LOG_SAMPLE_RATE, ARCHIVE_DIR, HISTORY_DIR,
+)
+from .zeekr_logging import set_debug_sample_rate
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -31,6 +40,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.info(f"🔧 Setting up Zeekr integration for entry {entry.entry_id}")
 
+    # Выборка DEBUG логов горячих путей (подпись, опрос, парсер)
+    set_debug_sample_rate(entry.options.get(CONF_DEBUG_LOG_SAMPLE_RATE, DEBUG_LOG_SAMPLE_RATE))
+
     try:
         # Загружаем токены из entry
         tokens = dict(entry.data)
@@ -38,7 +50,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Резервно проверяем файл (для старых установок)
         if not tokens or not tokens.get('accessToken'):
             _LOGGER.warning("⚠️ No tokens in entry.data, trying file storage...")
-            tokens = token_storage.load_tokens()
+            tokens = await hass.async_add_executor_job(token_storage.load_tokens)
 
             if tokens:
                 hass.config_entries.async_update_entry(entry, data=tokens)
@@ -56,32 +68,100 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             _LOGGER.error(f"❌ Missing required token fields: {missing_fields}")
             return False
 
-        # Создаем папку для ответов
-        try:
-            responses_dir = os.path.join(hass.config.path('www'), 'zeekr_responses')
-            os.makedirs(responses_dir, exist_ok=True)
-            _LOGGER.info(f"📁 Responses directory: {responses_dir}")
-        except Exception as e:
-            _LOGGER.error(f"❌ Failed to create responses directory: {e}")
-            responses_dir = None
+        # Архив ответов - вне www, чтобы не раздавать его веб-сервером.
+        # Папка создается при первой записи (в executor)
+        archive = ResponseArchive(hass.config.path(ARCHIVE_DIR))
+        _LOGGER.info(f"📁 Responses archive: {archive.directory}")
+
+        history = None
+        if entry.options.get(CONF_RECORD_HISTORY, False):
+            history = HistoryStore(hass.config.path(HISTORY_DIR))
+            _LOGGER.info(f"📈 Numeric history: {history.directory}")
+
+        profiler = None
+        if entry.options.get(CONF_PROFILE_CYCLES, False):
+            profiler = CycleProfiler(PROFILE_MAX_CYCLES)
+            _LOGGER.info(f"⏱️ Update cycle profiling enabled (last {PROFILE_MAX_CYCLES} cycles)")
 
         # Создаем API клиент
         api_client = ZeekrAPI(
             access_token=tokens.get('accessToken'),
             user_id=tokens.get('userId'),
             client_id=tokens.get('clientId'),
-            device_id=tokens.get('device_id')
+            device_id=tokens.get('device_id'),
+            async_session=async_get_clientsession(hass),
+            max_concurrent_requests=entry.options.get(
+                CONF_MAX_CONCURRENT_REQUESTS, MAX_CONCURRENT_REQUESTS
+            ),
+            refresh_token=tokens.get('refreshToken'),
+            token_expires_at=tokens.get('tokenExpiresAt'),
+            token_refresh=entry.options.get(CONF_TOKEN_REFRESH, False),
         )
 
-        # Создаем coordinator
-        coordinator = ZeekrDataCoordinator(hass, api_client, responses_dir)
-
-        # Получаем первые данные
+        # Создаем coordinator аккаунта (список VIN)
+        coordinator = ZeekrAccountCoordinator(
+            hass,
+            api_client,
+            archive,
+            entry.entry_id,
+            scheduler=ZeekrPollingScheduler.from_options(entry.options),
+            archive_every_poll=entry.options.get(CONF_ARCHIVE_RESPONSES, False),
+            history=history,
+            profiler=profiler,
+        )
+        # Архив и история пишутся пачками из фоновой задачи
+        entry.async_create_background_task(hass, coordinator.writer.run(), f"{DOMAIN}_writer")
+        entry.async_on_unload(coordinator.async_close_storage)
+        coordinator.applied_options = dict(entry.options)
+
+        # Обновленные токены сохраняем в entry, чтобы они пережили перезапуск
+        @callback
+        def _async_save_tokens(new_tokens) -> None:
+            hass.config_entries.async_update_entry(entry, data={**entry.data, **new_tokens})
+            coordinator.async_schedule_token_refresh()
+            _LOGGER.debug("🔑 Refreshed tokens saved to config entry")
+
+        entry.async_on_unload(api_client.tokens.add_listener(_async_save_tokens))
+        entry.async_on_unload(coordinator.async_cancel_token_refresh)
+        coordinator.async_schedule_token_refresh()
+
+        await coordinator.async_load_vehicle_cache()
+        await coordinator.async_load_state_cache()
+
+        # Получаем список автомобилей (из .storage, если он свежий)
         try:
             await coordinator.async_config_entry_first_refresh()
-            _LOGGER.info("✅ First data refresh successful")
+            _LOGGER.info("✅ Vehicle list loaded")
         except Exception as e:
-            _LOGGER.warning(f"⚠️ First refresh failed: {e}")
+            _LOGGER.warning(f"⚠️ Failed to load vehicle list: {e}")
+
+        # Координатор на каждый автомобиль. Машины с сохраненным статусом
+        # поднимаются сразу и обновляются в фоне; ждем только машины без кэша
+        coordinator.create_vehicle_coordinators()
+        restored = [c for c in coordinator.vehicles.values() if c.restored]
+        missing = [c for c in coordinator.vehicles.values() if not c.restored]
+        await coordinator.async_refresh_coordinators(missing)
+        if restored:
+            entry.async_create_background_task(
+                hass,
+                coordinator.async_refresh_coordinators(restored),
+                f"{DOMAIN}_refresh_restored_vehicles",
+            )
+        _LOGGER.info(
+            f"✅ First data refresh done for {len(missing)} vehicles, "
+            f"{len(restored)} started from cached state"
+        )
+
+        # Список VIN изменился - перезагружаем интеграцию, чтобы пересоздать сущности
+        vins_at_setup = set(coordinator.vehicles)
+
+        @callback
+        def _async_check_vehicle_list() -> None:
+            if coordinator.data and set(coordinator.data) != vins_at_setup:
+                _LOGGER.info("🔄 Vehicle list changed, reloading Zeekr integration")
+                hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+
+        entry.async_on_unload(coordinator.async_add_listener(_async_check_vehicle_list))
 
         # Сохраняем coordinator
         hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
@@ -91,7 +171,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info(f"✅ Platforms configured: {PLATFORMS}")
 
         # ==================== РЕГИСТРАЦИЯ СЕРВИСОВ ====================
-        _register_services(hass, responses_dir)
+        _register_services(hass)
+
+        # Перезагружаем интеграцию при изменении опций
+        entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
         _LOGGER.info("🎉 Zeekr integration setup COMPLETE!")
         return True
@@ -101,42 +184,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
-def _register_services(hass: HomeAssistant, responses_dir: str) -> None:
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when options change"""
+    # Сохранение обновленных токенов тоже вызывает этот слушатель - его пропускаем
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if coordinator is not None and coordinator.applied_options == dict(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _register_services(hass: HomeAssistant) -> None:
     """Регистрирует сервисы интеграции"""
 
+    async def _async_archive_all(description: str) -> int:
+        """Архивирует текущие данные всех автомобилей, возвращает число записей"""
+        saved = 0
+        for entry_id, coord in hass.data.get(DOMAIN, {}).items():
+            if not isinstance(coord, ZeekrAccountCoordinator):
+                continue
+            if coord.archive is None:
+                _LOGGER.error("❌ Response archive not configured")
+                continue
+            for vin, vehicle in coord.vehicles.items():
+                if vehicle.data and coord.async_archive_response(vin, vehicle.data, description):
+                    saved += 1
+            # Ручное сохранение пишется сразу, не дожидаясь фонового сброса
+            await coord.writer.flush()
+        return saved
+
     async def handle_save_response(call: ServiceCall) -> None:
         """Сохраняет ответ сервера"""
         _LOGGER.info("📥 Manual save response called")
 
-        try:
-            if not responses_dir:
-                _LOGGER.error("❌ Responses directory not configured")
-                return
-
-            filename = call.data.get(
-                'filename',
-                f'response_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        # Поле осталось от сохранения в отдельные JSON файлы - принимаем, но не используем
+        if call.data.get('filename'):
+            _LOGGER.warning(
+                "⚠️ save_response: 'filename' is deprecated and ignored, "
+                f"responses are appended to the archive ({ARCHIVE_DIR})"
             )
 
-            for entry_id, coord in hass.data.get(DOMAIN, {}).items():
-                if isinstance(coord, ZeekrDataCoordinator) and coord.last_response:
-                    filepath = os.path.join(responses_dir, filename)
-
-                    data = {
-                        "_metadata": {
-                            "saved_at": datetime.now().isoformat(),
-                            "description": call.data.get('description', 'Manual save'),
-                        },
-                        "data": coord.last_response
-                    }
-
-                    with open(filepath, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, ensure_ascii=False, indent=2)
-
-                    _LOGGER.info(f"✅ Response saved to {filepath}")
-                    return
-
-            _LOGGER.warning("⚠️ No vehicle data available")
+        try:
+            saved = await _async_archive_all(call.data.get('description', 'Manual save'))
+            if saved:
+                _LOGGER.info(f"✅ {saved} responses saved to archive")
+            else:
+                _LOGGER.warning("⚠️ No vehicle data available")
 
         except Exception as e:
             _LOGGER.error(f"❌ Error saving response: {e}", exc_info=True)
@@ -146,39 +238,54 @@ def _register_services(hass: HomeAssistant, responses_dir: str) -> None:
         _LOGGER.info("🔄 Refresh and save called")
 
         try:
-            if not responses_dir:
-                _LOGGER.error("❌ Responses directory not configured")
-                return
-
             for entry_id, coord in hass.data.get(DOMAIN, {}).items():
-                if isinstance(coord, ZeekrDataCoordinator):
-                    await coord.async_refresh()
-
-                    if coord.last_response:
-                        filename = f"response_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                        filepath = os.path.join(responses_dir, filename)
+                if isinstance(coord, ZeekrAccountCoordinator):
+                    await coord.async_refresh_vehicles()
 
-                        data = {
-                            "_metadata": {
-                                "saved_at": datetime.now().isoformat(),
-                                "description": call.data.get('description', 'Auto refresh'),
-                            },
-                            "data": coord.last_response
-                        }
-
-                        with open(filepath, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, ensure_ascii=False, indent=2)
-
-                        _LOGGER.info(f"✅ Response auto-saved")
+            saved = await _async_archive_all(call.data.get('description', 'Auto refresh'))
+            _LOGGER.info(f"✅ {saved} responses auto-saved to archive")
 
         except Exception as e:
             _LOGGER.error(f"❌ Error: {e}", exc_info=True)
 
+    async def handle_dump_profile(call: ServiceCall) -> ServiceResponse:
+        """Выгружает профиль последних циклов обновления"""
+        profiles = {}
+        for entry_id, coord in hass.data.get(DOMAIN, {}).items():
+            if isinstance(coord, ZeekrAccountCoordinator) and coord.profiler is not None:
+                profiles[entry_id] = coord.profiler.as_dict()
+                if call.data.get('clear', False):
+                    coord.profiler.clear()
+
+        if not profiles:
+            _LOGGER.warning("⚠️ Update cycle profiling is disabled in integration options")
+            return {'entries': {}} if call.return_response else None
+
+        def _write() -> str:
+            path = hass.config.path(PROFILE_DUMP_FILE)
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(profiles, f, ensure_ascii=False, indent=2)
+            return path
+
+        path = await hass.async_add_executor_job(_write)
+        for entry_id, profile in profiles.items():
+            for kind, phases in profile['summary'].items():
+                _LOGGER.info(
+                    f"⏱️ [{entry_id}] {kind}: "
+                    + ", ".join(f"{name} p95 {stats['p95']:.1f}ms" for name, stats in phases.items())
+                )
+        _LOGGER.info(f"✅ Update cycle profile written to {path}")
+
+        return {'entries': profiles} if call.return_response else None
+
     # Регистрируем сервисы
     hass.services.async_register(DOMAIN, 'save_response', handle_save_response)
     hass.services.async_register(DOMAIN, 'refresh_and_save', handle_refresh_and_save)
+    hass.services.async_register(
+        DOMAIN, 'dump_profile', handle_dump_profile, supports_response=SupportsResponse.OPTIONAL
+    )
 
-    _LOGGER.info("✅ Services registered: save_response, refresh_and_save")
+    _LOGGER.info("✅ Services registered: save_response, refresh_and_save, dump_profile")
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -193,6 +300,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         hass.services.async_remove(DOMAIN, 'save_response')
         hass.services.async_remove(DOMAIN, 'refresh_and_save')
+        hass.services.async_remove(DOMAIN, 'dump_profile')
 
         return unload_ok
 
@@ -14,17 +14,27 @@ from datetime import datetime
 from .zeekr_config import (
     BASE_URL_TOC, X_CA_SECRET, X_CA_KEY, APP_VERSION,
     PHONE_MODEL, PHONE_VERSION, APP_TYPE, REQUEST_TIMEOUT,
-    REGION_CODE, BASE_URL_SECURE, HMAC_SECRET
+    REGION_CODE, BASE_URL_SECURE
 )
+from .zeekr_logging import get_logger
+from .zeekr_signer import ZeekrSigner
 from .zeekr_storage import token_storage
 
+_LOGGER = get_logger(__name__)
+
 
 class ZeekrAuth:
     """Класс для аутентификации в Zeekr"""
 
-    def __init__(self):
+    def __init__(self, base_url: Optional[str] = None, secure_base_url: Optional[str] = None):
+        """
+        Args:
+            base_url: Адрес TOC шлюза (по умолчанию BASE_URL_TOC)
+            secure_base_url: Адрес SECURE шлюза (по умолчанию BASE_URL_SECURE)
+        """
         self.device_id = str(uuid.uuid4())
-        self.base_url = BASE_URL_TOC
+        self.base_url = (base_url or BASE_URL_TOC).rstrip('/')
+        self.secure_base_url = (secure_base_url or BASE_URL_SECURE).rstrip('/')
         self.session = requests.Session()
         self.mobile = None  # Сохраняем мобильный номер
 
@@ -94,7 +104,7 @@ class ZeekrAuth:
         Returns:
             Кортеж (успешность, сообщение)
         """
-        print(f"\n📱 Запрашиваю SMS код на номер {mobile}...")
+        _LOGGER.debug("📱 Requesting SMS code for %s", mobile)
 
         timestamp = str(int(datetime.now().timestamp() * 1000))
         nonce = int(random.random() * 1e8)
@@ -117,15 +127,15 @@ class ZeekrAuth:
             data = response.json()
 
             if data.get('code') == '000000':
-                print("✅ SMS код отправлен!")
+                _LOGGER.info("✅ SMS code sent")
                 return True, "SMS код отправлен успешно"
             else:
                 error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка: {error_msg}")
+                _LOGGER.warning("❌ SMS code request rejected: %s", error_msg)
                 return False, error_msg
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при отправке запроса: {e}")
+            _LOGGER.error("❌ SMS code request failed: %s", e)
             return False, str(e)
 
     def login_with_sms(self, mobile: str, sms_code: str) -> Tuple[bool, Optional[Dict]]:
@@ -139,7 +149,7 @@ class ZeekrAuth:
         Returns:
             Кортеж (успешность, словарь с токенами или None)
         """
-        print(f"\n🔐 Пытаюсь авторизоваться с SMS кодом...")
+        _LOGGER.debug("🔐 Logging in with SMS code")
 
         timestamp = str(int(datetime.now().timestamp() * 1000))
         nonce = int(random.random() * 1e8)
@@ -175,15 +185,15 @@ class ZeekrAuth:
                     'device_id': self.device_id,
                 }
                 self.mobile = mobile  # Сохраняем мобильный
-                print("✅ Авторизация успешна!")
+                _LOGGER.info("✅ SMS login successful")
                 return True, tokens
             else:
                 error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка авторизации: {error_msg}")
+                _LOGGER.warning("❌ SMS login rejected: %s", error_msg)
                 return False, None
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при запросе: {e}")
+            _LOGGER.error("❌ Request failed: %s", e)
             return False, None
 
     def get_auth_code(self, jwt_token: str) -> Tuple[bool, Optional[str]]:
@@ -196,7 +206,7 @@ class ZeekrAuth:
         Returns:
             Кортеж (успешность, Auth Code или None)
         """
-        print(f"\n🔑 Получаю Auth Code...")
+        _LOGGER.debug("🔑 Requesting auth code")
 
         timestamp = str(int(datetime.now().timestamp() * 1000))
         nonce = int(random.random() * 1e8)
@@ -223,18 +233,18 @@ class ZeekrAuth:
             if data.get('code') == '000000':
                 auth_code = data.get('data', {}).get('YIKAT_NEW')
                 if auth_code:
-                    print(f"✅ Auth Code получен: {auth_code[:20]}...")
+                    _LOGGER.debug("✅ Auth code received")
                     return True, auth_code
                 else:
-                    print("❌ Auth Code не найден в ответе")
+                    _LOGGER.warning("❌ Auth code missing in response")
                     return False, None
             else:
                 error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка получения Auth Code: {error_msg}")
+                _LOGGER.warning("❌ Auth code request rejected: %s", error_msg)
                 return False, None
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при запросе: {e}")
+            _LOGGER.error("❌ Request failed: %s", e)
             return False, None
 
     def login_with_auth_code(self, auth_code: str) -> Tuple[bool, Optional[Dict]]:
@@ -248,17 +258,13 @@ class ZeekrAuth:
         Returns:
             Кортеж (успешность, словарь с полными токенами или None)
         """
-        print(f"\n🔐 Авторизуюсь с Auth Code...")
+        _LOGGER.debug("🔐 Opening session with auth code")
 
-        import hmac
-        import base64
         from urllib.parse import urlencode
 
-        timestamp = str(int(datetime.now().timestamp() * 1000))
-        nonce = str(uuid.uuid4()).upper()
-
-        # Используем BASE_URL_SECURE для этого запроса
-        url = f"{BASE_URL_SECURE}/auth/account/session/secure"
+        # Этот запрос идет на SECURE шлюз
+        path = '/auth/account/session/secure'
+        url = f"{self.secure_base_url}{path}"
 
         params = {
             'identity_type': 'zeekr',
@@ -268,73 +274,18 @@ class ZeekrAuth:
             'authCode': auth_code,
         }
 
-        # ========== ВЫЧИСЛЯЕМ ПОДПИСЬ ==========
-        # Сортируем параметры
+        # ========== ПОДПИСЫВАЕМ ЗАПРОС ==========
         query_string = urlencode(sorted(params.items()))
-
-        # JSON payload
         body = json.dumps(payload)
 
-        # MD5 хеш тела (Base64)
-        body_md5 = base64.b64encode(
-            hashlib.md5(body.encode()).digest()
-        ).decode()
-
-        # Строим строку для подписи
-        string_to_sign = '\n'.join([
-            'application/json;responseformat=3',
-            f'x-api-signature-nonce:{nonce}',
-            'x-api-signature-version:1.0',
-            '',
-            query_string,
-            body_md5,
-            timestamp,
-            'POST',
-            '/auth/account/session/secure',
-        ])
-
-        print(f"[DEBUG] String to sign:\n{string_to_sign}\n")
-
-        # Подписываем HMAC-SHA1
-        signature = base64.b64encode(
-            hmac.new(
-                HMAC_SECRET.encode(),
-                string_to_sign.encode(),
-                hashlib.sha1
-            ).digest()
-        ).decode()
-
-        print(f"[DEBUG] Signature: {signature}\n")
-
-        # Готовим заголовки как для SECURE API с подписью
-        headers = {
-            'content-type': 'application/json',
-            'x-api-signature-version': '1.0',
-            'x-app-id': 'ZEEKRAPP',
-            'user-agent': f'ZeekrLife/{APP_VERSION} (iPhone; iOS {PHONE_VERSION}; Scale/3.00)',
-            'x-device-model': 'iPhone',
-            'x-device-manufacture': 'Apple',
-            'x-agent-type': 'iOS',
-            'x-device-type': 'mobile',
-            'platform': 'NON-CMA',
-            'x-env-type': 'production',
-            'accept-language': 'zh-Hans-CN;q=1, en-CN;q=0.9',
-            'x-agent-version': PHONE_VERSION,
-            'accept': 'application/json;responseformat=3',
-            'x-device-brand': 'Apple',
-            'x-operator-code': 'ZEEKR',
-            'x-device-identifier': self.device_id,
-            'x-timestamp': timestamp,
-            'x-api-signature-nonce': nonce,
-            'x-signature': signature,
-        }
+        # Заголовки как для SECURE API с подписью (токена еще нет)
+        headers = ZeekrSigner(self.device_id).headers('POST', path, body, query_string)
 
         try:
             # Построим URL с параметрами
             full_url = f"{url}?{query_string}"
 
-            print(f"[DEBUG] Full URL: {full_url}")
-            print(f"[DEBUG] Body: {body}")
+            _LOGGER.debug("POST %s", full_url)
 
             response = self.session.post(
                 full_url,
@@ -343,10 +294,9 @@ class ZeekrAuth:
                 timeout=REQUEST_TIMEOUT
             )
 
-            print(f"[DEBUG] Response status: {response.status_code}")
+            _LOGGER.debug("Response status: %s", response.status_code)
 
             data = response.json()
-            print(f"[DEBUG] Ответ от auth/account/session/secure: {json.dumps(data, indent=2, ensure_ascii=False)}")
 
             if data.get('code') == 1000 or str(data.get('code')) == '1000':
                 session_data = data.get('data', {})
@@ -359,13 +309,13 @@ class ZeekrAuth:
                     'mobile': self.mobile if self.mobile else '',
                     'device_id': self.device_id,
                 }
-                print("✅ Авторизация с Auth Code успешна!")
+                _LOGGER.info("✅ Session opened with auth code")
                 return True, tokens
             else:
                 error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка авторизации с Auth Code: {error_msg}")
+                _LOGGER.warning("❌ Auth code session rejected: %s (code: %s)", error_msg, data.get('code'))
                 return False, None
 
         except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при запросе: {e}")
+            _LOGGER.error("❌ Request failed: %s", e)
             return False, None
\ No newline at end of file
@@ -2,20 +2,31 @@
 """Binary sensor platform for Zeekr integration"""
 
 import logging
+from datetime import datetime
 from typing import Any, Dict
 
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import ZeekrDataCoordinator
-from .vehicle_parser import VehicleDataParser
+from .coordinator import ZeekrAccountCoordinator, ZeekrVehicleCoordinator
+from .entity import ZeekrStateChangeMixin
+from .vehicle_parser import (
+    PATH_BASIC,
+    PATH_CLIMATE,
+    PATH_EV,
+    PATH_POSITION,
+    PATH_RUNNING,
+    PATH_SAFETY,
+    VehicleSnapshot,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,12 +38,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Zeekr binary sensors"""
 
-    coordinator: ZeekrDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account: ZeekrAccountCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
 
-    # Для каждого автомобиля создаем binary sensors
-    for vin in coordinator.data.keys():
+    # Для каждого автомобиля создаем binary sensors (на своем координаторе)
+    for vin, coordinator in account.vehicles.items():
         entities.extend([
             # ========== СТАНДАРТНЫЕ ДАТЧИКИ ==========
             ZeekrEngineStatusSensor(coordinator, vin),
@@ -58,6 +69,9 @@ async def async_setup_entry(
             # 🚗 ТОРМОЖЕНИЕ
             ZeekrBrakingSensor(coordinator, vin),
             ZeekrEnergyRecoveryActiveSensor(coordinator, vin),
+
+            # 🗄️ ДИАГНОСТИКА
+            ZeekrDataStaleSensor(coordinator, vin),
         ])
 
     async_add_entities(entities)
@@ -66,12 +80,12 @@ async def async_setup_entry(
 
 # ==================== БАЗОВЫЙ КЛАСС ====================
 
-class ZeekrBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class ZeekrBaseBinarySensor(ZeekrStateChangeMixin, CoordinatorEntity, BinarySensorEntity):
     """Base class for Zeekr binary sensors"""
 
-    def __init__(self, coordinator: ZeekrDataCoordinator, vin: str):
+    def __init__(self, coordinator: ZeekrVehicleCoordinator, vin: str):
         """Initialize binary sensor"""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._data_paths)
         self.vin = vin
         self._attr_has_entity_name = True
 
@@ -90,16 +104,13 @@ class ZeekrBaseBinarySensor(CoordinatorEntity, BinarySensorEntity):
         """Override in subclasses"""
         return "binary_sensor"
 
-    def _get_parser(self) -> VehicleDataParser:
-        """Get parser for current vehicle data"""
-        if self.vin not in self.coordinator.data:
-            return None
-        return VehicleDataParser(self.coordinator.data[self.vin])
+    def _get_snapshot(self) -> VehicleSnapshot:
+        """Get parsed snapshot of current vehicle data (built once per update)"""
+        return self.coordinator.snapshot
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from coordinator"""
-        self.async_write_ha_state()
+    def _state_signature(self) -> tuple:
+        """Binary sensor state is its is_on value"""
+        return (self.is_on,)
 
 
 # ==================== СТАНДАРТНЫЕ ДАТЧИКИ ====================
@@ -110,6 +121,7 @@ class ZeekrEngineStatusSensor(ZeekrBaseBinarySensor):
     _attr_name = "Engine"
     _attr_device_class = BinarySensorDeviceClass.RUNNING
     _attr_icon = "mdi:engine"
+    _data_paths = (f'{PATH_BASIC}.engineStatus',)
 
     def _get_sensor_type(self) -> str:
         return "engine"
@@ -117,10 +129,9 @@ class ZeekrEngineStatusSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if engine is running"""
-        parser = self._get_parser()
-        if parser:
-            status = parser.data.get('basicVehicleStatus', {}).get('engineStatus', '')
-            return status == 'engine_running'
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.is_engine_running
         return False
 
 
@@ -130,6 +141,7 @@ class ZeekrDriverDoorSensor(ZeekrBaseBinarySensor):
     _attr_name = "Driver Door"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "driver_door"
@@ -137,10 +149,9 @@ class ZeekrDriverDoorSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if door is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['driver_door_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.driver_door_open
         return False
 
 
@@ -150,6 +161,7 @@ class ZeekrPassengerDoorSensor(ZeekrBaseBinarySensor):
     _attr_name = "Passenger Door"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "passenger_door"
@@ -157,10 +169,9 @@ class ZeekrPassengerDoorSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if door is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['passenger_door_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.passenger_door_open
         return False
 
 
@@ -170,6 +181,7 @@ class ZeekrDriverRearDoorSensor(ZeekrBaseBinarySensor):
     _attr_name = "Driver Rear Door"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "driver_rear_door"
@@ -177,10 +189,9 @@ class ZeekrDriverRearDoorSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if door is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['driver_rear_door_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.driver_rear_door_open
         return False
 
 
@@ -190,6 +201,7 @@ class ZeekrPassengerRearDoorSensor(ZeekrBaseBinarySensor):
     _attr_name = "Passenger Rear Door"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "passenger_rear_door"
@@ -197,10 +209,9 @@ class ZeekrPassengerRearDoorSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if door is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['passenger_rear_door_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.passenger_rear_door_open
         return False
 
 
@@ -210,6 +221,7 @@ class ZeekrTrunkSensor(ZeekrBaseBinarySensor):
     _attr_name = "Trunk"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:car-door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "trunk"
@@ -217,10 +229,9 @@ class ZeekrTrunkSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if trunk is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['trunk_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.trunk_open
         return False
 
 
@@ -230,6 +241,7 @@ class ZeekrEngineHoodSensor(ZeekrBaseBinarySensor):
     _attr_name = "Капот"
     _attr_device_class = BinarySensorDeviceClass.DOOR
     _attr_icon = "mdi:car-door"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "engine_hood"
@@ -237,10 +249,9 @@ class ZeekrEngineHoodSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if hood is open"""
-        parser = self._get_parser()
-        if parser:
-            security = parser.get_security_info()
-            return security['engine_hood_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.engine_hood_open
         return False
 
 
@@ -250,6 +261,7 @@ class ZeekrDriverWindowSensor(ZeekrBaseBinarySensor):
     _attr_name = "Окно ПЛ"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:window-closed"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "driver_window"
@@ -257,10 +269,9 @@ class ZeekrDriverWindowSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if window is open"""
-        parser = self._get_parser()
-        if parser:
-            windows = parser.get_windows_info()
-            return windows['driver_window'] == 'Открыто'
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.driver_window == '0'
         return False
 
 
@@ -270,6 +281,7 @@ class ZeekrPassengerWindowSensor(ZeekrBaseBinarySensor):
     _attr_name = "Окно ПП"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:window-closed"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "passenger_window"
@@ -277,10 +289,9 @@ class ZeekrPassengerWindowSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if window is open"""
-        parser = self._get_parser()
-        if parser:
-            windows = parser.get_windows_info()
-            return windows['passenger_window'] == 'Открыто'
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.passenger_window == '0'
         return False
 
 
@@ -290,6 +301,7 @@ class ZeekrDriverRearWindowSensor(ZeekrBaseBinarySensor):
     _attr_name = "Окно ЗЛ"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:window-closed"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "driver_rear_window"
@@ -297,10 +309,9 @@ class ZeekrDriverRearWindowSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if window is open"""
-        parser = self._get_parser()
-        if parser:
-            windows = parser.get_windows_info()
-            return windows['driver_rear_window'] == 'Открыто'
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.driver_rear_window == '0'
         return False
 
 
@@ -310,6 +321,7 @@ class ZeekrPassengerRearWindowSensor(ZeekrBaseBinarySensor):
     _attr_name = "Окно ЗП"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
     _attr_icon = "mdi:window-closed"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "passenger_rear_window"
@@ -317,10 +329,9 @@ class ZeekrPassengerRearWindowSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if window is open"""
-        parser = self._get_parser()
-        if parser:
-            windows = parser.get_windows_info()
-            return windows['passenger_rear_window'] == 'Открыто'
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.passenger_rear_window == '0'
         return False
 
 
@@ -332,6 +343,7 @@ class ZeekrFrontShadeOpenSensor(ZeekrBaseBinarySensor):
     _attr_name = "Front Shade Open"
     _attr_icon = "mdi:window-shutter"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "front_shade_open"
@@ -339,10 +351,9 @@ class ZeekrFrontShadeOpenSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if front shade is open/transparent"""
-        parser = self._get_parser()
-        if parser:
-            roof = parser.get_panoramic_roof_status()
-            return roof['front_shade_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.front_shade_open
         return False
 
 
@@ -352,6 +363,7 @@ class ZeekrRearShadeOpenSensor(ZeekrBaseBinarySensor):
     _attr_name = "Rear Shade Open"
     _attr_icon = "mdi:window-shutter"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "rear_shade_open"
@@ -359,10 +371,9 @@ class ZeekrRearShadeOpenSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if rear shade is open/transparent"""
-        parser = self._get_parser()
-        if parser:
-            roof = parser.get_panoramic_roof_status()
-            return roof['rear_shade_open']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.rear_shade_open
         return False
 
 
@@ -372,6 +383,7 @@ class ZeekrRoofTransparentSensor(ZeekrBaseBinarySensor):
     _attr_name = "Roof Transparent"
     _attr_icon = "mdi:window"
     _attr_device_class = BinarySensorDeviceClass.WINDOW
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "roof_transparent"
@@ -379,10 +391,9 @@ class ZeekrRoofTransparentSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if roof is transparent (lots of light)"""
-        parser = self._get_parser()
-        if parser:
-            roof = parser.get_panoramic_roof_status()
-            return roof['is_transparent']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.is_transparent
         return False
 
 # ========== GPS И НАВИГАЦИЯ ====================
@@ -392,6 +403,7 @@ class ZeekrGpsActiveSensor(ZeekrBaseBinarySensor):
 
     _attr_name = "GPS Active"
     _attr_icon = "mdi:satellite-variant"
+    _data_paths = (PATH_POSITION,)
 
     def _get_sensor_type(self) -> str:
         return "gps_active"
@@ -399,10 +411,9 @@ class ZeekrGpsActiveSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if GPS is active"""
-        parser = self._get_parser()
-        if parser:
-            gps = parser.get_gps_status()
-            return gps['has_gps_signal']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.has_gps_signal
         return False
 
 
@@ -413,6 +424,7 @@ class ZeekrBrakingSensor(ZeekrBaseBinarySensor):
 
     _attr_name = "Braking"
     _attr_icon = "mdi:brake-fluid"
+    _data_paths = (PATH_RUNNING,)
 
     def _get_sensor_type(self) -> str:
         return "braking"
@@ -420,10 +432,9 @@ class ZeekrBrakingSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if vehicle is braking"""
-        parser = self._get_parser()
-        if parser:
-            brake = parser.get_brake_status()
-            return brake['is_braking']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.stop_lights
         return False
 
 
@@ -432,6 +443,7 @@ class ZeekrEnergyRecoveryActiveSensor(ZeekrBaseBinarySensor):
 
     _attr_name = "Energy Recovery Active"
     _attr_icon = "mdi:lightning-bolt"
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_EV)
 
     def _get_sensor_type(self) -> str:
         return "energy_recovery_active"
@@ -439,8 +451,37 @@ class ZeekrEnergyRecoveryActiveSensor(ZeekrBaseBinarySensor):
     @property
     def is_on(self) -> bool:
         """Return True if energy recovery is active"""
-        parser = self._get_parser()
-        if parser:
-            recovery = parser.estimate_battery_recovery()
-            return recovery['is_recovering']
-        return False
\ No newline at end of file
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.is_recovering
+        return False
+
+
+# ========== ДИАГНОСТИКА ====================
+
+class ZeekrDataStaleSensor(ZeekrBaseBinarySensor):
+    """Показываются последние известные данные, а не живые?"""
+
+    _attr_name = "Stale Data"
+    _attr_icon = "mdi:database-clock"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def _get_sensor_type(self) -> str:
+        return "stale_data"
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if values come from cache or a failed update"""
+        return self.coordinator.is_stale
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return when the shown data was received"""
+        fetched_at = self.coordinator.data_fetched_at
+        return {
+            "Получено": (
+                datetime.fromtimestamp(fetched_at).strftime('%Y-%m-%d %H:%M:%S')
+                if fetched_at else None
+            ),
+            "Из кэша": self.coordinator.restored,
+        }
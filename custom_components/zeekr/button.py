@@ -8,13 +8,14 @@ from homeassistant.components.button import (
     ButtonEntity,
     ButtonDeviceClass,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import ZeekrDataCoordinator
+from .coordinator import ZeekrAccountCoordinator, ZeekrVehicleCoordinator
+from .entity import ZeekrStateChangeMixin
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,15 +27,15 @@ async def async_setup_entry(
 ) -> None:
     """Set up Zeekr buttons"""
 
-    coordinator: ZeekrDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account: ZeekrAccountCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
 
     # 🎯 ВСЕГДА добавляем глобальную кнопку
-    entities.append(ZeekrRefreshButton(coordinator))
+    entities.append(ZeekrRefreshButton(account))
 
-    # 🎯 Добавляем кнопку для каждой машины
-    for vin in coordinator.data.keys():
+    # 🎯 Добавляем кнопку для каждой машины (обновляет только ее координатор)
+    for vin, coordinator in account.vehicles.items():
         if vin:  # Проверяем что VIN не пустой
             entities.append(ZeekrRefreshVehicleButton(coordinator, vin))
 
@@ -43,7 +44,7 @@ async def async_setup_entry(
     _LOGGER.info(f"✅ Added {len(entities)} buttons")
 
 
-class ZeekrRefreshButton(CoordinatorEntity, ButtonEntity):
+class ZeekrRefreshButton(ZeekrStateChangeMixin, CoordinatorEntity, ButtonEntity):
     """Global refresh button for all vehicles"""
 
     _attr_name = "Refresh All Vehicles"
@@ -51,7 +52,7 @@ class ZeekrRefreshButton(CoordinatorEntity, ButtonEntity):
     _attr_device_class = ButtonDeviceClass.RESTART
     _attr_has_entity_name = False
 
-    def __init__(self, coordinator: ZeekrDataCoordinator):
+    def __init__(self, coordinator: ZeekrAccountCoordinator):
         """Initialize button"""
         super().__init__(coordinator)
         self.coordinator = coordinator
@@ -72,14 +73,14 @@ class ZeekrRefreshButton(CoordinatorEntity, ButtonEntity):
         _LOGGER.info("🔄 [REFRESH] Принудительное обновление всех автомобилей...")
 
         try:
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_refresh_vehicles()
             _LOGGER.info("✅ [REFRESH] Обновление завершено успешно!")
         except Exception as e:
             _LOGGER.error(f"❌ [REFRESH] Ошибка при обновлении: {e}")
             raise
 
 
-class ZeekrRefreshVehicleButton(CoordinatorEntity, ButtonEntity):
+class ZeekrRefreshVehicleButton(ZeekrStateChangeMixin, CoordinatorEntity, ButtonEntity):
     """Refresh button for individual vehicle"""
 
     _attr_icon = "mdi:refresh"
@@ -87,7 +88,7 @@ class ZeekrRefreshVehicleButton(CoordinatorEntity, ButtonEntity):
     _attr_has_entity_name = True
     _attr_name = "Refresh"
 
-    def __init__(self, coordinator: ZeekrDataCoordinator, vin: str):
+    def __init__(self, coordinator: ZeekrVehicleCoordinator, vin: str):
         """Initialize button"""
         super().__init__(coordinator)
         self.coordinator = coordinator
@@ -113,9 +114,4 @@ class ZeekrRefreshVehicleButton(CoordinatorEntity, ButtonEntity):
             _LOGGER.info(f"✅ [REFRESH] Обновление для {self.vin} завершено!")
         except Exception as e:
             _LOGGER.error(f"❌ [REFRESH] Ошибка при обновлении {self.vin}: {e}")
-            raise
-
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from coordinator"""
-        self.async_write_ha_state()
\ No newline at end of file
+            raise
\ No newline at end of file
@@ -9,10 +9,18 @@ from typing import Any, Dict, Optional
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 
-from .const import DOMAIN, CONF_MOBILE, CONF_SMS_CODE
+from .const import (
+    DOMAIN, CONF_MOBILE, CONF_SMS_CODE, CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_SCAN_INTERVAL, CONF_DC_CHARGING_SCAN_INTERVAL, CONF_DRIVING_SCAN_INTERVAL,
+    CONF_PARKED_SCAN_INTERVAL, CONF_PARKED_AFTER_HOURS, CONF_DEBUG_LOG_SAMPLE_RATE,
+    CONF_ARCHIVE_RESPONSES, CONF_RECORD_HISTORY, CONF_PROFILE_CYCLES, CONF_TOKEN_REFRESH,
+    DEFAULT_SCAN_INTERVAL, DEFAULT_DC_CHARGING_SCAN_INTERVAL, DEFAULT_DRIVING_SCAN_INTERVAL,
+    DEFAULT_PARKED_SCAN_INTERVAL, DEFAULT_PARKED_AFTER_HOURS,
+)
+from .zeekr_config import MAX_CONCURRENT_REQUESTS, DEBUG_LOG_SAMPLE_RATE
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,6 +35,14 @@ class ZeekrConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self.mobile = None
         self.auth = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> "ZeekrOptionsFlow":
+        """Get the options flow for this handler."""
+        return ZeekrOptionsFlow()
+
     async def async_step_user(
         self, user_input: Optional[Dict[str, Any]] = None
     ) -> FlowResult:
@@ -179,4 +195,69 @@ class ZeekrConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return self.async_show_form(
             step_id="sms_code",
             data_schema=vol.Schema({vol.Required(CONF_SMS_CODE): str}),
-        )
\ No newline at end of file
+        )
+
+
+class ZeekrOptionsFlow(config_entries.OptionsFlow):
+    """Options flow for Zeekr integration (entry - свойство config_entry из HA)"""
+
+    async def async_step_init(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Optional(
+                    CONF_MAX_CONCURRENT_REQUESTS,
+                    default=options.get(CONF_MAX_CONCURRENT_REQUESTS, MAX_CONCURRENT_REQUESTS),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                vol.Optional(
+                    CONF_SCAN_INTERVAL,
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_DC_CHARGING_SCAN_INTERVAL,
+                    default=options.get(
+                        CONF_DC_CHARGING_SCAN_INTERVAL, DEFAULT_DC_CHARGING_SCAN_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_DRIVING_SCAN_INTERVAL,
+                    default=options.get(CONF_DRIVING_SCAN_INTERVAL, DEFAULT_DRIVING_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=3600)),
+                vol.Optional(
+                    CONF_PARKED_SCAN_INTERVAL,
+                    default=options.get(CONF_PARKED_SCAN_INTERVAL, DEFAULT_PARKED_SCAN_INTERVAL),
+                ): vol.All(vol.Coerce(int), vol.Range(min=10, max=86400)),
+                vol.Optional(
+                    CONF_PARKED_AFTER_HOURS,
+                    default=options.get(CONF_PARKED_AFTER_HOURS, DEFAULT_PARKED_AFTER_HOURS),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=168)),
+                vol.Optional(
+                    CONF_DEBUG_LOG_SAMPLE_RATE,
+                    default=options.get(CONF_DEBUG_LOG_SAMPLE_RATE, DEBUG_LOG_SAMPLE_RATE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1000)),
+                vol.Optional(
+                    CONF_ARCHIVE_RESPONSES,
+                    default=options.get(CONF_ARCHIVE_RESPONSES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_RECORD_HISTORY,
+                    default=options.get(CONF_RECORD_HISTORY, False),
+                ): bool,
+                vol.Optional(
+                    CONF_PROFILE_CYCLES,
+                    default=options.get(CONF_PROFILE_CYCLES, False),
+                ): bool,
+                vol.Optional(
+                    CONF_TOKEN_REFRESH,
+                    default=options.get(CONF_TOKEN_REFRESH, False),
+                ): bool,
+            }),
+        )
@@ -10,6 +10,36 @@ CONF_SMS_CODE = "sms_code"
 
 DEFAULT_SCAN_INTERVAL = 60  # 1 минута
 
+# Адаптивный опрос (секунды)
+DEFAULT_DC_CHARGING_SCAN_INTERVAL = 15  # Быстрая зарядка
+DEFAULT_DRIVING_SCAN_INTERVAL = 30  # Машина едет
+DEFAULT_PARKED_SCAN_INTERVAL = 600  # Долгая стоянка
+DEFAULT_PARKED_AFTER_HOURS = 3  # Через сколько часов стоянки переходить на редкий опрос
+MAX_BACKOFF_INTERVAL = 1800  # Предел интервала при подряд идущих ошибках
+VEHICLE_LIST_CACHE_TTL = 6 * 3600  # Список VIN перезапрашивается раз в 6 часов
+
+# Хранилище (.storage)
+STORAGE_VERSION = 1
+STATE_CACHE_SAVE_DELAY = 60  # Последние статусы пишутся на диск не чаще раза в минуту
+STALE_DATA_MAX_AGE = 24 * 3600  # Сколько показывать последние известные данные без связи
+
+# Опции
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_SCAN_INTERVAL = "scan_interval"
+CONF_DC_CHARGING_SCAN_INTERVAL = "dc_charging_scan_interval"
+CONF_DRIVING_SCAN_INTERVAL = "driving_scan_interval"
+CONF_PARKED_SCAN_INTERVAL = "parked_scan_interval"
+CONF_PARKED_AFTER_HOURS = "parked_after_hours"
+CONF_DEBUG_LOG_SAMPLE_RATE = "debug_log_sample_rate"
+CONF_ARCHIVE_RESPONSES = "archive_responses"
+CONF_RECORD_HISTORY = "record_history"
+CONF_PROFILE_CYCLES = "profile_cycles"
+CONF_TOKEN_REFRESH = "token_refresh"  # Обновлять accessToken по refreshToken (экспериментально, см. zeekr_config)
+
+# Профилирование циклов обновления (сервис dump_profile)
+PROFILE_MAX_CYCLES = 500  # Сколько последних циклов хранить
+PROFILE_DUMP_FILE = "zeekr_profile.json"  # Куда сервис пишет выгрузку (в конфигурации HA)
+
 # Атрибуты
 ATTR_VIN = "vin"
 ATTR_LATITUDE = "latitude"
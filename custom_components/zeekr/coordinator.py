@@ -1,14 +1,17 @@
 # custom_components/zeekr/coordinator.py
 """Data Coordinator для Zeekr интеграции"""
 
-import logging
+import asyncio
+import contextvars
 import sys
 import os
-import json
+import time
 from datetime import timedelta, datetime
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Mapping, Optional, Set, Tuple
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 # Добавляем путь для импорта
@@ -17,122 +20,568 @@ if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 # Импортируем после добавления пути
-from const import DOMAIN, DEFAULT_SCAN_INTERVAL
+from const import (
+    DOMAIN, DEFAULT_SCAN_INTERVAL, VEHICLE_LIST_CACHE_TTL, STORAGE_VERSION, MAX_BACKOFF_INTERVAL,
+    STATE_CACHE_SAVE_DELAY, STALE_DATA_MAX_AGE,
+    DEFAULT_DC_CHARGING_SCAN_INTERVAL, DEFAULT_DRIVING_SCAN_INTERVAL,
+    DEFAULT_PARKED_SCAN_INTERVAL, DEFAULT_PARKED_AFTER_HOURS,
+    CONF_SCAN_INTERVAL, CONF_DC_CHARGING_SCAN_INTERVAL, CONF_DRIVING_SCAN_INTERVAL,
+    CONF_PARKED_SCAN_INTERVAL, CONF_PARKED_AFTER_HOURS,
+)
+from .status_diff import changed_paths, path_prefixes
+from .vehicle_parser import VehicleSnapshot
+from .zeekr_archive import ResponseArchive
+from .zeekr_history import HistoryStore
+from .zeekr_writer import BatchedWriter
+from .zeekr_profiler import NULL_PHASE, CycleProfiler, ProfiledCycle
+from .zeekr_retry import ZeekrCircuitOpenError
+from .zeekr_config import TOKEN_REFRESH_RETRY_DELAY
+from .zeekr_logging import get_logger
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 
-class ZeekrDataCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Zeekr data from API"""
+class ZeekrPollingScheduler:
+    """Выбирает интервал следующего опроса по состоянию автомобиля"""
 
-    def __init__(self, hass: HomeAssistant, api_client, responses_dir: str = None):
+    def __init__(
+            self,
+            default_interval: int = DEFAULT_SCAN_INTERVAL,
+            dc_charging_interval: int = DEFAULT_DC_CHARGING_SCAN_INTERVAL,
+            driving_interval: int = DEFAULT_DRIVING_SCAN_INTERVAL,
+            parked_interval: int = DEFAULT_PARKED_SCAN_INTERVAL,
+            parked_after_hours: float = DEFAULT_PARKED_AFTER_HOURS,
+    ):
+        """
+        Args:
+            default_interval: Обычный интервал (стоит недавно, AC зарядка и т.п.)
+            dc_charging_interval: Интервал во время быстрой зарядки
+            driving_interval: Интервал во время движения
+            parked_interval: Интервал после долгой стоянки
+            parked_after_hours: Сколько часов стоянки считается долгой
+        """
+        self.default_interval = default_interval
+        self.dc_charging_interval = dc_charging_interval
+        self.driving_interval = driving_interval
+        self.parked_interval = parked_interval
+        self.parked_after_seconds = int(parked_after_hours * 3600)
+
+    @classmethod
+    def from_options(cls, options: Mapping[str, Any]) -> "ZeekrPollingScheduler":
+        """Создает планировщик из опций config entry"""
+        return cls(
+            default_interval=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            dc_charging_interval=options.get(
+                CONF_DC_CHARGING_SCAN_INTERVAL, DEFAULT_DC_CHARGING_SCAN_INTERVAL
+            ),
+            driving_interval=options.get(CONF_DRIVING_SCAN_INTERVAL, DEFAULT_DRIVING_SCAN_INTERVAL),
+            parked_interval=options.get(CONF_PARKED_SCAN_INTERVAL, DEFAULT_PARKED_SCAN_INTERVAL),
+            parked_after_hours=options.get(CONF_PARKED_AFTER_HOURS, DEFAULT_PARKED_AFTER_HOURS),
+        )
+
+    def interval_for(self, snapshot: VehicleSnapshot) -> int:
+        """Интервал (секунды) для одного автомобиля"""
+        if snapshot.is_dc_charging:
+            return self.dc_charging_interval
+
+        if snapshot.is_moving:
+            return self.driving_interval
+
+        park = snapshot.park_info()
+        if park['is_parked'] and park['total_seconds'] >= self.parked_after_seconds:
+            return self.parked_interval
+
+        return self.default_interval
+
+
+# (координатор, цикл) обновления, идущего в текущей задаче
+_CURRENT_CYCLE: contextvars.ContextVar[Optional[Tuple[Any, ProfiledCycle]]] = contextvars.ContextVar(
+    'zeekr_profiled_cycle', default=None
+)
+
+
+class ZeekrProfilingMixin:
+    """
+    Запись фаз цикла обновления в CycleProfiler аккаунта (см. zeekr_profiler.py)
+
+    Цикл - один вызов DataUpdateCoordinator._async_refresh: запрос, разбор и
+    оповещение слушателей. Без профилировщика фазы - пустой контекст.
+    Должен стоять в списке базовых классов перед DataUpdateCoordinator.
+
+    Текущий цикл хранится в контекстной переменной, а не в атрибуте:
+    пересекающиеся обновления одного координатора (таймер, кнопка, сервис)
+    идут в разных задачах и пишут каждое в свой цикл. Вместе с циклом
+    хранится его координатор - дочерние задачи (gather координаторов машин
+    внутри обновления аккаунта) наследуют контекст, но чужой цикл не трогают.
+    """
+
+    _cycle_kind = 'cycle'
+
+    @property
+    def profiler(self) -> Optional[CycleProfiler]:
+        """Override in subclasses"""
+        return None
+
+    def _current_cycle(self) -> Optional[ProfiledCycle]:
+        """Профилируемый цикл этого координатора в текущей задаче"""
+        current = _CURRENT_CYCLE.get()
+        return current[1] if current is not None and current[0] is self else None
+
+    def _profile_phase(self, name: str):
+        """Контекст замера фазы текущего цикла"""
+        cycle = self._current_cycle()
+        return cycle.phase(name) if cycle is not None else NULL_PHASE
+
+    def _profile_count(self, name: str, value: int = 1) -> None:
+        """Счетчик текущего цикла"""
+        cycle = self._current_cycle()
+        if cycle is not None:
+            cycle.count(name, value)
+
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        profiler = self.profiler
+        if profiler is None:
+            await super()._async_refresh(*args, **kwargs)
+            return
+
+        cycle = profiler.start(self._cycle_kind, getattr(self, 'vin', None))
+        token = _CURRENT_CYCLE.set((self, cycle))
+        try:
+            await super()._async_refresh(*args, **kwargs)
+        finally:
+            _CURRENT_CYCLE.reset(token)
+            profiler.finish(cycle, self.last_update_success)
+
+
+class ZeekrAccountCoordinator(ZeekrProfilingMixin, DataUpdateCoordinator):
+    """
+    Координатор аккаунта: список VIN и общий API клиент
+
+    Данные координатора - список VIN. Статусы опрашивают отдельные
+    ZeekrVehicleCoordinator, по одному на автомобиль.
+    """
+
+    def __init__(self, hass: HomeAssistant, api_client,
+                 archive: Optional[ResponseArchive] = None,
+                 entry_id: Optional[str] = None,
+                 scheduler: Optional[ZeekrPollingScheduler] = None,
+                 archive_every_poll: bool = False,
+                 history: Optional[HistoryStore] = None,
+                 profiler: Optional[CycleProfiler] = None):
         """Initialize the coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=VEHICLE_LIST_CACHE_TTL),
         )
 
         self.api_client = api_client
-        self.responses_dir = responses_dir
+        self.archive = archive  # Архив ответов (None - сохранение отключено)
+        self.archive_every_poll = archive_every_poll
+        self.history = history  # История числовых полей (None - не записывается)
+        self.writer = BatchedWriter(hass.async_add_executor_job)  # Запись архива и истории (см. run())
+        self._profiler = profiler  # Профилирование циклов всех координаторов (None - выключено)
+        self.scheduler = scheduler or ZeekrPollingScheduler()
         self.last_response = None  # Сохраняем последний ответ
+        self.vehicles: Dict[str, "ZeekrVehicleCoordinator"] = {}  # Координаторы по VIN
+        self.applied_options: Dict[str, Any] = {}  # Опции entry, с которыми запущена интеграция
+        self._unsub_token_refresh: Optional[CALLBACK_TYPE] = None
+        self._refresh_vehicles_task: Optional[asyncio.Task] = None
 
-    async def _async_update_data(self) -> Dict[str, Any]:
-        """Fetch data from Zeekr API."""
+        # Кэш списка VIN (переживает перезапуск через .storage)
+        self._vehicle_store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id or 'default'}.vehicles"
+        )
+        self._vins: Optional[List[str]] = None
+        self._vins_fetched_at = 0.0  # time.time() последнего получения списка
+
+        # Последние успешные статусы по VIN - сущности поднимаются с ними сразу при старте
+        self._state_store = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id or 'default'}.state"
+        )
+        self._cached_states: Dict[str, Dict[str, Any]] = {}
+
+    _cycle_kind = 'account'
+
+    @property
+    def profiler(self) -> Optional[CycleProfiler]:
+        return self._profiler
+
+    async def async_load_vehicle_cache(self) -> None:
+        """Загружает сохраненный список VIN, чтобы при старте не запрашивать его"""
         try:
-            _LOGGER.debug("Fetching Zeekr vehicle data")
+            stored = await self._vehicle_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load cached vehicle list: %s", err)
+            return
 
-            # Получаем список автомобилей
-            success, vehicles = await self.hass.async_add_executor_job(
-                self.api_client.get_vehicles
-            )
+        if stored and stored.get('vins'):
+            self._vins = list(stored['vins'])
+            self._vins_fetched_at = float(stored.get('fetched_at', 0))
+            _LOGGER.debug("Loaded cached vehicle list: %s", self._vins)
+
+    async def async_load_state_cache(self) -> None:
+        """Загружает последние известные статусы автомобилей"""
+        try:
+            stored = await self._state_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Failed to load cached vehicle states: %s", err)
+            return
 
-            if not success:
-                raise UpdateFailed("Failed to fetch vehicle list")
+        if stored:
+            self._cached_states = dict(stored.get('vehicles', {}))
+            _LOGGER.debug("Loaded cached states for %s", list(self._cached_states))
 
-            # Для каждого автомобиля получаем статус
-            vehicles_data = {}
-            for vin in vehicles:
-                success, status = await self.hass.async_add_executor_job(
-                    self.api_client.get_vehicle_status, vin
-                )
+    @callback
+    def async_schedule_state_save(self) -> None:
+        """Сохраняет последние статусы с задержкой (несколько изменений - одна запись)"""
+        self._state_store.async_delay_save(self._state_cache_data, STATE_CACHE_SAVE_DELAY)
 
-                if success and status:
-                    vehicles_data[vin] = status
+    @callback
+    def _state_cache_data(self) -> Dict[str, Any]:
+        return {
+            'vehicles': {
+                vin: {'status': coordinator.data, 'fetched_at': coordinator.data_fetched_at}
+                for vin, coordinator in self.vehicles.items()
+                if coordinator.data is not None
+            }
+        }
 
-                    # 🔥 АСИНХРОННО сохраняем ответ в файл JSON
-                    # await self._async_save_response_to_file(vin, status)
-                else:
-                    _LOGGER.warning(f"Failed to fetch status for {vin}")
+    async def _async_update_data(self) -> List[str]:
+        """Возвращает список VIN из кэша или запрашивает его у шлюза"""
+        cache_age = time.time() - self._vins_fetched_at
+        if self._vins and 0 <= cache_age < VEHICLE_LIST_CACHE_TTL:
+            self._profile_count('vin_list_cached')
+            return self._vins
 
-            if not vehicles_data:
-                raise UpdateFailed("No vehicle data received")
+        try:
+            with self._profile_phase('vin_list'):
+                success, vehicles = await self.api_client.async_get_vehicles()
+        except ZeekrCircuitOpenError as err:
+            _LOGGER.debug("Vehicle list request skipped: %s", err)
+            success, vehicles = False, None
 
-            _LOGGER.debug(f"Successfully fetched data for {len(vehicles_data)} vehicles")
+        if not success:
+            if self._vins:
+                _LOGGER.warning("Failed to refresh vehicle list, using cached one")
+                return self._vins
+            raise UpdateFailed("Failed to fetch vehicle list")
 
-            return vehicles_data
+        self._vins = vehicles
+        self._vins_fetched_at = time.time()
 
+        try:
+            await self._vehicle_store.async_save(
+                {'vins': vehicles, 'fetched_at': self._vins_fetched_at}
+            )
         except Exception as err:
-            _LOGGER.error(f"Error fetching Zeekr data: {err}")
-            raise UpdateFailed(f"Error communicating with Zeekr API: {err}")
+            _LOGGER.warning("Failed to persist vehicle list: %s", err)
+
+        return vehicles
+
+    def create_vehicle_coordinators(self) -> None:
+        """Создает координаторы для всех известных VIN (с сохраненным статусом, если есть)"""
+        for vin in self.data or []:
+            if vin and vin not in self.vehicles:
+                coordinator = ZeekrVehicleCoordinator(self.hass, self, vin)
+                cached = self._cached_states.pop(vin, None)
+                if cached and cached.get('status'):
+                    coordinator.restore_cached_state(cached['status'], cached.get('fetched_at'))
+                self.vehicles[vin] = coordinator
+
+    async def async_refresh_vehicles(self) -> None:
+        """
+        Обновляет все автомобили параллельно
 
-    async def _async_save_response_to_file(self, vin: str, data: Dict) -> None:
+        Вызов во время уже идущего обновления (кнопка, сервис refresh_and_save)
+        присоединяется к нему, а не запускает второе.
         """
-        ⭐ АСИНХРОННО сохраняет ответ сервера в JSON файл
+        task = self._refresh_vehicles_task
+        if task is None or task.done():
+            task = self._refresh_vehicles_task = self.hass.async_create_task(
+                self._async_refresh_all_vehicles()
+            )
+        else:
+            _LOGGER.debug("Joining in-flight refresh of all vehicles")
+        await asyncio.shield(task)
 
-        Использует executor чтобы не блокировать event loop!
+    async def _async_refresh_all_vehicles(self) -> None:
+        await self.async_refresh_coordinators(list(self.vehicles.values()))
 
-        Args:
-            vin: VIN номер автомобиля
-            data: Данные ответа от сервера
+    async def async_refresh_coordinators(self, coordinators: List["ZeekrVehicleCoordinator"]) -> None:
+        """Обновляет указанные автомобили параллельно"""
+        await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+
+    @callback
+    def async_schedule_token_refresh(self, delay: Optional[float] = None) -> None:
         """
-        if not self.responses_dir:
+        Планирует фоновое обновление accessToken незадолго до истечения
+
+        Вызывается при старте и после каждого обновления токена. Если срок
+        действия неизвестен, остается только обновление по отказу авторизации.
+        """
+        self.async_cancel_token_refresh()
+
+        tokens = self.api_client.tokens
+        if delay is None:
+            delay = tokens.seconds_until_refresh()
+        if delay is None or not tokens.can_refresh:
             return
 
-        try:
-            # ⭐ АСИНХРОННАЯ операция с помощью executor
-            await self.hass.async_add_executor_job(
-                self._save_response_sync,
-                vin,
-                data
-            )
+        _LOGGER.debug("Access token refresh scheduled in %.0fs", delay)
+        self._unsub_token_refresh = async_call_later(
+            self.hass, delay, self._async_scheduled_token_refresh
+        )
 
-            self.last_response = data
-            _LOGGER.debug(f"✅ Response auto-saved for {vin}")
+    @callback
+    def async_cancel_token_refresh(self) -> None:
+        """Отменяет запланированное обновление токена"""
+        if self._unsub_token_refresh is not None:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
 
-        except Exception as e:
-            _LOGGER.error(f"❌ Failed to save response: {e}", exc_info=True)
+    async def _async_scheduled_token_refresh(self, _now: datetime) -> None:
+        """Обновляет токен в фоне, не дожидаясь отказа в очередном опросе"""
+        self._unsub_token_refresh = None
+        # При успехе новое расписание ставит слушатель токенов (см. __init__.py)
+        tokens = self.api_client.tokens
+        if not await tokens.async_refresh():
+            self.async_schedule_token_refresh(max(tokens.seconds_until_retry(), TOKEN_REFRESH_RETRY_DELAY))
 
-    def _save_response_sync(self, vin: str, data: Dict) -> None:
+    @callback
+    def async_archive_response(self, vin: str, data: Dict, description: Optional[str] = None,
+                               auto_save: bool = False) -> bool:
         """
-        Синхронная функция для сохранения файла
-        (выполняется в отдельном потоке через executor)
+        Ставит ответ сервера в очередь архива (сжатый JSONL, см. zeekr_archive.py)
+
+        Записи при опросе пишутся фоновым сбросом writer, ручные сервисы
+        дожидаются writer.flush().
 
         Args:
             vin: VIN номер автомобиля
             data: Данные ответа от сервера
+            description: Описание записи (для ручного сохранения)
+            auto_save: Запись сделана автоматически при опросе
+
+        Returns:
+            True если запись принята
         """
+        if self.archive is None:
+            return False
+
+        record = {
+            "_metadata": {
+                "saved_at": datetime.now().isoformat(),
+                "vin": vin,
+                "auto_save": auto_save,
+            },
+            "data": data,
+        }
+        if description:
+            record["_metadata"]["description"] = description
+
+        # Сжатие и запись - пачкой в executor, чтобы не блокировать event loop
+        self.writer.submit(self.archive.append_many, record)
+        _LOGGER.debug("✅ Response queued for archive: %s", vin)
+        return True
+
+    @callback
+    def async_record_history(self, vin: str, snapshot: VehicleSnapshot, fetched_at: float) -> None:
+        """Ставит числовые поля снимка в очередь истории (zeekr_history.py)"""
+        if self.history is not None:
+            self.writer.submit(self.history.append_many, (vin, snapshot, fetched_at))
+
+    async def async_close_storage(self) -> None:
+        """Сбрасывает очередь записи и закрывает текущий сегмент архива"""
+        await self.writer.flush()
+        if self.archive is not None:
+            await self.hass.async_add_executor_job(self.archive.close)
+
+
+class ZeekrVehicleCoordinator(ZeekrProfilingMixin, DataUpdateCoordinator):
+    """
+    Координатор одного автомобиля
+
+    Свой интервал (по ZeekrPollingScheduler), свой backoff при ошибках и своя
+    доступность - медленная или недоступная машина не задерживает остальные.
+    """
+
+    def __init__(self, hass: HomeAssistant, account: ZeekrAccountCoordinator, vin: str):
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{vin}",
+            update_interval=timedelta(seconds=account.scheduler.default_interval),
+        )
+
+        self.account = account
+        self.vin = vin
+        self.snapshot: Optional[VehicleSnapshot] = None  # Разобранные данные
+        self.data_fetched_at: Optional[float] = None  # time.time() получения data
+        self.restored = False  # data взяты из кэша и еще не подтверждены шлюзом
+        self._failures = 0  # Подряд неудачных обновлений
+
+        # Изменившиеся JSON пути (с предками) за последний цикл; None - "изменилось все"
+        self.changed_paths: Optional[Set[str]] = None
+        # Индекс слушателей: (без подписки на пути, {путь: [слушатели]})
+        self._path_index: Optional[Tuple[List[CALLBACK_TYPE], Dict[str, List[CALLBACK_TYPE]]]] = None
+
+    _cycle_kind = 'vehicle'
+
+    @property
+    def api_client(self):
+        """Общий API клиент аккаунта"""
+        return self.account.api_client
+
+    @property
+    def profiler(self) -> Optional[CycleProfiler]:
+        return self.account.profiler
+
+    @property
+    def is_stale(self) -> bool:
+        """Показываются не живые данные: из кэша или после неудачного обновления"""
+        return self.data is not None and (self.restored or not self.last_update_success)
+
+    @property
+    def has_recent_data(self) -> bool:
+        """Есть данные не старше STALE_DATA_MAX_AGE - их можно показывать при сбоях"""
+        return (
+            self.data_fetched_at is not None
+            and time.time() - self.data_fetched_at < STALE_DATA_MAX_AGE
+        )
+
+    def restore_cached_state(self, status: Dict[str, Any], fetched_at: Optional[float]) -> None:
+        """Подставляет сохраненный статус до первого ответа шлюза"""
         try:
-            # Имя файла с датой и временем
-            filename = f"zeekr_{vin}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            filepath = os.path.join(self.responses_dir, filename)
-
-            # Упаковываем ответ с метаданными
-            response_with_metadata = {
-                "_metadata": {
-                    "saved_at": datetime.now().isoformat(),
-                    "vin": vin,
-                    "auto_save": True
-                },
-                "data": data
-            }
+            self.snapshot = VehicleSnapshot.from_status(status)
+        except Exception as err:
+            _LOGGER.warning("[%s] Ignoring unreadable cached state: %s", self.vin, err)
+            return
+
+        self.data = status
+        self.data_fetched_at = fetched_at
+        self.restored = True
+
+    @callback
+    def async_add_listener(
+            self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """
+        Listen for data updates
+
+        context - кортеж JSON путей vehicleStatus, от которых зависит слушатель
+        (CoordinatorEntity передает сюда coordinator_context). Без context
+        слушатель вызывается на каждое обновление.
+        """
+        self._path_index = None
+        remove = super().async_add_listener(update_callback, context)
+
+        @callback
+        def remove_listener() -> None:
+            self._path_index = None
+            remove()
+
+        return remove_listener
+
+    def _get_path_index(self) -> Tuple[List[CALLBACK_TYPE], Dict[str, List[CALLBACK_TYPE]]]:
+        """Строит (и кэширует) индекс слушателей по JSON путям"""
+        if self._path_index is None:
+            unconditional: List[CALLBACK_TYPE] = []
+            by_path: Dict[str, List[CALLBACK_TYPE]] = {}
+            for update_callback, context in self._listeners.values():
+                if not context:
+                    unconditional.append(update_callback)
+                    continue
+                for path in context:
+                    by_path.setdefault(path, []).append(update_callback)
+            self._path_index = (unconditional, by_path)
+        return self._path_index
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Вызывает только слушателей, чьи пути изменились в последнем ответе"""
+        with self._profile_phase('listeners'):
+            if self.changed_paths is None:
+                self._profile_count('listeners', len(self._listeners))
+                super().async_update_listeners()
+                return
+
+            unconditional, by_path = self._get_path_index()
+            callbacks = dict.fromkeys(unconditional)
+            for path in self.changed_paths:
+                for update_callback in by_path.get(path, ()):
+                    callbacks[update_callback] = None
 
-            # Сохраняем в файл
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(response_with_metadata, f, ensure_ascii=False, indent=2)
+            self._profile_count('listeners', len(callbacks))
+            for update_callback in list(callbacks):
+                update_callback()
+
+    async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch vehicle status from Zeekr API."""
+        # После ошибки (смена доступности) оповещаем всех слушателей
+        previous = self.data if self.last_update_success else None
+        self.changed_paths = None
+
+        try:
+            with self._profile_phase('fetch'):
+                success, status = await self.api_client.async_get_vehicle_status(self.vin)
+        except ZeekrCircuitOpenError as err:
+            # Шлюз недоступен - не опрашиваем раньше пробного запроса
+            _LOGGER.debug("[%s] Status request skipped: %s", self.vin, err)
+            self._backoff(min_interval=err.retry_in)
+            raise UpdateFailed(str(err)) from err
+        except Exception as err:
+            _LOGGER.error("Error fetching Zeekr data for %s: %s", self.vin, err)
+            success, status = False, None
+
+        if not success or not status:
+            self._backoff()
+            # VIN уже в имени координатора - в тексте ошибки (она попадает в диагностику) его нет
+            raise UpdateFailed("Failed to fetch vehicle status")
+
+        try:
+            # Разбираем ответ один раз - сущности читают готовый снимок
+            with self._profile_phase('parse'):
+                snapshot = VehicleSnapshot.from_status(status)
+        except Exception as err:
+            _LOGGER.error("Failed to parse status for %s: %s", self.vin, err, exc_info=True)
+            self._backoff()
+            # Текст исключения может содержать значения из ответа - в диагностику идет постоянное сообщение
+            raise UpdateFailed("Failed to parse vehicle status") from err
+
+        self.snapshot = snapshot
+        self.account.last_response = status
+        if previous is not None:
+            with self._profile_phase('diff'):
+                self.changed_paths = path_prefixes(changed_paths(previous, status))
+        self.data_fetched_at = time.time()
+        self.restored = False
+        self._failures = 0
+
+        with self._profile_phase('storage'):
+            if self.changed_paths is None or self.changed_paths:
+                self.account.async_schedule_state_save()
+            if self.account.archive_every_poll:
+                self.account.async_archive_response(self.vin, status, auto_save=True)
+            self.account.async_record_history(self.vin, snapshot, self.data_fetched_at)
+
+        # Подбираем интервал следующего опроса по состоянию машины
+        next_interval = timedelta(seconds=self.account.scheduler.interval_for(snapshot))
+        if next_interval != self.update_interval:
+            _LOGGER.debug(
+                "[%s] Polling interval changed: %s -> %s", self.vin, self.update_interval, next_interval
+            )
+            self.update_interval = next_interval
 
-            _LOGGER.debug(f"✅ Response saved: {filepath}")
+        return status
 
-        except Exception as e:
-            _LOGGER.error(f"❌ Failed to save response: {e}", exc_info=True)
\ No newline at end of file
+    def _backoff(self, min_interval: float = 0) -> None:
+        """Увеличивает интервал после подряд идущих ошибок"""
+        self._failures += 1
+        interval = max(min(
+            self.account.scheduler.default_interval * 2 ** self._failures,
+            MAX_BACKOFF_INTERVAL,
+        ), min_interval)
+        self.update_interval = timedelta(seconds=interval)
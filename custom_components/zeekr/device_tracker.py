@@ -8,14 +8,15 @@ from homeassistant.components.device_tracker import (
     TrackerEntity,
     SourceType,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
-from .coordinator import ZeekrDataCoordinator
-from vehicle_parser import VehicleDataParser
+from .coordinator import ZeekrAccountCoordinator, ZeekrVehicleCoordinator
+from .entity import ZeekrStateChangeMixin
+from .vehicle_parser import PATH_POSITION, VehicleSnapshot
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,28 +28,29 @@ async def async_setup_entry(
 ) -> None:
     """Set up Zeekr device trackers"""
 
-    coordinator: ZeekrDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account: ZeekrAccountCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
 
     # Для каждого автомобиля создаем device tracker
-    for vin in coordinator.data.keys():  # ← ИЗМЕНЕНО
+    for vin, coordinator in account.vehicles.items():
         entities.append(ZeekrDeviceTracker(coordinator, vin))
 
     async_add_entities(entities)
 
 
-class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
+class ZeekrDeviceTracker(ZeekrStateChangeMixin, CoordinatorEntity, TrackerEntity):
     """Zeekr device tracker for vehicle location"""
 
     _attr_has_entity_name = True
     _attr_name = "Location"
     _attr_icon = "mdi:car-side"
     _attr_source_type = SourceType.GPS
+    _data_paths = (PATH_POSITION,)
 
-    def __init__(self, coordinator: ZeekrDataCoordinator, vin: str):
+    def __init__(self, coordinator: ZeekrVehicleCoordinator, vin: str):
         """Initialize device tracker"""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._data_paths)
         self.vin = vin
 
         # Уникальный ID
@@ -62,44 +64,39 @@ class ZeekrDeviceTracker(CoordinatorEntity, TrackerEntity):
             "model": "EV",
         }
 
-    def _get_parser(self) -> VehicleDataParser:
-        """Get parser for current vehicle data"""
-        if self.vin not in self.coordinator.data:
-            return None
-        from vehicle_parser import VehicleDataParser
-        return VehicleDataParser(self.coordinator.data[self.vin])
+    def _get_snapshot(self) -> VehicleSnapshot:
+        """Get parsed snapshot of current vehicle data (built once per update)"""
+        return self.coordinator.snapshot
 
     @property
     def latitude(self) -> float:
         """Return latitude"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
-            return position['latitude']/0.36
+        snapshot = self._get_snapshot()
+        if snapshot:
+            latitude = snapshot.latitude if snapshot.has_gps_signal else 0.0
+            return latitude/0.36
         return None
 
     @property
     def longitude(self) -> float:
         """Return longitude"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
-            return position['longitude']/0.36
+        snapshot = self._get_snapshot()
+        if snapshot:
+            longitude = snapshot.longitude if snapshot.has_gps_signal else 0.0
+            return longitude/0.36
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                "altitude": position['altitude'],
-                "direction": position['direction'],
+                "altitude": snapshot.altitude,
+                "direction": snapshot.heading,
             }
         return {}
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from coordinator"""
-        self.async_write_ha_state()
\ No newline at end of file
+    def _state_signature(self) -> tuple:
+        """Tracker state is its position"""
+        return (self.latitude, self.longitude)
\ No newline at end of file
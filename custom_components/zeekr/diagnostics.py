@@ -0,0 +1,69 @@
+# custom_components/zeekr/diagnostics.py
+"""Diagnostics support for Zeekr integration"""
+
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import ZeekrAccountCoordinator
+
+# Токены и идентификаторы аккаунта не попадают в выгрузку
+TO_REDACT = {
+    "mobile", "accessToken", "refreshToken", "userId", "clientId", "device_id",
+    "vin", "latitude", "longitude",
+}
+
+
+def _masked_vin(vin: str) -> str:
+    """VIN без первых знаков - машины различимы, но не опознаваемы"""
+    return f"***{vin[-4:]}" if vin else vin
+
+
+def _masked_error(error: Optional[BaseException], vins: Iterable[str]) -> Optional[str]:
+    """repr исключения с замаскированными VIN (текст ошибок шлюза может их содержать)"""
+    if error is None:
+        return None
+    text = repr(error)
+    for vin in vins:
+        if vin:
+            text = text.replace(vin, _masked_vin(vin))
+    return text
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry"""
+    account: ZeekrAccountCoordinator = hass.data[DOMAIN][entry.entry_id]
+    api = account.api_client
+    now = time.time()
+
+    vehicles = {}
+    for vin, vehicle in account.vehicles.items():
+        vehicles[_masked_vin(vin)] = {
+            "last_update_success": vehicle.last_update_success,
+            "last_exception": _masked_error(vehicle.last_exception, account.vehicles),
+            "update_interval": vehicle.update_interval.total_seconds() if vehicle.update_interval else None,
+            "data_age": round(now - vehicle.data_fetched_at, 1) if vehicle.data_fetched_at else None,
+            "restored": vehicle.restored,
+            "is_stale": vehicle.is_stale,
+        }
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "api": {
+            "base_url": api.base_url,
+            "max_concurrent_requests": api.max_concurrent_requests,
+            "circuit": {"state": api.circuit.state, "failures": api.circuit.failures},
+            "rate_limit_tokens": round(api.rate_limiter.available, 2),
+            "token_expires_in": round(api.tokens.expires_at - now) if api.tokens.expires_at else None,
+            "metrics": api.metrics.as_dict(),
+        },
+        "vehicles": vehicles,
+        "pending_writes": account.writer.pending,
+    }
@@ -0,0 +1,47 @@
+# custom_components/zeekr/entity.py
+"""Общие базовые классы сущностей Zeekr"""
+
+from typing import Any, Optional, Tuple
+
+from homeassistant.core import callback
+
+
+class ZeekrStateChangeMixin:
+    """
+    Пишет состояние в Home Assistant только если оно действительно изменилось
+
+    Сравнивает доступность, значение (_state_signature) и атрибуты с последними
+    записанными. Спящая машина отдает одинаковые данные каждый цикл - такие
+    обновления не порождают state_changed и не попадают в recorder.
+
+    Сущности с _data_paths вызываются координатором только при изменении
+    этих полей (см. ZeekrVehicleCoordinator.async_update_listeners).
+
+    Должен стоять в списке базовых классов перед CoordinatorEntity.
+    """
+
+    # JSON пути vehicleStatus, от которых зависит сущность (передаются координатору
+    # как coordinator_context). None - обновляться на каждый цикл
+    _data_paths: Optional[Tuple[str, ...]] = None
+    _last_written_state: Optional[Tuple[Any, ...]] = None
+
+    @property
+    def available(self) -> bool:
+        """Available while updates succeed or recent last-known data exists"""
+        # Последние известные данные (из кэша или до сбоя шлюза) показываем,
+        # пока они не старше STALE_DATA_MAX_AGE - дашборды не пустеют
+        return super().available or getattr(self.coordinator, 'has_recent_data', False)
+
+    def _state_signature(self) -> Tuple[Any, ...]:
+        """Override in subclasses: values that make up the entity state"""
+        return ()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from coordinator"""
+        state = (self.available, self._state_signature(), self.extra_state_attributes)
+        if state == self._last_written_state:
+            return
+
+        self._last_written_state = state
+        self.async_write_ha_state()
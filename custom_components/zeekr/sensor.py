@@ -3,7 +3,7 @@
 
 import logging
 from typing import Any, Dict
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -16,28 +16,49 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfSpeed,
     UnitOfPressure,
+    UnitOfInformation,
+    UnitOfTime,
     EntityCategory,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, ICON_BATTERY, ICON_TEMPERATURE, ICON_CAR
-from .coordinator import ZeekrDataCoordinator
-from .vehicle_parser import VehicleDataParser
+from .coordinator import ZeekrAccountCoordinator, ZeekrVehicleCoordinator
+from .entity import ZeekrStateChangeMixin
+from .vehicle_parser import (
+    PATH_BASIC,
+    PATH_CLIMATE,
+    PATH_CONFIGURATION,
+    PATH_DRIVING_BEHAVIOUR,
+    PATH_EV,
+    PATH_MAINTENANCE,
+    PATH_POLLUTION,
+    PATH_POSITION,
+    PATH_RUNNING,
+    PATH_SAFETY,
+    VehicleSnapshot,
+)
+from .zeekr_api import METRIC_ENDPOINTS
+from .zeekr_metrics import CODE_SUCCESS, ApiMetrics
 
 _LOGGER = logging.getLogger(__name__)
 
+# Опрос диагностических сенсоров API (остальные обновляются координаторами).
+# Каждое новое значение - строка в recorder, поэтому не чаще раза в 5 минут
+SCAN_INTERVAL = timedelta(minutes=5)
+
 
 # ==================== БАЗОВЫЙ КЛАСС ====================
 
-class ZeekrBaseSensor(CoordinatorEntity, SensorEntity):
+class ZeekrBaseSensor(ZeekrStateChangeMixin, CoordinatorEntity, SensorEntity):
     """Base class for Zeekr sensors"""
 
-    def __init__(self, coordinator: ZeekrDataCoordinator, vin: str):
+    def __init__(self, coordinator: ZeekrVehicleCoordinator, vin: str):
         """Initialize sensor"""
-        super().__init__(coordinator)
+        super().__init__(coordinator, self._data_paths)
         self.vin = vin
         self._attr_has_entity_name = True
 
@@ -56,16 +77,13 @@ class ZeekrBaseSensor(CoordinatorEntity, SensorEntity):
         """Override in subclasses"""
         return "sensor"
 
-    def _get_parser(self) -> VehicleDataParser:
-        """Get parser for current vehicle data"""
-        if self.vin not in self.coordinator.data:
-            return None
-        return VehicleDataParser(self.coordinator.data[self.vin])
+    def _get_snapshot(self) -> VehicleSnapshot:
+        """Get parsed snapshot of current vehicle data (built once per update)"""
+        return self.coordinator.snapshot
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from coordinator"""
-        self.async_write_ha_state()
+    def _state_signature(self) -> tuple:
+        """Sensor state is its native value"""
+        return (self.native_value,)
 
 
 # ==================== ГРУППА 1: СТАТУС И ОХРАНА ====================
@@ -82,9 +100,9 @@ class ZeekrLastUpdateTimeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Return last update time as formatted string"""
-        parser = self._get_parser()
-        if parser:
-            timestamp = int(parser.data.get('updateTime', 0))
+        snapshot = self._get_snapshot()
+        if snapshot:
+            timestamp = snapshot.update_time
             if timestamp:
                 update_datetime = datetime.fromtimestamp(timestamp / 1000)
                 return update_datetime.strftime('%Y-%m-%d %H:%M:%S')
@@ -93,9 +111,9 @@ class ZeekrLastUpdateTimeSensor(ZeekrBaseSensor):
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes"""
-        parser = self._get_parser()
-        if parser:
-            timestamp = int(parser.data.get('updateTime', 0))
+        snapshot = self._get_snapshot()
+        if snapshot:
+            timestamp = snapshot.update_time
             if timestamp:
                 update_datetime = datetime.fromtimestamp(timestamp / 1000)
                 current_time = datetime.now()
@@ -130,6 +148,7 @@ class ZeekrBatterySensor(ZeekrBaseSensor):
     _attr_icon = ICON_BATTERY
     _attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "battery"
@@ -137,22 +156,20 @@ class ZeekrBatterySensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return battery percentage"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            return battery['battery_percentage']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.battery_percentage
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional attributes"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                "Статус зарядки": battery['charge_status'],
-                "Запас хода": f"{battery['distance_to_empty']} км",
-                "Среднее потребление": f"{battery['avg_power_consumption']} кВт",
+                "Статус зарядки": snapshot.label('charge_status'),
+                "Запас хода": f"{snapshot.distance_to_empty} км",
+                "Среднее потребление": f"{snapshot.avg_power_consumption} кВт",
             }
         return {}
 
@@ -162,6 +179,7 @@ class ZeekrTheftProtectionSensor(ZeekrBaseSensor):
 
     _attr_name = "Режим охраны"  # Имя в интерфейсе
     _attr_icon = "mdi:shield-check"  # Иконка щита
+    _data_paths = (PATH_RUNNING,)
 
     def _get_sensor_type(self) -> str:
         return "theft_protection_ahbc"
@@ -169,9 +187,9 @@ class ZeekrTheftProtectionSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Возвращает статус: Включена/Выключена"""
-        parser = self._get_parser()
-        if parser:
-            return parser.get_ahbc_status()
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.ahbc_status
         return "Недоступно"
 
 
@@ -180,6 +198,7 @@ class ZeekrElectricParkBrakeStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Электронный ручной тормоз"
     _attr_icon = "mdi:car-brake-parking"
+    _data_paths = (PATH_SAFETY,)
 
     def _get_sensor_type(self) -> str:
         return "electric_park_brake"
@@ -187,17 +206,14 @@ class ZeekrElectricParkBrakeStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус тормоза парковки"""
-        parser = self._get_parser()
-        if parser:
-            safety = parser.data.get('additionalVehicleStatus', {}).get('drivingSafetyStatus', {})
-            status = int(safety.get('electricParkBrakeStatus', 0))
-
+        snapshot = self._get_snapshot()
+        if snapshot:
             status_map = {
-                0: '❌ Выключен',
-                1: '✅ Включен (парковка)',
-                2: '⚠️ Ошибка',
+                '0': '❌ Выключен',
+                '1': '✅ Включен (парковка)',
+                '2': '⚠️ Ошибка',
             }
-            return status_map.get(status, 'Неизвестно')
+            return status_map.get(snapshot.electric_park_brake, 'Неизвестно')
         return None
 
 
@@ -211,6 +227,7 @@ class ZeekrAuxBatteryPercentageSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:battery-12v"
     #_attr_device_class = SensorDeviceClass.BATTERY
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "battery_12v_percentage"
@@ -218,10 +235,9 @@ class ZeekrAuxBatteryPercentageSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return 12V battery percentage"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            return round(battery['aux_battery_percentage'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.aux_battery_percentage, 1)
         return None
 
 
@@ -233,6 +249,7 @@ class ZeekrAuxBatteryVoltageSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:battery-12v"
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "battery_12v_voltage"
@@ -240,10 +257,9 @@ class ZeekrAuxBatteryVoltageSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return 12V battery voltage"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            return round(battery['aux_battery_voltage'], 3)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.aux_battery_voltage, 3)
         return None
 
 
@@ -254,6 +270,7 @@ class ZeekrDistanceToEmptySensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_icon = "mdi:road-variant"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "distance_to_empty"
@@ -261,10 +278,9 @@ class ZeekrDistanceToEmptySensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return distance to empty"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            return battery['distance_to_empty']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.distance_to_empty
         return None
 
 
@@ -276,6 +292,7 @@ class ZeekrInteriorTempSensor(ZeekrBaseSensor):
     _attr_icon = ICON_TEMPERATURE
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "interior_temp"
@@ -283,10 +300,9 @@ class ZeekrInteriorTempSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return interior temperature"""
-        parser = self._get_parser()
-        if parser:
-            temp = parser.get_temperature_info()
-            return temp['interior_temp']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.interior_temp
         return None
 
 
@@ -298,6 +314,7 @@ class ZeekrExteriorTempSensor(ZeekrBaseSensor):
     _attr_icon = ICON_TEMPERATURE
     _attr_device_class = SensorDeviceClass.TEMPERATURE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "exterior_temp"
@@ -305,10 +322,9 @@ class ZeekrExteriorTempSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return exterior temperature"""
-        parser = self._get_parser()
-        if parser:
-            temp = parser.get_temperature_info()
-            return temp['exterior_temp']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.exterior_temp
         return None
 
 
@@ -319,6 +335,7 @@ class ZeekrOdometerSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_icon = ICON_CAR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "odometer"
@@ -326,10 +343,9 @@ class ZeekrOdometerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return odometer value"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return int(maintenance['odometer'])
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return int(snapshot.odometer)
         return None
 
 
@@ -340,6 +356,7 @@ class ZeekrCurrentSpeedSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
     _attr_icon = "mdi:speedometer"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_DRIVING_BEHAVIOUR)
 
     def _get_sensor_type(self) -> str:
         return "current_speed"
@@ -347,10 +364,9 @@ class ZeekrCurrentSpeedSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return current speed"""
-        parser = self._get_parser()
-        if parser:
-            movement = parser.get_movement_info()
-            return movement['speed']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.speed
         return None
 
 
@@ -361,6 +377,7 @@ class ZeekrAverageSpeedSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfSpeed.KILOMETERS_PER_HOUR
     _attr_icon = "mdi:speedometer"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_DRIVING_BEHAVIOUR)
 
     def _get_sensor_type(self) -> str:
         return "average_speed"
@@ -368,10 +385,9 @@ class ZeekrAverageSpeedSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return average speed"""
-        parser = self._get_parser()
-        if parser:
-            movement = parser.get_movement_info()
-            return movement['avg_speed']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.avg_speed
         return None
 
 
@@ -381,6 +397,7 @@ class ZeekrDaysToServiceSensor(ZeekrBaseSensor):
     _attr_name = "Дней до ТО"
     _attr_icon = "mdi:calendar-alert"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "days_to_service"
@@ -388,10 +405,9 @@ class ZeekrDaysToServiceSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return days to service"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['days_to_service']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.days_to_service
         return None
 
 
@@ -402,6 +418,7 @@ class ZeekrDistanceToServiceSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_icon = "mdi:road-variant"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "distance_to_service"
@@ -409,10 +426,9 @@ class ZeekrDistanceToServiceSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return distance to service"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['distance_to_service']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.distance_to_service
         return None
 
 
@@ -423,6 +439,7 @@ class ZeekrTirePressureDriverSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfPressure.KPA
     _attr_icon = "mdi:tire"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_pressure_driver"
@@ -430,10 +447,9 @@ class ZeekrTirePressureDriverSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return tire pressure"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['driver_tire'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.driver_tire, 1)
         return None
 
 
@@ -444,6 +460,7 @@ class ZeekrTirePressurePassengerSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfPressure.KPA
     _attr_icon = "mdi:tire"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_pressure_passenger"
@@ -451,10 +468,9 @@ class ZeekrTirePressurePassengerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return tire pressure"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['passenger_tire'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.passenger_tire, 1)
         return None
 
 
@@ -465,6 +481,7 @@ class ZeekrTirePressureDriverRearSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfPressure.KPA
     _attr_icon = "mdi:tire"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_pressure_driver_rear"
@@ -472,10 +489,9 @@ class ZeekrTirePressureDriverRearSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return tire pressure"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['driver_rear_tire'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.driver_rear_tire, 1)
         return None
 
 
@@ -486,6 +502,7 @@ class ZeekrTirePressurePassengerRearSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfPressure.KPA
     _attr_icon = "mdi:tire"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_pressure_passenger_rear"
@@ -493,10 +510,9 @@ class ZeekrTirePressurePassengerRearSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Return tire pressure"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['passenger_rear_tire'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.passenger_rear_tire, 1)
         return None
 
 
@@ -507,6 +523,7 @@ class ZeekrInteriorPM25Sensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "μg/m³"
     _attr_icon = "mdi:air-filter"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_POLLUTION,)
 
     def _get_sensor_type(self) -> str:
         return "interior_pm25"
@@ -514,10 +531,9 @@ class ZeekrInteriorPM25Sensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Return PM2.5 level"""
-        parser = self._get_parser()
-        if parser:
-            pollution = parser.get_pollution_info()
-            return pollution['interior_pm25']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.interior_pm25
         return None
 
 
@@ -529,6 +545,7 @@ class ZeekrHVTempLevelSensor(ZeekrBaseSensor):
 
     _attr_name = "Температура батареи"
     _attr_icon = "mdi:thermometer-alert"
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "hv_temp_level"
@@ -536,20 +553,18 @@ class ZeekrHVTempLevelSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть уровень температуры (текст)"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            return battery['hv_temp_level']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('hv_temp_level')
         return "Неизвестно"
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительная информация"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                "Числовое значение": battery['hv_temp_level_numeric'],
+                "Числовое значение": snapshot.hv_temp_level_numeric,
                 "Значения": "1=теплая 🔥, 2=немного холодная ❄️, 3=холодная 🥶, 4=сильно холодная 🧊"
             }
         return {}
@@ -562,6 +577,7 @@ class ZeekrTimeToFullChargeSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "min"
     _attr_icon = "mdi:battery-charging"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV, f'{PATH_MAINTENANCE}.mainBatteryStatus')
 
     def _get_sensor_type(self) -> str:
         return "time_to_full_charge"
@@ -569,10 +585,9 @@ class ZeekrTimeToFullChargeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Вернуть время зарядки"""
-        parser = self._get_parser()
-        if parser:
-            battery = parser.get_battery_info()
-            value = battery['time_to_fully_charged']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            value = snapshot.time_to_fully_charged
             return None if value >= 2047 else value
         return None
 
@@ -586,6 +601,7 @@ class ZeekrTireTempDriverSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:thermometer-lines"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_temp_driver_front"
@@ -593,10 +609,9 @@ class ZeekrTireTempDriverSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть температуру"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['driver_temp'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.driver_temp, 1)
         return None
 
 
@@ -607,6 +622,7 @@ class ZeekrTireTempPassengerSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:thermometer-lines"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_temp_passenger_front"
@@ -614,10 +630,9 @@ class ZeekrTireTempPassengerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть температуру"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['passenger_temp'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.passenger_temp, 1)
         return None
 
 
@@ -628,6 +643,7 @@ class ZeekrTireTempDriverRearSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:thermometer-lines"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_temp_driver_rear"
@@ -635,10 +651,9 @@ class ZeekrTireTempDriverRearSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть температуру"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['driver_rear_temp'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.driver_rear_temp, 1)
         return None
 
 
@@ -649,6 +664,7 @@ class ZeekrTireTempPassengerRearSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:thermometer-lines"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "tire_temp_passenger_rear"
@@ -656,10 +672,9 @@ class ZeekrTireTempPassengerRearSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть температуру"""
-        parser = self._get_parser()
-        if parser:
-            tires = parser.get_tires_info()
-            return round(tires['passenger_rear_temp'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.passenger_rear_temp, 1)
         return None
 
 
@@ -672,6 +687,7 @@ class ZeekrTripMeter1Sensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_icon = "mdi:road-variant"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_DRIVING_BEHAVIOUR)
 
     def _get_sensor_type(self) -> str:
         return "trip_meter_1"
@@ -679,10 +695,9 @@ class ZeekrTripMeter1Sensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть расстояние"""
-        parser = self._get_parser()
-        if parser:
-            movement = parser.get_movement_info()
-            return round(movement['trip_meter_1'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.trip_meter_1, 1)
         return None
 
 
@@ -693,6 +708,7 @@ class ZeekrTripMeter2Sensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.KILOMETERS
     _attr_icon = "mdi:road-variant"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_DRIVING_BEHAVIOUR)
 
     def _get_sensor_type(self) -> str:
         return "trip_meter_2"
@@ -700,10 +716,9 @@ class ZeekrTripMeter2Sensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть расстояние"""
-        parser = self._get_parser()
-        if parser:
-            movement = parser.get_movement_info()
-            return round(movement['trip_meter_2'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.trip_meter_2, 1)
         return None
 
 
@@ -716,6 +731,7 @@ class ZeekrEngineHoursToServiceSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "h"
     _attr_icon = "mdi:wrench-clock"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "engine_hours_to_service"
@@ -723,10 +739,9 @@ class ZeekrEngineHoursToServiceSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Вернуть часы"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['engine_hours_to_service']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.engine_hours_to_service
         return None
 
 
@@ -735,6 +750,7 @@ class ZeekrBrakeFluidLevelSensor(ZeekrBaseSensor):
 
     _attr_name = "Тормозная жидкость"
     _attr_icon = "mdi:water-opacity"
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "brake_fluid_level"
@@ -742,10 +758,9 @@ class ZeekrBrakeFluidLevelSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть уровень"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['brake_fluid_level']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('brake_fluid_level')
         return "Неизвестно"
 
 
@@ -754,6 +769,7 @@ class ZeekrWasherFluidLevelSensor(ZeekrBaseSensor):
 
     _attr_name = "Омыватель"
     _attr_icon = "mdi:water-opacity"
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "washer_fluid_level"
@@ -761,10 +777,9 @@ class ZeekrWasherFluidLevelSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть уровень"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['washer_fluid_level']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('washer_fluid_level')
         return "Неизвестно"
 
 
@@ -773,6 +788,7 @@ class ZeekrEngineCoolantLevelSensor(ZeekrBaseSensor):
 
     _attr_name = "Охлаждающая жидкость"
     _attr_icon = "mdi:water-opacity"
+    _data_paths = (PATH_MAINTENANCE,)
 
     def _get_sensor_type(self) -> str:
         return "engine_coolant_level"
@@ -780,10 +796,9 @@ class ZeekrEngineCoolantLevelSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть уровень"""
-        parser = self._get_parser()
-        if parser:
-            maintenance = parser.get_maintenance_info()
-            return maintenance['engine_coolant_level']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('engine_coolant_level')
         return "Неизвестно"
 
 
@@ -794,6 +809,7 @@ class ZeekrExteriorPM25LevelSensor(ZeekrBaseSensor):
 
     _attr_name = "PM2.5 снаружи"
     _attr_icon = "mdi:air-filter"
+    _data_paths = (PATH_POLLUTION,)
 
     def _get_sensor_type(self) -> str:
         return "exterior_pm25_level"
@@ -801,10 +817,9 @@ class ZeekrExteriorPM25LevelSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть уровень"""
-        parser = self._get_parser()
-        if parser:
-            pollution = parser.get_pollution_info()
-            return pollution['interior_pm25_level']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('interior_pm25_level')
         return None
 
 # ==================== 🅿️ ПАРКОВКА ====================
@@ -821,18 +836,18 @@ class ZeekrParkDurationSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть длительность"""
-        parser = self._get_parser()
-        if parser:
-            park = parser.get_park_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
+            park = snapshot.park_info()
             return park['park_duration']
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительные атрибуты"""
-        parser = self._get_parser()
-        if parser:
-            park = parser.get_park_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
+            park = snapshot.park_info()
             return {
                 'припаркована_с': park['parked_since'],
                 'секунд_припаркована': park['total_seconds'],
@@ -848,6 +863,7 @@ class ZeekrSteeringWheelHeatingStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Обогрев руля"
     _attr_icon = "mdi:heating"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "steering_wheel_heating"
@@ -855,10 +871,9 @@ class ZeekrSteeringWheelHeatingStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус"""
-        parser = self._get_parser()
-        if parser:
-            climate = parser.get_climate_info()
-            return climate['steering_wheel_heating']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('steering_wheel_heating')
         return None
 
 
@@ -867,6 +882,7 @@ class ZeekrDriverHeatingStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Обогрев водителя"
     _attr_icon = "mdi:heating"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "driver_heating"
@@ -874,10 +890,9 @@ class ZeekrDriverHeatingStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус"""
-        parser = self._get_parser()
-        if parser:
-            climate = parser.get_climate_info()
-            return climate['driver_heating']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('driver_heating')
         return None
 
 
@@ -886,6 +901,7 @@ class ZeekrPassengerHeatingStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Обогрев пассажира"
     _attr_icon = "mdi:heating"
+    _data_paths = (PATH_CLIMATE,)
 
     def _get_sensor_type(self) -> str:
         return "passenger_heating"
@@ -893,10 +909,9 @@ class ZeekrPassengerHeatingStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус"""
-        parser = self._get_parser()
-        if parser:
-            climate = parser.get_climate_info()
-            return climate['passenger_heating']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('passenger_heating')
         return None
 
 
@@ -908,6 +923,7 @@ class ZeekrLatitudeSensor(ZeekrBaseSensor):
     _attr_name = "Широта"
     _attr_icon = "mdi:latitude"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_POSITION,)
 
     def _get_sensor_type(self) -> str:
         return "latitude"
@@ -915,10 +931,10 @@ class ZeekrLatitudeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть широту"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
-            return round(position['latitude'], 6)/0.36
+        snapshot = self._get_snapshot()
+        if snapshot:
+            latitude = snapshot.latitude if snapshot.has_gps_signal else 0.0
+            return round(latitude, 6)/0.36
         return None
 
 
@@ -928,6 +944,7 @@ class ZeekrLongitudeSensor(ZeekrBaseSensor):
     _attr_name = "Долгота"
     _attr_icon = "mdi:longitude"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_POSITION,)
 
     def _get_sensor_type(self) -> str:
         return "longitude"
@@ -935,10 +952,10 @@ class ZeekrLongitudeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть долготу"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
-            return round(position['longitude'], 6)/0.36
+        snapshot = self._get_snapshot()
+        if snapshot:
+            longitude = snapshot.longitude if snapshot.has_gps_signal else 0.0
+            return round(longitude, 6)/0.36
         return None
 
 
@@ -949,6 +966,7 @@ class ZeekrAltitudeSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = UnitOfLength.METERS
     _attr_icon = "mdi:elevation-rise"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_POSITION,)
 
     def _get_sensor_type(self) -> str:
         return "altitude"
@@ -956,10 +974,9 @@ class ZeekrAltitudeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> int:
         """Вернуть высоту"""
-        parser = self._get_parser()
-        if parser:
-            position = parser.get_position_info()
-            return position['altitude']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.altitude
         return None
 
 
@@ -970,6 +987,7 @@ class ZeekrPropulsionTypeSensor(ZeekrBaseSensor):
 
     _attr_name = "Тип пропульсии"
     _attr_icon = "mdi:fuel-cell"
+    _data_paths = (PATH_CONFIGURATION,)
 
     def _get_sensor_type(self) -> str:
         return "propulsion_type"
@@ -977,9 +995,9 @@ class ZeekrPropulsionTypeSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть тип"""
-        parser = self._get_parser()
-        if parser:
-            return parser.get_propulsion_type()
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('propulsion_type')
         return None
 
 
@@ -993,6 +1011,7 @@ class ZeekrDCChargePowerSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:lightning-bolt"
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "dc_charge_power"
@@ -1000,10 +1019,9 @@ class ZeekrDCChargePowerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть мощность DC зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return charging['dc_power']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.dc_power
         return None
 
 
@@ -1015,6 +1033,7 @@ class ZeekrDCChargeVoltageExtendedSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:flash"
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "dc_charge_voltage_detailed"
@@ -1022,10 +1041,9 @@ class ZeekrDCChargeVoltageExtendedSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть напряжение на зарядке"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return round(charging['dc_charge_pile_voltage'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.dc_charge_pile_voltage, 1)
         return None
 
 
@@ -1036,6 +1054,7 @@ class ZeekrDCChargeCurrentExtendedSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "A"
     _attr_icon = "mdi:lightning-bolt"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "dc_charge_current_detailed"
@@ -1043,10 +1062,9 @@ class ZeekrDCChargeCurrentExtendedSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть ток зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return round(charging['dc_charge_pile_current'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.dc_charge_pile_current, 1)
         return None
 
 
@@ -1055,6 +1073,7 @@ class ZeekrDCChargeStatusDetailedSensor(ZeekrBaseSensor):
 
     _attr_name = "Статус DC зарядки"
     _attr_icon = "mdi:battery-charging-wireless"
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "dc_charge_status_detailed"
@@ -1062,10 +1081,9 @@ class ZeekrDCChargeStatusDetailedSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус DC зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return charging['dc_charge_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('dc_charge_status')
         return None
 
 
@@ -1074,6 +1092,7 @@ class ZeekrDCDCStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "DC/DC конвертер"
     _attr_icon = "mdi:power-settings"
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "dcdc_status"
@@ -1081,20 +1100,18 @@ class ZeekrDCDCStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус конвертера"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return charging['dc_dc_connect_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('dc_dc_connect_status')
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительные атрибуты"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                "Активирован": charging['dc_dc_activated'],
+                "Активирован": snapshot.dc_dc_activated,
                 "Назначение": "Преобразует 400В в 12В для питания компонентов"
             }
         return {}
@@ -1109,6 +1126,7 @@ class ZeekrACChargeVoltageSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:flash"
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "ac_charge_voltage"
@@ -1116,10 +1134,9 @@ class ZeekrACChargeVoltageSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть напряжение AC зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_ac_charging_info()
-            return round(charging['ac_voltage'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.ac_voltage, 1)
         return None
 
 
@@ -1130,6 +1147,7 @@ class ZeekrACChargeCurrentSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "A"
     _attr_icon = "mdi:lightning-bolt"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "ac_charge_current"
@@ -1137,10 +1155,9 @@ class ZeekrACChargeCurrentSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть ток AC зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_ac_charging_info()
-            return round(charging['ac_current'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.ac_current, 1)
         return None
 
 
@@ -1152,6 +1169,7 @@ class ZeekrACChargePowerSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:lightning-bolt"
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "ac_charge_power"
@@ -1159,12 +1177,11 @@ class ZeekrACChargePowerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть мощность AC зарядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_ac_charging_info()
+        snapshot = self._get_snapshot()
+        if snapshot:
             # Если ток или напряжение 0, значит зарядка не идет
-            if charging['ac_voltage'] > 0 and charging['ac_current'] > 0:
-                return round((charging['ac_voltage'] * charging['ac_current']) / 1000, 2)
+            if snapshot.ac_voltage > 0 and snapshot.ac_current > 0:
+                return round((snapshot.ac_voltage * snapshot.ac_current) / 1000, 2)
         return None
 # ==================== РАЗРЯДКА (V2L, V2H) ====================
 
@@ -1176,6 +1193,7 @@ class ZeekrDischargePowerSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:battery-arrow-up"
     _attr_device_class = SensorDeviceClass.POWER
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "discharge_power"
@@ -1183,10 +1201,9 @@ class ZeekrDischargePowerSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть мощность разрядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return charging['discharge_power']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.discharge_power
         return None
 
 
@@ -1198,6 +1215,7 @@ class ZeekrDischargeVoltageSensor(ZeekrBaseSensor):
     _attr_icon = "mdi:flash"
     _attr_device_class = SensorDeviceClass.VOLTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "discharge_voltage"
@@ -1205,10 +1223,9 @@ class ZeekrDischargeVoltageSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть напряжение разрядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return round(charging['discharge_voltage'], 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(snapshot.discharge_voltage, 1)
         return None
 
 
@@ -1219,6 +1236,7 @@ class ZeekrDischargeCurrentSensor(ZeekrBaseSensor):
     _attr_native_unit_of_measurement = "A"
     _attr_icon = "mdi:lightning-bolt"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "discharge_current"
@@ -1226,10 +1244,9 @@ class ZeekrDischargeCurrentSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> float:
         """Вернуть ток разрядки"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return round(abs(charging['discharge_current']), 1)
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return round(abs(snapshot.discharge_current), 1)
         return None
 
 
@@ -1238,6 +1255,7 @@ class ZeekrChargerStateSensor(ZeekrBaseSensor):
 
     _attr_name = "Состояние зарядки"
     _attr_icon = "mdi:power-plug"
+    _data_paths = (PATH_EV,)
 
     def _get_sensor_type(self) -> str:
         return "charger_state"
@@ -1245,10 +1263,9 @@ class ZeekrChargerStateSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть состояние зарядного устройства"""
-        parser = self._get_parser()
-        if parser:
-            charging = parser.get_charging_info()
-            return charging['charger_state']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.charger_state
         return None
 
 # ==================== ДВИЖЕНИЕ И СКОРОСТЬ ====================
@@ -1259,6 +1276,7 @@ class ZeekrBrakeStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Статус тормозов"
     _attr_icon = "mdi:brake-fluid"
+    _data_paths = (PATH_RUNNING,)
 
     def _get_sensor_type(self) -> str:
         return "brake_status"
@@ -1266,21 +1284,19 @@ class ZeekrBrakeStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус тормозов"""
-        parser = self._get_parser()
-        if parser:
-            brake = parser.get_brake_status()
-            return brake['brake_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('brake_status')
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительная информация"""
-        parser = self._get_parser()
-        if parser:
-            brake = parser.get_brake_status()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                'Тормозит': brake['is_braking'],
-                'Стоп_сигналы': brake['stop_lights_on'],
+                'Тормозит': snapshot.stop_lights,
+                'Стоп_сигналы': snapshot.stop_lights,
             }
         return {}
 
@@ -1290,6 +1306,7 @@ class ZeekrEnergyRecoverySensor(ZeekrBaseSensor):
 
     _attr_name = "Рекуперация энергии"
     _attr_icon = "mdi:lightning-bolt"
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_EV)
 
     def _get_sensor_type(self) -> str:
         return "energy_recovery"
@@ -1297,23 +1314,21 @@ class ZeekrEnergyRecoverySensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус восстановления энергии"""
-        parser = self._get_parser()
-        if parser:
-            recovery = parser.estimate_battery_recovery()
-            return recovery['recovery_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.recovery_status
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительная информация"""
-        parser = self._get_parser()
-        if parser:
-            recovery = parser.estimate_battery_recovery()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                'Восстанавливается': recovery['is_recovering'],
-                'Тормозит': recovery['is_braking'],
-                'Скорость': recovery['speed'],
-                'Текущий_заряд': recovery['current_charge'],
+                'Восстанавливается': snapshot.is_recovering,
+                'Тормозит': snapshot.stop_lights,
+                'Скорость': snapshot.speed,
+                'Текущий_заряд': snapshot.battery_percentage,
             }
         return {}
 
@@ -1323,6 +1338,7 @@ class ZeekrGearStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Коробка передач"
     _attr_icon = "mdi:transmission-tower"
+    _data_paths = (PATH_BASIC, PATH_RUNNING, PATH_DRIVING_BEHAVIOUR)
 
     def _get_sensor_type(self) -> str:
         return "gear_status"
@@ -1330,10 +1346,9 @@ class ZeekrGearStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус коробки передач"""
-        parser = self._get_parser()
-        if parser:
-            movement = parser.get_movement_info()
-            return movement['gear_auto']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.label('gear_auto')
         return None
 
 # ==================== GPS И НАВИГАЦИЯ ====================
@@ -1343,6 +1358,7 @@ class ZeekrGpsStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "GPS статус"
     _attr_icon = "mdi:satellite-variant"
+    _data_paths = (PATH_POSITION,)
 
     def _get_sensor_type(self) -> str:
         return "gps_status"
@@ -1350,25 +1366,23 @@ class ZeekrGpsStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус GPS"""
-        parser = self._get_parser()
-        if parser:
-            gps = parser.get_gps_status()
-            return gps['gps_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.gps_status
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительная информация"""
-        parser = self._get_parser()
-        if parser:
-            gps = parser.get_gps_status()
-            lat_val = gps.get('latitude')
-            lon_val = gps.get('longitude')
+        snapshot = self._get_snapshot()
+        if snapshot:
+            lat_val = snapshot.latitude
+            lon_val = snapshot.longitude
 
             return {
-                'Есть_сигнал': gps.get('has_gps_signal'),
-                'Координаты_достоверны': gps.get('coordinates_trusted'),
-                'Передача_местоположения': gps.get('location_upload_enabled'),
+                'Есть_сигнал': snapshot.has_gps_signal,
+                'Координаты_достоверны': snapshot.position_trusted,
+                'Передача_местоположения': snapshot.location_upload_enabled,
                 # Делим только если значение не None, иначе возвращаем None
                 'Широта': round(lat_val / 0.36, 6) if lat_val is not None else None,
                 'Долгота': round(lon_val / 0.36, 6) if lon_val is not None else None,
@@ -1383,6 +1397,7 @@ class ZeekrLightsStatusSensor(ZeekrBaseSensor):
 
     _attr_name = "Статус огней"
     _attr_icon = "mdi:lightbulb-group"
+    _data_paths = (PATH_RUNNING,)
 
     def _get_sensor_type(self) -> str:
         return "lights_status"
@@ -1390,28 +1405,136 @@ class ZeekrLightsStatusSensor(ZeekrBaseSensor):
     @property
     def native_value(self) -> str:
         """Вернуть статус огней"""
-        parser = self._get_parser()
-        if parser:
-            lights = parser.get_lights_status()
-            return lights['lights_status']
+        snapshot = self._get_snapshot()
+        if snapshot:
+            return snapshot.lights_status
         return None
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Дополнительная информация"""
-        parser = self._get_parser()
-        if parser:
-            lights = parser.get_lights_status()
+        snapshot = self._get_snapshot()
+        if snapshot:
             return {
-                'Дневные_огни': lights['drl_active'],
-                'Дальний_свет': lights['hi_beam'],
-                'Ближний_свет': lights['lo_beam'],
-                'Стоп_сигналы': lights['stop_lights'],
-                'Ночной_режим': lights['is_night_mode'],
+                'Дневные_огни': snapshot.drl_active,
+                'Дальний_свет': snapshot.hi_beam_active,
+                'Ближний_свет': snapshot.lo_beam_active,
+                'Стоп_сигналы': snapshot.stop_lights,
+                'Ночной_режим': snapshot.is_night_mode,
             }
         return {}
 
 
+# ==================== ДИАГНОСТИКА API ====================
+
+class ZeekrApiBaseSensor(SensorEntity):
+    """
+    Base class for API metrics sensors
+
+    Метрики живут в памяти ZeekrAPI и меняются на каждый запрос - сенсоры
+    читают их по SCAN_INTERVAL, а не на каждое обновление координаторов.
+    Состояние - одно число, без атрибутов, меняющихся на каждом опросе:
+    гистограммы, счетчики запросов и время последней ошибки есть в диагностике
+    (api.metrics.as_dict()).
+    """
+
+    _attr_should_poll = True
+    _attr_has_entity_name = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_icon = "mdi:api"
+
+    def __init__(self, metrics: ApiMetrics, account_id: str, sensor_type: str):
+        """Initialize sensor"""
+        self.metrics = metrics
+        self._attr_unique_id = f"{DOMAIN}_{account_id}_api_{sensor_type}"
+
+        # Общее устройство аккаунта (как у кнопки обновления всех машин)
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "global")},
+            "name": "Zeekr",
+            "manufacturer": "Zeekr",
+            "model": "API",
+        }
+
+
+class ZeekrApiLatencySensor(ZeekrApiBaseSensor):
+    """⏱️ Задержка ответа шлюза по endpoint (p95)"""
+
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, metrics: ApiMetrics, account_id: str, endpoint: str, name: str):
+        super().__init__(metrics, account_id, f"{name}_latency")
+        self.endpoint = endpoint
+        self._attr_name = f"Zeekr API {name}: задержка p95"
+
+    @property
+    def native_value(self) -> float:
+        return self.metrics.endpoint(self.endpoint).latency.summary()['p95']
+
+
+class ZeekrApiErrorsSensor(ZeekrApiBaseSensor):
+    """❌ Неудачные запросы по endpoint (с разбивкой по code шлюза)"""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:alert-circle-outline"
+
+    def __init__(self, metrics: ApiMetrics, account_id: str, endpoint: str, name: str):
+        super().__init__(metrics, account_id, f"{name}_errors")
+        self.endpoint = endpoint
+        self._attr_name = f"Zeekr API {name}: ошибки"
+
+    @property
+    def native_value(self) -> int:
+        return self.metrics.endpoint(self.endpoint).errors
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        # Меняются только вместе с числом ошибок
+        metrics = self.metrics.endpoint(self.endpoint)
+        return {
+            'codes': {code: count for code, count in metrics.codes.items() if code != CODE_SUCCESS},
+            'last_error': metrics.last_error,
+        }
+
+
+class ZeekrApiBytesReceivedSensor(ZeekrApiBaseSensor):
+    """📥 Получено от шлюза (тела ответов)"""
+
+    _attr_name = "Zeekr API: получено данных"
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:download-network"
+
+    def __init__(self, metrics: ApiMetrics, account_id: str):
+        super().__init__(metrics, account_id, "bytes_received")
+
+    @property
+    def native_value(self) -> int:
+        return self.metrics.bytes_received
+
+
+class ZeekrApiSigningTimeSensor(ZeekrApiBaseSensor):
+    """🔏 Время подписи запроса (p95)"""
+
+    _attr_name = "Zeekr API: подпись p95"
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 3
+    _attr_icon = "mdi:signature"
+
+    def __init__(self, metrics: ApiMetrics, account_id: str):
+        super().__init__(metrics, account_id, "signing_time")
+
+    @property
+    def native_value(self) -> float:
+        return self.metrics.signing_summary()['p95']
+
+
 # ==================== ФУНКЦИЯ УСТАНОВКИ (В КОНЦЕ!) ====================
 
 async def async_setup_entry(
@@ -1421,12 +1544,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up Zeekr sensors"""
 
-    coordinator: ZeekrDataCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    account: ZeekrAccountCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
 
-    # Для каждого автомобиля создаем датчики
-    for vin in coordinator.data.keys():
+    # Для каждого автомобиля создаем датчики (на своем координаторе)
+    for vin, coordinator in account.vehicles.items():
         entities.extend([
             # ==================== ГРУППА 1: СТАТУС И ОХРАНА ====================
             ZeekrLastUpdateTimeSensor(coordinator, vin),
@@ -1523,5 +1646,14 @@ async def async_setup_entry(
             ZeekrLightsStatusSensor(coordinator, vin),
         ])
 
+    # Диагностика API аккаунта
+    metrics: ApiMetrics = account.api_client.metrics
+    account_id = account.api_client.user_id
+    for endpoint, name in METRIC_ENDPOINTS.items():
+        entities.append(ZeekrApiLatencySensor(metrics, account_id, endpoint, name))
+        entities.append(ZeekrApiErrorsSensor(metrics, account_id, endpoint, name))
+    entities.append(ZeekrApiBytesReceivedSensor(metrics, account_id))
+    entities.append(ZeekrApiSigningTimeSensor(metrics, account_id))
+
     async_add_entities(entities)
-    _LOGGER.info(f"✅ Added {len(entities)} sensors total for {len(coordinator.data)} vehicles")
\ No newline at end of file
+    _LOGGER.info(f"✅ Added {len(entities)} sensors total for {len(account.vehicles)} vehicles")
\ No newline at end of file
@@ -0,0 +1,145 @@
+# custom_components/zeekr/status_diff.py
+"""
+Структурное сравнение ответов vehicleStatus
+
+Пути записываются через точку, например
+additionalVehicleStatus.electricVehicleStatus.chargeLevel
+"""
+from typing import Any, Dict, Iterable, Iterator, Set
+
+
+def _leaf_paths(value: Any, path: str) -> Iterator[str]:
+    """Перечисляет все листовые пути поддерева (для добавленных/удаленных ключей)"""
+    if isinstance(value, dict) and value:
+        for key, child in value.items():
+            yield from _leaf_paths(child, f"{path}.{key}" if path else key)
+    else:
+        yield path
+
+
+def _diff(old: Any, new: Any, path: str, changed: Set[str]) -> None:
+    """Рекурсивно собирает пути отличающихся листьев"""
+    if old is new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, new_value in new.items():
+            child_path = f"{path}.{key}" if path else key
+            if key in old:
+                _diff(old[key], new_value, child_path, changed)
+            else:
+                changed.update(_leaf_paths(new_value, child_path))
+        for key, old_value in old.items():
+            if key not in new:
+                changed.update(_leaf_paths(old_value, f"{path}.{key}" if path else key))
+        return
+
+    # Списки и скаляры сравниваются целиком
+    if old != new:
+        if isinstance(old, dict) or isinstance(new, dict):
+            changed.update(_leaf_paths(old, path))
+            changed.update(_leaf_paths(new, path))
+        else:
+            changed.add(path)
+
+
+def changed_paths(old: Dict[str, Any], new: Dict[str, Any]) -> Set[str]:
+    """
+    Возвращает пути листьев, которые отличаются между двумя ответами
+
+    Добавленные и удаленные поддеревья разворачиваются до листьев, поэтому
+    подписчик на конкретное поле увидит и исчезновение всего раздела.
+
+    Args:
+        old: Предыдущий vehicleStatus
+        new: Новый vehicleStatus
+
+    Returns:
+        Множество путей через точку
+    """
+    changed: Set[str] = set()
+    _diff(old, new, '', changed)
+    return changed
+
+
+def path_prefixes(paths: Iterable[str]) -> Set[str]:
+    """
+    Дополняет пути всеми их предками
+
+    'a.b.c' -> {'a', 'a.b', 'a.b.c'}, чтобы подписчик на раздел 'a.b'
+    находился одним поиском в множестве.
+    """
+    prefixes: Set[str] = set()
+    for path in paths:
+        while path and path not in prefixes:
+            prefixes.add(path)
+            path = path.rpartition('.')[0]
+    return prefixes
+
+
+# ==================== JSON PATCH (RFC 6902) ====================
+
+def _pointer(parts: Iterable[str]) -> str:
+    """Собирает JSON Pointer (RFC 6901) из ключей"""
+    return ''.join('/' + str(part).replace('~', '~0').replace('/', '~1') for part in parts)
+
+
+def _patch(old: Any, new: Any, parts: list, ops: list) -> None:
+    """Рекурсивно собирает операции add/replace/remove"""
+    if old is new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, new_value in new.items():
+            if key in old:
+                _patch(old[key], new_value, parts + [key], ops)
+            else:
+                ops.append({'op': 'add', 'path': _pointer(parts + [key]), 'value': new_value})
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': _pointer(parts + [key])})
+        return
+
+    # Списки и скаляры заменяются целиком
+    if old != new:
+        ops.append({'op': 'replace', 'path': _pointer(parts), 'value': new})
+
+
+def json_patch(old: Dict[str, Any], new: Dict[str, Any]) -> list:
+    """
+    Строит JSON Patch (RFC 6902), превращающий old в new
+
+    Используются только add, replace и remove; списки заменяются целиком.
+    """
+    ops: list = []
+    _patch(old, new, [], ops)
+    return ops
+
+
+def apply_json_patch(doc: Dict[str, Any], patch: list) -> Dict[str, Any]:
+    """
+    Применяет JSON Patch из json_patch() к копии doc
+
+    Исходный документ не изменяется: копируются только словари на путях операций.
+    """
+    result = dict(doc)
+    for op in patch:
+        keys = [
+            part.replace('~1', '/').replace('~0', '~')
+            for part in op['path'].split('/')[1:]
+        ]
+        if not keys:
+            result = op['value']
+            continue
+
+        # Копируем словари вдоль пути, чтобы не задеть doc
+        parent = result
+        for key in keys[:-1]:
+            parent[key] = dict(parent[key])
+            parent = parent[key]
+
+        if op['op'] == 'remove':
+            parent.pop(keys[-1], None)
+        else:
+            parent[keys[-1]] = op['value']
+    return result
@@ -3,89 +3,186 @@
 """
 Парсер данных автомобиля - извлечение и форматирование информации
 ОБНОВЛЕНО: Правильная интерпретация панорамной крыши (затемняющей шторки)
+
+Табличные разделы (get_battery_info, get_tires_info, ...) собираются из
+декларативной схемы vehicle_schema.py
 """
+from functools import wraps
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from .vehicle_schema import (
+    ACCESSORS,
+    CODE_ACCESSORS,
+    COMPILED_SECTIONS,
+    FIELDS,
+    compile_record,
+    translate,
+)
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# ==================== JSON ПУТИ РАЗДЕЛОВ ====================
+# Используются сущностями для подписки на изменения конкретных полей
+
+PATH_CONFIGURATION = 'configuration'
+PATH_BASIC = 'basicVehicleStatus'
+PATH_POSITION = 'basicVehicleStatus.position'
+PATH_EV = 'additionalVehicleStatus.electricVehicleStatus'
+PATH_MAINTENANCE = 'additionalVehicleStatus.maintenanceStatus'
+PATH_CLIMATE = 'additionalVehicleStatus.climateStatus'
+PATH_SAFETY = 'additionalVehicleStatus.drivingSafetyStatus'
+PATH_RUNNING = 'additionalVehicleStatus.runningStatus'
+PATH_DRIVING_BEHAVIOUR = 'additionalVehicleStatus.drivingBehaviourStatus'
+PATH_POLLUTION = 'additionalVehicleStatus.pollutionStatus'
+
+
+def calculate_power(voltage: float, current: float) -> float:
+    """
+    Рассчитывает мощность зарядки/разрядки
+    Формула: Мощность (кВт) = Напряжение (В) × Ток (А) / 1000
+    """
+    if voltage and current:
+        power_kw = (voltage * abs(current)) / 1000
+        return round(power_kw, 1)
+    return 0.0
+
+
+def describe_charger_state(state_code: str, charge_sts: str, dc_sts: str, time_to_charge: int) -> str:
+    """
+    Парсит состояние зарядного устройства с учетом контекста
+
+    Args:
+        state_code: chargerState
+        charge_sts: Код chargeSts
+        dc_sts: Код dcChargeSts
+        time_to_charge: timeToFullyCharged (2047 если нет данных)
+    """
+    # 1. Проверяем общий статус зарядки (chargeSts)
+    # Если chargeSts == '3', это обычно означает "Зарядка завершена"
+    if charge_sts == '3':
+        return "✅ Зарядка завершена"
+
+    # 2. Если код состояния '3' (обычно DC), проверяем, не закончилась ли она
+    # Если DC не активна (не '2') И время заряда прошло (0) -> значит зарядка завершена
+    if str(state_code) == '3' and dc_sts != '2' and time_to_charge == 0:
+        return "✅ Зарядка завершена"
+
+    state_map = {
+        '0': '❌ Отключено',
+        '1': '🔌 Подключено (ожидание)',
+        '2': '⚡ Зарядка (AC)',  # Или Предзарядка, если это фаза 2
+        '3': '⚡ Зарядка (DC)',
+        '4': '🔄 Уравнивание',
+        '5': '✅ Завершено',
+        '15': '⚙️ Готово',
+    }
+
+    return state_map.get(str(state_code), f"⏳ Состояние {state_code}")
+
+
+def describe_lights(stop: bool, hi_beam: bool, lo_beam: bool, drl: bool) -> str:
+    """Возвращает текстовое описание огней"""
+    if stop:
+        return '🔴 ТОРМОЗИТ'
+    elif hi_beam:
+        return '🔆 Дальний свет'
+    elif lo_beam:
+        return '💡 Ближний свет'
+    elif drl:
+        return '☀️ Дневные огни'
+    else:
+        return '⚫ Огни выключены (день или припаркован)'
+
+
+def describe_park_time(park_time_ms: int) -> Dict[str, Any]:
+    """Информация о парковке по метке времени parkTime (мс)"""
+
+    # Если время = 0, не припаркована
+    if park_time_ms == 0:
+        return {
+            'is_parked': False,
+            'parked_since': None,
+            'park_duration': 'Не припаркован',
+            'total_seconds': 0,
+        }
+
+    # Рассчитываем время парковки
+    try:
+        park_datetime = datetime.fromtimestamp(park_time_ms / 1000)
+        current_time = datetime.now()
+        park_duration = current_time - park_datetime
+
+        total_seconds = int(park_duration.total_seconds())
+        days = total_seconds // 86400
+        hours = (total_seconds % 86400) // 3600
+        minutes = (total_seconds % 3600) // 60
+
+        # Форматируем красивый вывод
+        if days > 0:
+            duration_str = f"{days}д {hours}ч {minutes}м"
+        elif hours > 0:
+            duration_str = f"{hours}ч {minutes}м"
+        else:
+            duration_str = f"{minutes}м"
 
-class VehicleDataParser:
-    """Парсер для извлечения всей информации о статусе автомобиля"""
+        _LOGGER.debug("Parked for %s", duration_str)
 
-    def _calculate_dc_power(self, voltage: float, current: float) -> float:
-        """
-        Рассчитывает мощность DC зарядки
-        Формула: Мощность (кВт) = Напряжение (В) × Ток (А) / 1000
-        """
-        if voltage and current:
-            power_kw = (voltage * abs(current)) / 1000
-            return round(power_kw, 1)
-        return 0.0
-
-    def _calculate_discharge_power(self, voltage: float, current: float) -> float:
-        """Рассчитывает мощность разрядки (V2L, V2H)"""
-        if voltage and current:
-            power_kw = (voltage * abs(current)) / 1000
-            return round(power_kw, 1)
-        return 0.0
-
-    def _parse_dc_charge_status(self, status_code: str) -> str:
-        """Парсит статус DC зарядки"""
-        status_map = {
-            '0': '❌ Не активна',
-            '1': '⚡ Активна (подключена)',
-            '2': '🔋 Зарядка в процессе',
-            '3': '✅ Зарядка завершена',
-            '4': '⏸️ Приостановлена',
+        return {
+            'is_parked': True,
+            'parked_since': park_datetime.strftime('%Y-%m-%d %H:%M:%S'),
+            'park_duration': duration_str,
+            'total_seconds': total_seconds,
         }
-        return status_map.get(str(status_code), f'❓ Неизвестно ({status_code})')
-
-    def _parse_dc_dc_status(self, status_code: str) -> str:
-        """Парсит статус DC/DC конвертера (преобразует 400В в 12В)"""
-        status_map = {
-            '0': '❌ Отключен',
-            '1': '🔄 Переход',
-            '2': '⚠️ Ошибка',
-            '3': '✅ Включен и работает',
+    except Exception as e:
+        _LOGGER.error("Failed to calculate park duration: %s", e)
+        return {
+            'is_parked': False,
+            'parked_since': None,
+            'park_duration': 'Ошибка данных',
+            'total_seconds': 0,
         }
-        return status_map.get(str(status_code), f'❓ Неизвестно ({status_code})')
 
-    def _parse_charger_state(self, state_code: str) -> str:
-        """Парсит состояние зарядного устройства с учетом контекста"""
 
-        # Получаем данные о зарядке для проверки контекста
-        ev_status = self.data.get('additionalVehicleStatus', {}).get('electricVehicleStatus', {})
+def schema_section(extend):
+    """
+    Собирает метод раздела из скомпилированной схемы
 
-        # 1. Проверяем общий статус зарядки (chargeSts)
-        # Если chargeSts == '3', это обычно означает "Зарядка завершена"
-        charge_sts = ev_status.get('chargeSts', '0')
-        if str(charge_sts) == '3':
-            return "✅ Зарядка завершена"
-
-        # 2. Если код состояния '3' (обычно DC), проверяем, не закончилась ли она
-        if str(state_code) == '3':
-            dc_sts = ev_status.get('dcChargeSts', '0')
-            time_to_charge = int(float(ev_status.get('timeToFullyCharged', 2047)))
-
-            # Если DC не активна (не '2') И время заряда прошло (0) -> значит зарядка завершена
-            if str(dc_sts) != '2' and time_to_charge == 0:
-                return "✅ Зарядка завершена"
-
-        state_map = {
-            '0': '❌ Отключено',
-            '1': '🔌 Подключено (ожидание)',
-            '2': '⚡ Зарядка (AC)',  # Или Предзарядка, если это фаза 2
-            '3': '⚡ Зарядка (DC)',
-            '4': '🔄 Уравнивание',
-            '5': '✅ Завершено',
-            '15': '⚙️ Готово',
-        }
+    Декорируемая функция получает готовый словарь полей и может дополнить
+    его вычисляемыми значениями. Имя функции - имя раздела в SECTIONS.
+    """
+    compiled = COMPILED_SECTIONS[extend.__name__]
 
-        return state_map.get(str(state_code), f"⏳ Состояние {state_code}")
+    @wraps(extend)
+    def section(self) -> Dict[str, Any]:
+        result = compiled(self.data)
+        extend(self, result)
+        return result
+
+    return section
+
+
+class VehicleDataParser:
+    """Парсер для извлечения всей информации о статусе автомобиля"""
 
     def __init__(self, raw_data: Dict[str, Any]):
         """Инициализация парсера"""
         self.data = raw_data
 
+    def get_field(self, name: str) -> Any:
+        """
+        Получает одно поле схемы без сборки всего раздела
+
+        Args:
+            name: Имя поля из vehicle_schema.FIELDS (например 'battery_percentage')
+        """
+        return ACCESSORS[name](self.data)
+
+    def get_code(self, name: str) -> str:
+        """Получает код поля-перечисления без перевода (например '3' для charge_status)"""
+        return CODE_ACCESSORS[name](self.data)
+
     # ==================== БАЗОВАЯ ИНФОРМАЦИЯ ====================
 
     def get_vin(self) -> str:
@@ -119,10 +216,11 @@ class VehicleDataParser:
 
     def get_is_moving(self) -> bool:
         """Определяет едет ли автомобиль прямо сейчас"""
-        basic = self.data.get('basicVehicleStatus', {})
-        speed = float(basic.get('speed', 0))
-        speed_valid = basic.get('speedValidity', 'false') == 'true'
-        return speed > 0 and speed_valid
+        return self.get_field('speed') > 0 and self.get_field('speed_validity')
+
+    def get_is_dc_charging(self) -> bool:
+        """Определяет идет ли сейчас быстрая (DC) зарядка"""
+        return self.get_code('dc_charge_status') in ('1', '2')
 
     def get_theft_and_security_status(self) -> Dict[str, Any]:
         """Получает информацию об охране и защите от кражи"""
@@ -147,80 +245,19 @@ class VehicleDataParser:
 
     # ==================== БАТАРЕЯ И ЗАРЯД ====================
 
-    def get_battery_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_battery_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о батерее"""
-        ev_status = self.data.get('additionalVehicleStatus', {}).get('electricVehicleStatus', {})
-        main_battery = self.data.get('additionalVehicleStatus', {}).get('maintenanceStatus', {}).get(
-            'mainBatteryStatus', {})
 
-        return {
-            # 🎯 ОСНОВНАЯ БАТАРЕЯ (%)
-            'battery_percentage': int(float(ev_status.get('chargeLevel', 0))),
-            'distance_to_empty': int(float(ev_status.get('distanceToEmptyOnBatteryOnly', 0))),
-            'charge_status': self._parse_charge_status(ev_status.get('chargeSts', '0')),
-            'avg_power_consumption': float(ev_status.get('averPowerConsumption', 0)),
-            'time_to_fully_charged': int(float(ev_status.get('timeToFullyCharged', 0))),
-
-            # 🎯 12V БАТАРЕЯ (вспомогательная)
-            'aux_battery_percentage': float(main_battery.get('chargeLevel', 0)),
-            'aux_battery_voltage': float(main_battery.get('voltage', 0)),
-
-            # Неизвестные параметры
-            'soc': float(ev_status.get('stateOfCharge', 0)),
-            'soh': float(ev_status.get('stateOfHealth', 0)),
-
-            # Температура батареи
-            'hv_temp_level': self._parse_hv_temp_level(ev_status.get('hvTempLevel', '0')),
-            'hv_temp_level_numeric': int(ev_status.get('hvTempLevel', 0)),
-        }
-
-    def _parse_hv_temp_level(self, level_code: str) -> str:
-        """Переводит уровень температуры батареи"""
-        temp_map = {
-            '0': 'Теплая 🔥',
-            '1': 'Немного холодная ❄️',
-            '2': 'Холодная 🥶',
-            '3': 'Сильно холодная 🧊',
-        }
-        return temp_map.get(str(level_code), 'Неизвестно')
-
-    def _parse_charge_status(self, status_code: str) -> str:
-        """Переводит код статуса заряда на русский"""
-        status_map = {
-            '0': 'Не подключено',
-            '1': 'Подключено (ожидание)',
-            '2': 'Предзарядка',
-            '3': 'Зарядка завершена',
-            '4': 'Зарядка завершена',
-            '5': 'Приостановлено',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
-
-    def get_ac_charging_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_ac_charging_info(self, result: Dict[str, Any]) -> None:
         """Получить информацию о медленной зарядке"""
-        ev_status = self.data.get('additionalVehicleStatus', {}).get('electricVehicleStatus', {})
 
-        # chargeUAct - Напряжение (V), chargeIAct - Ток (A)
-        voltage = float(ev_status.get('chargeUAct', 0))
-        current = float(ev_status.get('chargeIAct', 0))
-
-        return {
-            'ac_voltage': voltage,
-            'ac_current': current,
-            # Можно добавить статус зарядки, если нужно: ev_status.get('chargeSts')
-        }
     # ==================== ТЕМПЕРАТУРА ====================
 
-    def get_temperature_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_temperature_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о температуре"""
-        climate = self.data.get('additionalVehicleStatus', {}).get('climateStatus', {})
-
-        return {
-            'interior_temp': float(climate.get('interiorTemp', 0)),
-            'exterior_temp': float(climate.get('exteriorTemp', 0)),
-            'cabin_temp_reduction_status': bool(climate.get('cabinTempReductionStatus', 0)),
-            'climate_over_heat_proactive': bool(climate.get('climateOverHeatProActive', 'false') == 'true'),
-        }
 
     # ==================== ПОЛОЖЕНИЕ И КООРДИНАТЫ ====================
 
@@ -264,80 +301,15 @@ class VehicleDataParser:
 
     # ==================== ДВЕРИ И БЕЗОПАСНОСТЬ ====================
 
-    def get_security_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_security_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о безопасности"""
-        safety = self.data.get('additionalVehicleStatus', {}).get('drivingSafetyStatus', {})
-
-        return {
-            'driver_door_open': bool(int(safety.get('doorOpenStatusDriver', 0))),
-            'passenger_door_open': bool(int(safety.get('doorOpenStatusPassenger', 0))),
-            'driver_rear_door_open': bool(int(safety.get('doorOpenStatusDriverRear', 0))),
-            'passenger_rear_door_open': bool(int(safety.get('doorOpenStatusPassengerRear', 0))),
-            'trunk_open': bool(int(safety.get('trunkOpenStatus', 0))),
-            'engine_hood_open': bool(int(safety.get('engineHoodOpenStatus', 0))),
-            'central_lock': self._parse_lock_status(safety.get('centralLockingStatus', '0')),
-            'driver_lock': self._parse_lock_status(safety.get('doorLockStatusDriver', '0')),
-            'passenger_lock': self._parse_lock_status(safety.get('doorLockStatusPassenger', '0')),
-            'driver_rear_lock': self._parse_lock_status(safety.get('doorLockStatusDriverRear', '0')),
-            'passenger_rear_lock': self._parse_lock_status(safety.get('doorLockStatusPassengerRear', '0')),
-            'trunk_lock': self._parse_lock_status(safety.get('trunkLockStatus', '0')),
-            'electric_park_brake': self._parse_park_brake(safety.get('electricParkBrakeStatus', '0')),
-            'srs_crash_status': bool(int(safety.get('srsCrashStatus', 0))),
-            'alarm_status': safety.get('vehicleAlarm', {}).get('alrmSt', '0'),
-        }
-
-    def _parse_lock_status(self, status_code: str) -> str:
-        """Переводит код статуса замка"""
-        status_map = {
-            '0': 'Неизвестно',
-            '1': 'Заблокировано',
-            '2': 'Разблокировано',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
-
-    def _parse_park_brake(self, status_code: str) -> str:
-        """Переводит статус электронного тормоза парковки"""
-        status_map = {
-            '0': 'Выключено',
-            '1': 'Включено',
-            '2': 'Ошибка',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
 
     # ==================== ОКНА ====================
 
-    def get_windows_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_windows_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию об окнах"""
-        climate = self.data.get('additionalVehicleStatus', {}).get('climateStatus', {})
-
-        return {
-            'driver_window': self._parse_window_status(climate.get('winStatusDriver', '2')),
-            'passenger_window': self._parse_window_status(climate.get('winStatusPassenger', '2')),
-            'driver_rear_window': self._parse_window_status(climate.get('winStatusDriverRear', '2')),
-            'passenger_rear_window': self._parse_window_status(climate.get('winStatusPassengerRear', '2')),
-            'window_close_reminder': self._parse_window_reminder(climate.get('winCloseReminder', '0')),
-            'defrost': bool(climate.get('defrost', 'false') == 'true'),
-        }
-
-    def _parse_window_status(self, status_code: str) -> str:
-        """Переводит код статуса окна"""
-        status_map = {
-            '0': 'Открыто',
-            '1': 'Открывается',
-            '2': 'Закрыто',
-            '3': 'Закрывается',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
-
-    def _parse_window_reminder(self, code: str) -> str:
-        """Парсит напоминание о закрытии окна"""
-        map_reminder = {
-            '0': 'Нет напоминания',
-            '1': 'Окна приоткрыты',
-            '2': 'Окна открыты',
-            '3': 'Нужно закрыть окна',
-        }
-        return map_reminder.get(str(code), 'Неизвестно')
 
     # ==================== ПАНОРАМНАЯ КРЫША (ПОЛНОСТЬЮ ИСПРАВЛЕНО) ====================
 
@@ -428,230 +400,49 @@ class VehicleDataParser:
 
     # ==================== КЛИМАТ ====================
 
-    def get_climate_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_climate_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о климате"""
-        climate = self.data.get('additionalVehicleStatus', {}).get('climateStatus', {})
-
-        return {
-            'interior_temp': float(climate.get('interiorTemp', 0)),
-            'exterior_temp': float(climate.get('exteriorTemp', 0)),
-            'steering_wheel_heating': self._parse_heating_status(climate.get('steerWhlHeatingSts', '0')),
-            'driver_heating': self._parse_heating_status(climate.get('drvHeatSts', '0')),
-            'passenger_heating': self._parse_heating_status(climate.get('passHeatingSts', '0')),
-
-            # === ПАНОРАМНАЯ КРЫША И ЗАТЕМНЯЮЩИЕ ШТОРКИ ===
-            'panoramic_roof_sealed': True,  # Крыша герметична
-            'front_shade_open': bool(int(climate.get('sunroofOpenStatus', 0))),
-            'front_shade_position': int(climate.get('sunroofPos', 0)),
-            'rear_shade_open': bool(int(climate.get('curtainOpenStatus', 0))),  # ← ИСПРАВЛЕНО!
-            'rear_shade_position': int(climate.get('curtainPos', 0)),  # ← ИСПРАВЛЕНО!
-
-            # === ВЕНТИЛЯЦИЯ ===
-            'air_blower_active': climate.get('airBlowerActive', 'false') == 'true',
-            'defrost': climate.get('defrost', 'false') == 'true',
-        }
-
-    def _parse_heating_status(self, status_code: str) -> str:
-        """Парсит статус обогрева"""
-        status_map = {
-            '0': 'Выключено',
-            '1': 'Уровень 1',
-            '2': 'Уровень 2',
-            '3': 'Уровень 3',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
+        result['panoramic_roof_sealed'] = True  # Крыша герметична
 
     # ==================== ШИНЫ ====================
 
-    def get_tires_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_tires_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о давлении в шинах"""
-        maintenance = self.data.get('additionalVehicleStatus', {}).get('maintenanceStatus', {})
-
-        return {
-            'driver_tire': float(maintenance.get('tyreStatusDriver', 0)),
-            'passenger_tire': float(maintenance.get('tyreStatusPassenger', 0)),
-            'driver_rear_tire': float(maintenance.get('tyreStatusDriverRear', 0)),
-            'passenger_rear_tire': float(maintenance.get('tyreStatusPassengerRear', 0)),
-            'driver_temp': float(maintenance.get('tyreTempDriver', 0)),
-            'passenger_temp': float(maintenance.get('tyreTempPassenger', 0)),
-            'driver_rear_temp': float(maintenance.get('tyreTempDriverRear', 0)),
-            'passenger_rear_temp': float(maintenance.get('tyreTempPassengerRear', 0)),
-        }
 
     # ==================== ОДОМЕТР И ТО ====================
 
-    def get_maintenance_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_maintenance_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о техническом обслуживании"""
-        maintenance = self.data.get('additionalVehicleStatus', {}).get('maintenanceStatus', {})
-
-        return {
-            'odometer': float(maintenance.get('odometer', 0)),
-            'days_to_service': int(maintenance.get('daysToService', 0)),
-            'distance_to_service': int(maintenance.get('distanceToService', 0)),
-            'engine_hours_to_service': int(maintenance.get('engineHrsToService', 0)),
-            'service_warning_status': bool(int(maintenance.get('serviceWarningStatus', 0))),
-            'brake_fluid_level': self._parse_fluid_level(maintenance.get('brakeFluidLevelStatus', '0')),
-            'washer_fluid_level': self._parse_washer_fluid_level(maintenance.get('washerFluidLevelStatus', '0')),
-            'engine_coolant_level': self._parse_fluid_level(maintenance.get('engineCoolantLevelStatus', '0')),
-        }
-
-    def _parse_fluid_level(self, level_code: str) -> str:
-        """
-        Парсит уровень жидкостей (тормоз, охлаждающая)
-        """
-        level_map = {
-            '0': 'Полный 🟢',
-            '1': 'Хороший 🟢',
-            '2': 'Нормально 🟢',
-            '3': 'Полный 🟢',
-        }
-        return level_map.get(str(level_code), f'Уровень {level_code}')
-
-    def _parse_washer_fluid_level(self, level_code: str) -> str:
-        """
-        Парсит уровень жидкости омывателя
-        (может быть инверсная логика у Zeekr)
-        """
-        level_map = {
-            '0': 'Полный ✅',
-            '1': 'Низкий 🔴',
-        }
-        return level_map.get(str(level_code), f'Уровень {level_code}')
 
     # ==================== СКОРОСТЬ И ДВИЖЕНИЕ ====================
 
-    def get_movement_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_movement_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о движении"""
-        basic = self.data.get('basicVehicleStatus', {})
-        running = self.data.get('additionalVehicleStatus', {}).get('runningStatus', {})
-        driving = self.data.get('additionalVehicleStatus', {}).get('drivingBehaviourStatus', {})
-
-        return {
-            # ===== СКОРОСТЬ =====
-            'speed': float(basic.get('speed', 0)),
-            'speed_valid': self._parse_speed_validity(basic.get('speedValidity', 'false')),
-            'avg_speed': int(float(running.get('avgSpeed', 0))),
-            'speed_numeric': float(basic.get('speed', 0)),
-
-            # ===== КОРОБКА ПЕРЕДАЧ =====
-            'gear_auto': self._parse_gear_status(str(int(driving.get('gearAutoStatus', 0)))),
-            'gear_auto_numeric': int(driving.get('gearAutoStatus', 0)),
-            'engine_rpm': float(driving.get('engineSpeed', 0)),
-
-            # ===== ДВИГАТЕЛЬ =====
-            'engine_status': 'engine_running' if basic.get('engineStatus') == 'engine_running' else 'engine_off',
-
-            # ===== НАПРАВЛЕНИЕ =====
-            'direction': int(basic.get('direction', 0)) if basic.get('direction') else 0,
-
-            # ===== ОДОМЕТРЫ =====
-            'trip_meter_1': float(running.get('tripMeter1', 0)),
-            'trip_meter_2': float(running.get('tripMeter2', 0)),
-
-            # ===== ОГНИ =====
-            'drl_active': bool(int(running.get('drl', 0))),
-            'hi_beam_active': bool(int(running.get('hiBeam', 0))),
-            'lo_beam_active': bool(int(running.get('loBeam', 0))),
-        }
-
-    def _parse_speed_validity(self, validity: str) -> str:
-        """Парсит достоверность скорости"""
-        return '✅ Достоверна' if validity == 'true' else '⚠️ Недостоверна'
-
-    def _parse_gear_status(self, gear_code: str) -> str:
-        """Парсит статус коробки передач"""
-        gear_map = {
-            '0': '❌ Выключена',
-            '1': '✅ Автоматическая включена',
-            '2': '🔧 Мануальная включена',
-            '3': '⏸️ Режим удержания / Нейтраль',
-        }
-        return gear_map.get(str(gear_code), 'Неизвестно')
 
     # ==================== ТОРМОЗА ====================
 
-    def get_brake_status(self) -> Dict[str, Any]:
+    @schema_section
+    def get_brake_status(self, result: Dict[str, Any]) -> None:
         """Получает информацию о тормозах"""
-        running = self.data.get('additionalVehicleStatus', {}).get('runningStatus', {})
-
-        stop_lights = bool(int(running.get('stopLi', 0)))
-
-        return {
-            'is_braking': stop_lights,
-            'brake_status': self._parse_stop_light_status(running.get('stopLi', '0')),
-            'stop_lights_on': stop_lights,
-        }
-
-    def _parse_stop_light_status(self, status: str) -> str:
-        """Парсит статус стоп-сигналов"""
-        status_map = {
-            '0': '✅ Выключены (едет или свободно)',
-            '1': '🔴 ВКЛЮЧЕНЫ - ТОРМОЗИТ',
-        }
-        return status_map.get(str(status), 'Неизвестно')
 
     # ==================== ОГНИ ====================
 
-    def get_lights_status(self) -> Dict[str, Any]:
+    @schema_section
+    def get_lights_status(self, result: Dict[str, Any]) -> None:
         """Получает полный статус всех огней"""
-        running = self.data.get('additionalVehicleStatus', {}).get('runningStatus', {})
-
-        return {
-            'drl_active': bool(int(running.get('drl', 0))),
-            'hi_beam': bool(int(running.get('hiBeam', 0))),
-            'lo_beam': bool(int(running.get('loBeam', 0))),
-            'front_fog': bool(int(running.get('frntFog', 0))),
-            'rear_fog': bool(int(running.get('reFog', 0))),
-            'stop_lights': bool(int(running.get('stopLi', 0))),
-            'reverse_lights': bool(int(running.get('reverseLi', 0))),
-            'corner_lights': bool(int(running.get('cornrgLi', 0))),
-
-            'lights_status': self._get_lights_summary(running),
-            'is_night_mode': not bool(int(running.get('drl', 0))) and not bool(int(running.get('hiBeam', 0))),
-        }
-
-    def _get_lights_summary(self, running: Dict) -> str:
-        """Возвращает текстовое описание огней"""
-        drl = bool(int(running.get('drl', 0)))
-        lo_beam = bool(int(running.get('loBeam', 0)))
-        hi_beam = bool(int(running.get('hiBeam', 0)))
-        stop = bool(int(running.get('stopLi', 0)))
-
-        if stop:
-            return '🔴 ТОРМОЗИТ'
-        elif hi_beam:
-            return '🔆 Дальний свет'
-        elif lo_beam:
-            return '💡 Ближний свет'
-        elif drl:
-            return '☀️ Дневные огни'
-        else:
-            return '⚫ Огни выключены (день или припаркован)'
+        result['lights_status'] = describe_lights(
+            result['stop_lights'], result['hi_beam'], result['lo_beam'], result['drl_active'])
+        result['is_night_mode'] = not result['drl_active'] and not result['hi_beam']
 
     # ==================== ЗАГРЯЗНЕНИЕ ====================
 
-    def get_pollution_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_pollution_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о качестве воздуха"""
-        pollution = self.data.get('additionalVehicleStatus', {}).get('pollutionStatus', {})
-
-        return {
-            'interior_pm25': int(float(pollution.get('interiorPM25', 0))),
-            'interior_pm25_level': self._parse_pm25_level(pollution.get('interiorPM25Level', '0')),
-            'exterior_pm25_level': self._parse_pm25_level(pollution.get('exteriorPM25Level', '0')),
-            'relative_humidity': int(float(pollution.get('relHumSts', 0))),
-        }
-
-    def _parse_pm25_level(self, level_code: str) -> str:
-        """Переводит уровень PM2.5"""
-        level_map = {
-            '0': 'Отличный 🟢',
-            '1': 'Хороший 🟢',
-            '2': 'Умеренный 🟡',
-            '3': 'Плохой 🟠',
-            '4': 'Очень плохой 🔴',
-            '5': 'Критичный 🚨',
-        }
-        return level_map.get(str(level_code), 'Неизвестно')
 
     def get_air_quality_alert(self) -> Dict[str, Any]:
         """Проверяет качество воздуха (ВНИМАНИЕ!)"""
@@ -696,7 +487,7 @@ class VehicleDataParser:
 
         # Шаг 2: Проверяем, пуста ли строка
         if not park_time_str or park_time_str == '':
-            print("[DEBUG] parkTime пуста - машина не припаркована")
+            _LOGGER.debug("parkTime is empty - vehicle is not parked")
             return {
                 'is_parked': False,
                 'parked_since': None,
@@ -706,16 +497,7 @@ class VehicleDataParser:
         try:
             park_time_ms = int(park_time_str)
         except (ValueError, TypeError) as e:
-            print(f"[ERROR] Не могу преобразовать parkTime в число: {park_time_str} - {e}")
-            return {
-                'is_parked': False,
-                'parked_since': None,
-                'park_duration': 'Не припаркован',
-                'total_seconds': 0,
-            }
-
-            # Шаг 4: Если время = 0, не припаркована
-        if park_time_ms == 0:
+            _LOGGER.error("Cannot convert parkTime to a number: %s - %s", park_time_str, e)
             return {
                 'is_parked': False,
                 'parked_since': None,
@@ -723,89 +505,21 @@ class VehicleDataParser:
                 'total_seconds': 0,
             }
 
-            # Шаг 5: Рассчитываем время парковки
-        try:
-            park_datetime = datetime.fromtimestamp(park_time_ms / 1000)
-            current_time = datetime.now()
-            park_duration = current_time - park_datetime
-
-            total_seconds = int(park_duration.total_seconds())
-            days = total_seconds // 86400
-            hours = (total_seconds % 86400) // 3600
-            minutes = (total_seconds % 3600) // 60
-
-            # Форматируем красивый вывод
-            if days > 0:
-                duration_str = f"{days}д {hours}ч {minutes}м"
-            elif hours > 0:
-                duration_str = f"{hours}ч {minutes}м"
-            else:
-                duration_str = f"{minutes}м"
-
-            print(f"[DEBUG] Припаркована {duration_str}")
-
-            return {
-                'is_parked': True,
-                'parked_since': park_datetime.strftime('%Y-%m-%d %H:%M:%S'),
-                'park_duration': duration_str,
-                'total_seconds': total_seconds,
-            }
-        except Exception as e:
-            print(f"[ERROR] Ошибка при расчете времени парковки: {e}")
-            return {
-                'is_parked': False,
-                'parked_since': None,
-                'park_duration': 'Ошибка данных',
-                'total_seconds': 0,
-            }
+        return describe_park_time(park_time_ms)
 
     # ==================== ЗАРЯДКА ====================
 
-    def get_charging_info(self) -> Dict[str, Any]:
+    @schema_section
+    def get_charging_info(self, result: Dict[str, Any]) -> None:
         """Получает информацию о зарядке (AC и DC)"""
-        ev_status = self.data.get('additionalVehicleStatus', {}).get('electricVehicleStatus', {})
-
-        return {
-            # ===== AC ЗАРЯДКА =====
-            'charge_status': self._parse_charge_status(ev_status.get('chargeSts', '0')),
-            'charge_pile_voltage': float(ev_status.get('dcChargePileUAct', 0)),
-            'current_power_input': float(ev_status.get('averPowerConsumption', 0)),
-            'ac_charge_status': self._parse_charge_status(ev_status.get('chargeSts', '0')),
-
-            # ===== DC ЗАРЯДКА (БЫСТРАЯ) =====
-            'dc_charge_status': self._parse_dc_charge_status(ev_status.get('dcChargeSts', '0')),
-            'dc_charge_pile_current': float(ev_status.get('dcChargePileIAct', 0)),
-            'dc_charge_pile_voltage': float(ev_status.get('dcChargePileUAct', 0)),
-            'dc_power': self._calculate_dc_power(
-                float(ev_status.get('dcChargePileUAct', 0)),
-                float(ev_status.get('dcChargePileIAct', 0))
-            ),
-            'dc_dc_activated': bool(int(ev_status.get('dcDcActvd', 0))),
-            'dc_dc_connect_status': self._parse_dc_dc_status(ev_status.get('dcDcConnectStatus', '0')),
-
-            # ===== РАЗРЯДКА (V2L, V2H) =====
-            'discharge_voltage': float(ev_status.get('disChargeUAct', 0)),
-            'discharge_current': float(ev_status.get('disChargeIAct', 0)),
-            'discharge_power': self._calculate_discharge_power(
-                float(ev_status.get('disChargeUAct', 0)),
-                float(ev_status.get('disChargeIAct', 0))
-            ),
-            'discharge_connector_status': self._parse_charge_connector_status(
-                ev_status.get('disChargeConnectStatus', '0')),
-
-            # ===== ОБЩАЯ ИНФОРМАЦИЯ =====
-            'charger_state': self._parse_charger_state(ev_status.get('chargerState', '0')),
-            'time_to_fully_charged': int(float(ev_status.get('timeToFullyCharged', 0))),
-        }
-
-    def _parse_charge_connector_status(self, status_code: str) -> str:
-        """Парсит статус разъема зарядки"""
-        status_map = {
-            '0': 'Не подключен',
-            '1': 'Подключен',
-            '2': 'Ошибка',
-        }
-        return status_map.get(str(status_code), 'Неизвестно')
+        result['dc_power'] = calculate_power(result['dc_charge_pile_voltage'], result['dc_charge_pile_current'])
+        result['discharge_power'] = calculate_power(result['discharge_voltage'], result['discharge_current'])
+        result['charger_state'] = describe_charger_state(
+            self.get_field('charger_state_code'),
+            self.get_code('charge_status'),
+            self.get_code('dc_charge_status'),
+            self.get_field('charger_time_to_full'),
+        )
 
     def estimate_battery_recovery(self) -> Dict[str, Any]:
         """
@@ -863,4 +577,123 @@ class VehicleDataParser:
             return "Выключена"  # Значение 1
 
         # Если пришло что-то странное (не 0 и не 1), покажем это
-        return f"Неизвестно (значение: {val_str})"
\ No newline at end of file
+        return f"Неизвестно (значение: {val_str})"
+
+
+# ==================== СНИМОК ДЛЯ СУЩНОСТЕЙ ====================
+
+
+class VehicleSnapshot:
+    """
+    Компактный снимок статуса автомобиля
+
+    Строится координатором один раз за цикл обновления. Каждое поле схемы
+    (vehicle_schema.FIELDS) хранится в отдельном слоте уже преобразованным:
+    числа и bool - как есть, перечисления - кодом ('0', '1', ...). Перевод
+    кода - label(), производные значения - свойства. Экземпляр без __dict__
+    занимает около килобайта, сущности читают поля как атрибуты.
+    """
+
+    __slots__ = tuple(FIELDS)
+
+    @classmethod
+    def from_status(cls, raw_data: Dict[str, Any]) -> 'VehicleSnapshot':
+        """Разбирает сырой vehicleStatus"""
+        return _build_snapshot(raw_data)
+
+    def label(self, name: str) -> str:
+        """Перевод кода поля-перечисления (например label('charge_status'))"""
+        return translate(name, getattr(self, name))
+
+    def __repr__(self) -> str:
+        return f"<VehicleSnapshot {self.vin}>"
+
+    # ==================== СОСТОЯНИЕ ====================
+
+    @property
+    def is_moving(self) -> bool:
+        """Едет ли автомобиль прямо сейчас"""
+        return self.speed > 0 and self.speed_validity
+
+    @property
+    def is_dc_charging(self) -> bool:
+        """Идет ли быстрая (DC) зарядка"""
+        return self.dc_charge_status in ('1', '2')
+
+    @property
+    def is_engine_running(self) -> bool:
+        """Работает ли двигатель"""
+        return self.engine_status == 'engine_running'
+
+    # ==================== ЗАРЯДКА ====================
+
+    @property
+    def dc_power(self) -> float:
+        """Мощность DC зарядки (кВт)"""
+        return calculate_power(self.dc_charge_pile_voltage, self.dc_charge_pile_current)
+
+    @property
+    def discharge_power(self) -> float:
+        """Мощность разрядки V2L/V2H (кВт)"""
+        return calculate_power(self.discharge_voltage, self.discharge_current)
+
+    @property
+    def charger_state(self) -> str:
+        """Состояние зарядного устройства с учетом контекста"""
+        return describe_charger_state(
+            self.charger_state_code, self.charge_status, self.dc_charge_status, self.charger_time_to_full)
+
+    # ==================== ОГНИ И ТОРМОЗА ====================
+
+    @property
+    def lights_status(self) -> str:
+        """Текстовое описание огней"""
+        return describe_lights(self.stop_lights, self.hi_beam_active, self.lo_beam_active, self.drl_active)
+
+    @property
+    def is_night_mode(self) -> bool:
+        return not self.drl_active and not self.hi_beam_active
+
+    @property
+    def is_recovering(self) -> bool:
+        """Идет ли рекуперация (торможение в движении)"""
+        return self.stop_lights and self.speed > 0
+
+    @property
+    def recovery_status(self) -> str:
+        return '⚡ ВОССТАНОВЛЕНИЕ ЭНЕРГИИ' if self.is_recovering else 'Нет восстановления'
+
+    # ==================== GPS ====================
+
+    @property
+    def has_gps_signal(self) -> bool:
+        return bool(self.latitude and self.longitude)
+
+    @property
+    def gps_status(self) -> str:
+        return '✅ GPS активен' if self.has_gps_signal else '❌ GPS потерян'
+
+    # ==================== ПРОЧЕЕ ====================
+
+    @property
+    def is_transparent(self) -> bool:
+        """Пропускает ли панорамная крыша много света"""
+        return self.front_shade_position > 50 or self.rear_shade_position > 50
+
+    @property
+    def ahbc_status(self) -> str:
+        """Статус AHBC (runningStatus.ahbc)"""
+        if self.ahbc is None:
+            return "Ошибка: ключ ahbc не найден"
+        if self.ahbc == '0':
+            return "Включена"
+        if self.ahbc == '1':
+            return "Выключена"
+        return f"Неизвестно (значение: {self.ahbc})"
+
+    def park_info(self) -> Dict[str, Any]:
+        """Информация о парковке (зависит от текущего времени)"""
+        return describe_park_time(self.park_time)
+
+
+_build_snapshot = compile_record('snapshot', VehicleSnapshot, VehicleSnapshot.__slots__)
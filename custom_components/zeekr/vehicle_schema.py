@@ -0,0 +1,625 @@
+# custom_components/zeekr/vehicle_schema.py
+"""
+Декларативная схема полей vehicleStatus
+
+Каждое поле описывается один раз: JSON путь, преобразование типа, значение
+по умолчанию и (для кодов) таблица перевода. При импорте из схемы
+собираются функции-аксессоры (ACCESSORS - по одному полю, COMPILED_SECTIONS -
+целый раздел), из которых VehicleDataParser собирает методы get_*_info.
+
+Некорректное значение одного поля (пустая строка вместо числа, дробь в
+целом поле) не ломает разбор: поле получает свое значение по умолчанию, а
+в DEBUG пишется имя поля и сырое значение.
+"""
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# ==================== ПРЕОБРАЗОВАНИЯ ====================
+
+
+def to_int(value: Any) -> int:
+    """'12.0' / '12.5' -> 12"""
+    return int(float(value))
+
+
+def to_bit(value: Any) -> bool:
+    """'0' / '1' -> bool"""
+    return bool(int(value))
+
+
+def to_flag(value: Any) -> bool:
+    """'true' / 'false' -> bool"""
+    return value == 'true'
+
+
+def to_int_or_zero(value: Any) -> int:
+    """Пустое значение -> 0"""
+    return to_int(value) if value else 0
+
+
+def to_coordinate(value: Any) -> Optional[float]:
+    """Координата в 1e-7 градуса -> градусы, пустое значение -> None"""
+    return float(value) / 1e7 if value else None
+
+
+def to_timestamp(value: Any) -> int:
+    """Метка времени в мс, пустое или битое значение -> 0"""
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def to_optional_str(value: Any) -> Optional[str]:
+    """Строка без пробелов, отсутствующее значение -> None"""
+    return None if value is None else str(value).strip()
+
+
+# ==================== ТАБЛИЦЫ КОДОВ ====================
+
+PROPULSION_TYPE = {
+    '0': 'Бензин',
+    '1': 'Дизель',
+    '2': 'Гибрид',
+    '3': 'Plug-in гибрид',
+    '4': 'Электро',
+}
+
+CHARGE_STATUS = {
+    '0': 'Не подключено',
+    '1': 'Подключено (ожидание)',
+    '2': 'Предзарядка',
+    '3': 'Зарядка завершена',
+    '4': 'Зарядка завершена',
+    '5': 'Приостановлено',
+}
+
+HV_TEMP_LEVEL = {
+    '0': 'Теплая 🔥',
+    '1': 'Немного холодная ❄️',
+    '2': 'Холодная 🥶',
+    '3': 'Сильно холодная 🧊',
+}
+
+DC_CHARGE_STATUS = {
+    '0': '❌ Не активна',
+    '1': '⚡ Активна (подключена)',
+    '2': '🔋 Зарядка в процессе',
+    '3': '✅ Зарядка завершена',
+    '4': '⏸️ Приостановлена',
+}
+
+DC_DC_STATUS = {
+    '0': '❌ Отключен',
+    '1': '🔄 Переход',
+    '2': '⚠️ Ошибка',
+    '3': '✅ Включен и работает',
+}
+
+CHARGE_CONNECTOR_STATUS = {
+    '0': 'Не подключен',
+    '1': 'Подключен',
+    '2': 'Ошибка',
+}
+
+LOCK_STATUS = {
+    '0': 'Неизвестно',
+    '1': 'Заблокировано',
+    '2': 'Разблокировано',
+}
+
+PARK_BRAKE_STATUS = {
+    '0': 'Выключено',
+    '1': 'Включено',
+    '2': 'Ошибка',
+}
+
+WINDOW_STATUS = {
+    '0': 'Открыто',
+    '1': 'Открывается',
+    '2': 'Закрыто',
+    '3': 'Закрывается',
+}
+
+WINDOW_REMINDER = {
+    '0': 'Нет напоминания',
+    '1': 'Окна приоткрыты',
+    '2': 'Окна открыты',
+    '3': 'Нужно закрыть окна',
+}
+
+HEATING_STATUS = {
+    '0': 'Выключено',
+    '1': 'Уровень 1',
+    '2': 'Уровень 2',
+    '3': 'Уровень 3',
+}
+
+FLUID_LEVEL = {
+    '0': 'Полный 🟢',
+    '1': 'Хороший 🟢',
+    '2': 'Нормально 🟢',
+    '3': 'Полный 🟢',
+}
+
+# Может быть инверсная логика у Zeekr
+WASHER_FLUID_LEVEL = {
+    '0': 'Полный ✅',
+    '1': 'Низкий 🔴',
+}
+
+SPEED_VALIDITY = {
+    'true': '✅ Достоверна',
+}
+
+GEAR_STATUS = {
+    '0': '❌ Выключена',
+    '1': '✅ Автоматическая включена',
+    '2': '🔧 Мануальная включена',
+    '3': '⏸️ Режим удержания / Нейтраль',
+}
+
+ENGINE_STATUS = {
+    'engine_running': 'engine_running',
+}
+
+STOP_LIGHT_STATUS = {
+    '0': '✅ Выключены (едет или свободно)',
+    '1': '🔴 ВКЛЮЧЕНЫ - ТОРМОЗИТ',
+}
+
+PM25_LEVEL = {
+    '0': 'Отличный 🟢',
+    '1': 'Хороший 🟢',
+    '2': 'Умеренный 🟡',
+    '3': 'Плохой 🟠',
+    '4': 'Очень плохой 🔴',
+    '5': 'Критичный 🚨',
+}
+
+# ==================== ОПИСАНИЕ ПОЛЯ ====================
+
+
+class Field(NamedTuple):
+    """
+    Поле vehicleStatus
+
+    path - путь через точку, convert - преобразование сырого значения,
+    default - сырое значение при отсутствии ключа. Если задан enum, результат
+    convert переводится по таблице, а при неизвестном коде используется
+    fallback (может содержать {code}).
+    """
+
+    path: str
+    convert: Callable[[Any], Any] = str
+    default: Any = 0
+    enum: Optional[Dict[str, str]] = None
+    fallback: str = 'Неизвестно'
+
+
+_BASIC = 'basicVehicleStatus'
+_POSITION = 'basicVehicleStatus.position'
+_EV = 'additionalVehicleStatus.electricVehicleStatus'
+_MAINTENANCE = 'additionalVehicleStatus.maintenanceStatus'
+_CLIMATE = 'additionalVehicleStatus.climateStatus'
+_SAFETY = 'additionalVehicleStatus.drivingSafetyStatus'
+_RUNNING = 'additionalVehicleStatus.runningStatus'
+_DRIVING = 'additionalVehicleStatus.drivingBehaviourStatus'
+_POLLUTION = 'additionalVehicleStatus.pollutionStatus'
+
+FIELDS: Dict[str, Field] = {
+    # ===== ОБЩЕЕ =====
+    'vin': Field('configuration.vin', default='N/A'),
+    'propulsion_type': Field('configuration.propulsionType', default='0', enum=PROPULSION_TYPE),
+    'update_time': Field('updateTime', int),
+    'park_time': Field('parkTime.status', to_timestamp, default=''),
+
+    # ===== ПОЛОЖЕНИЕ =====
+    'latitude': Field(f'{_POSITION}.latitude', to_coordinate, default=None),
+    'longitude': Field(f'{_POSITION}.longitude', to_coordinate, default=None),
+    'altitude': Field(f'{_POSITION}.altitude', to_int_or_zero),
+    'heading': Field(f'{_POSITION}.direction', to_int_or_zero),
+    'position_trusted': Field(f'{_POSITION}.posCanBeTrusted', to_flag, 'false'),
+    'location_upload_enabled': Field(f'{_POSITION}.carLocatorStatUploadEn', to_flag, 'false'),
+
+    # ===== БАТАРЕЯ =====
+    'battery_percentage': Field(f'{_EV}.chargeLevel', to_int),
+    'distance_to_empty': Field(f'{_EV}.distanceToEmptyOnBatteryOnly', to_int),
+    'charge_status': Field(f'{_EV}.chargeSts', default='0', enum=CHARGE_STATUS),
+    'avg_power_consumption': Field(f'{_EV}.averPowerConsumption', float),
+    'time_to_fully_charged': Field(f'{_EV}.timeToFullyCharged', to_int),
+    'aux_battery_percentage': Field(f'{_MAINTENANCE}.mainBatteryStatus.chargeLevel', float),
+    'aux_battery_voltage': Field(f'{_MAINTENANCE}.mainBatteryStatus.voltage', float),
+    'soc': Field(f'{_EV}.stateOfCharge', float),
+    'soh': Field(f'{_EV}.stateOfHealth', float),
+    'hv_temp_level': Field(f'{_EV}.hvTempLevel', default='0', enum=HV_TEMP_LEVEL),
+    'hv_temp_level_numeric': Field(f'{_EV}.hvTempLevel', to_int),
+
+    # ===== ЗАРЯДКА =====
+    'ac_voltage': Field(f'{_EV}.chargeUAct', float),
+    'ac_current': Field(f'{_EV}.chargeIAct', float),
+    'dc_charge_status': Field(f'{_EV}.dcChargeSts', default='0', enum=DC_CHARGE_STATUS,
+                              fallback='❓ Неизвестно ({code})'),
+    'dc_charge_pile_current': Field(f'{_EV}.dcChargePileIAct', float),
+    'dc_charge_pile_voltage': Field(f'{_EV}.dcChargePileUAct', float),
+    'dc_dc_activated': Field(f'{_EV}.dcDcActvd', to_bit),
+    'dc_dc_connect_status': Field(f'{_EV}.dcDcConnectStatus', default='0', enum=DC_DC_STATUS,
+                                  fallback='❓ Неизвестно ({code})'),
+    'discharge_voltage': Field(f'{_EV}.disChargeUAct', float),
+    'discharge_current': Field(f'{_EV}.disChargeIAct', float),
+    'discharge_connector_status': Field(f'{_EV}.disChargeConnectStatus', default='0',
+                                        enum=CHARGE_CONNECTOR_STATUS),
+    'charger_state_code': Field(f'{_EV}.chargerState', default='0'),
+    'charger_time_to_full': Field(f'{_EV}.timeToFullyCharged', to_int, default=2047),
+
+    # ===== КЛИМАТ =====
+    'interior_temp': Field(f'{_CLIMATE}.interiorTemp', float),
+    'exterior_temp': Field(f'{_CLIMATE}.exteriorTemp', float),
+    'cabin_temp_reduction_status': Field(f'{_CLIMATE}.cabinTempReductionStatus', bool),
+    'climate_over_heat_proactive': Field(f'{_CLIMATE}.climateOverHeatProActive', to_flag, 'false'),
+    'steering_wheel_heating': Field(f'{_CLIMATE}.steerWhlHeatingSts', default='0', enum=HEATING_STATUS),
+    'driver_heating': Field(f'{_CLIMATE}.drvHeatSts', default='0', enum=HEATING_STATUS),
+    'passenger_heating': Field(f'{_CLIMATE}.passHeatingSts', default='0', enum=HEATING_STATUS),
+    'front_shade_open': Field(f'{_CLIMATE}.sunroofOpenStatus', to_bit),
+    'front_shade_position': Field(f'{_CLIMATE}.sunroofPos', to_int),
+    'rear_shade_open': Field(f'{_CLIMATE}.curtainOpenStatus', to_bit),
+    'rear_shade_position': Field(f'{_CLIMATE}.curtainPos', to_int),
+    'air_blower_active': Field(f'{_CLIMATE}.airBlowerActive', to_flag, 'false'),
+    'defrost': Field(f'{_CLIMATE}.defrost', to_flag, 'false'),
+
+    # ===== ОКНА =====
+    'driver_window': Field(f'{_CLIMATE}.winStatusDriver', default='2', enum=WINDOW_STATUS),
+    'passenger_window': Field(f'{_CLIMATE}.winStatusPassenger', default='2', enum=WINDOW_STATUS),
+    'driver_rear_window': Field(f'{_CLIMATE}.winStatusDriverRear', default='2', enum=WINDOW_STATUS),
+    'passenger_rear_window': Field(f'{_CLIMATE}.winStatusPassengerRear', default='2', enum=WINDOW_STATUS),
+    'window_close_reminder': Field(f'{_CLIMATE}.winCloseReminder', default='0', enum=WINDOW_REMINDER),
+
+    # ===== ДВЕРИ И ЗАМКИ =====
+    'driver_door_open': Field(f'{_SAFETY}.doorOpenStatusDriver', to_bit),
+    'passenger_door_open': Field(f'{_SAFETY}.doorOpenStatusPassenger', to_bit),
+    'driver_rear_door_open': Field(f'{_SAFETY}.doorOpenStatusDriverRear', to_bit),
+    'passenger_rear_door_open': Field(f'{_SAFETY}.doorOpenStatusPassengerRear', to_bit),
+    'trunk_open': Field(f'{_SAFETY}.trunkOpenStatus', to_bit),
+    'engine_hood_open': Field(f'{_SAFETY}.engineHoodOpenStatus', to_bit),
+    'central_lock': Field(f'{_SAFETY}.centralLockingStatus', default='0', enum=LOCK_STATUS),
+    'driver_lock': Field(f'{_SAFETY}.doorLockStatusDriver', default='0', enum=LOCK_STATUS),
+    'passenger_lock': Field(f'{_SAFETY}.doorLockStatusPassenger', default='0', enum=LOCK_STATUS),
+    'driver_rear_lock': Field(f'{_SAFETY}.doorLockStatusDriverRear', default='0', enum=LOCK_STATUS),
+    'passenger_rear_lock': Field(f'{_SAFETY}.doorLockStatusPassengerRear', default='0', enum=LOCK_STATUS),
+    'trunk_lock': Field(f'{_SAFETY}.trunkLockStatus', default='0', enum=LOCK_STATUS),
+    'electric_park_brake': Field(f'{_SAFETY}.electricParkBrakeStatus', default='0', enum=PARK_BRAKE_STATUS),
+    'srs_crash_status': Field(f'{_SAFETY}.srsCrashStatus', to_bit),
+    'alarm_status': Field(f'{_SAFETY}.vehicleAlarm.alrmSt', default='0'),
+
+    # ===== ШИНЫ =====
+    'driver_tire': Field(f'{_MAINTENANCE}.tyreStatusDriver', float),
+    'passenger_tire': Field(f'{_MAINTENANCE}.tyreStatusPassenger', float),
+    'driver_rear_tire': Field(f'{_MAINTENANCE}.tyreStatusDriverRear', float),
+    'passenger_rear_tire': Field(f'{_MAINTENANCE}.tyreStatusPassengerRear', float),
+    'driver_temp': Field(f'{_MAINTENANCE}.tyreTempDriver', float),
+    'passenger_temp': Field(f'{_MAINTENANCE}.tyreTempPassenger', float),
+    'driver_rear_temp': Field(f'{_MAINTENANCE}.tyreTempDriverRear', float),
+    'passenger_rear_temp': Field(f'{_MAINTENANCE}.tyreTempPassengerRear', float),
+
+    # ===== ТО =====
+    'odometer': Field(f'{_MAINTENANCE}.odometer', float),
+    'days_to_service': Field(f'{_MAINTENANCE}.daysToService', to_int),
+    'distance_to_service': Field(f'{_MAINTENANCE}.distanceToService', to_int),
+    'engine_hours_to_service': Field(f'{_MAINTENANCE}.engineHrsToService', to_int),
+    'service_warning_status': Field(f'{_MAINTENANCE}.serviceWarningStatus', to_bit),
+    'brake_fluid_level': Field(f'{_MAINTENANCE}.brakeFluidLevelStatus', default='0', enum=FLUID_LEVEL,
+                               fallback='Уровень {code}'),
+    'washer_fluid_level': Field(f'{_MAINTENANCE}.washerFluidLevelStatus', default='0',
+                                enum=WASHER_FLUID_LEVEL, fallback='Уровень {code}'),
+    'engine_coolant_level': Field(f'{_MAINTENANCE}.engineCoolantLevelStatus', default='0', enum=FLUID_LEVEL,
+                                  fallback='Уровень {code}'),
+
+    # ===== ДВИЖЕНИЕ =====
+    'speed': Field(f'{_BASIC}.speed', float),
+    'speed_valid': Field(f'{_BASIC}.speedValidity', default='false', enum=SPEED_VALIDITY,
+                         fallback='⚠️ Недостоверна'),
+    'speed_validity': Field(f'{_BASIC}.speedValidity', to_flag, 'false'),
+    'avg_speed': Field(f'{_RUNNING}.avgSpeed', to_int),
+    'gear_auto': Field(f'{_DRIVING}.gearAutoStatus', to_int, enum=GEAR_STATUS),
+    'gear_auto_numeric': Field(f'{_DRIVING}.gearAutoStatus', to_int),
+    'engine_rpm': Field(f'{_DRIVING}.engineSpeed', float),
+    'engine_status': Field(f'{_BASIC}.engineStatus', default=None, enum=ENGINE_STATUS,
+                           fallback='engine_off'),
+    'direction': Field(f'{_BASIC}.direction', to_int_or_zero),
+    'trip_meter_1': Field(f'{_RUNNING}.tripMeter1', float),
+    'trip_meter_2': Field(f'{_RUNNING}.tripMeter2', float),
+
+    # ===== ОГНИ И ТОРМОЗА =====
+    'drl_active': Field(f'{_RUNNING}.drl', to_bit),
+    'hi_beam_active': Field(f'{_RUNNING}.hiBeam', to_bit),
+    'lo_beam_active': Field(f'{_RUNNING}.loBeam', to_bit),
+    'front_fog': Field(f'{_RUNNING}.frntFog', to_bit),
+    'rear_fog': Field(f'{_RUNNING}.reFog', to_bit),
+    'stop_lights': Field(f'{_RUNNING}.stopLi', to_bit),
+    'reverse_lights': Field(f'{_RUNNING}.reverseLi', to_bit),
+    'corner_lights': Field(f'{_RUNNING}.cornrgLi', to_bit),
+    'brake_status': Field(f'{_RUNNING}.stopLi', default='0', enum=STOP_LIGHT_STATUS),
+    'ahbc': Field(f'{_RUNNING}.ahbc', to_optional_str, default=None),
+
+    # ===== ЗАГРЯЗНЕНИЕ =====
+    'interior_pm25': Field(f'{_POLLUTION}.interiorPM25', to_int),
+    'interior_pm25_level': Field(f'{_POLLUTION}.interiorPM25Level', default='0', enum=PM25_LEVEL),
+    'exterior_pm25_level': Field(f'{_POLLUTION}.exteriorPM25Level', default='0', enum=PM25_LEVEL),
+    'relative_humidity': Field(f'{_POLLUTION}.relHumSts', to_int),
+}
+
+# Разделы: имя метода -> поля результата.
+# Элемент - имя поля из FIELDS или пара (ключ результата, имя поля)
+SECTIONS: Dict[str, Tuple[Any, ...]] = {
+    'get_battery_info': (
+        'battery_percentage', 'distance_to_empty', 'charge_status', 'avg_power_consumption',
+        'time_to_fully_charged', 'aux_battery_percentage', 'aux_battery_voltage', 'soc', 'soh',
+        'hv_temp_level', 'hv_temp_level_numeric',
+    ),
+    'get_ac_charging_info': ('ac_voltage', 'ac_current'),
+    'get_temperature_info': (
+        'interior_temp', 'exterior_temp', 'cabin_temp_reduction_status', 'climate_over_heat_proactive',
+    ),
+    'get_security_info': (
+        'driver_door_open', 'passenger_door_open', 'driver_rear_door_open', 'passenger_rear_door_open',
+        'trunk_open', 'engine_hood_open', 'central_lock', 'driver_lock', 'passenger_lock',
+        'driver_rear_lock', 'passenger_rear_lock', 'trunk_lock', 'electric_park_brake',
+        'srs_crash_status', 'alarm_status',
+    ),
+    'get_windows_info': (
+        'driver_window', 'passenger_window', 'driver_rear_window', 'passenger_rear_window',
+        'window_close_reminder', 'defrost',
+    ),
+    'get_climate_info': (
+        'interior_temp', 'exterior_temp', 'steering_wheel_heating', 'driver_heating', 'passenger_heating',
+        'front_shade_open', 'front_shade_position', 'rear_shade_open', 'rear_shade_position',
+        'air_blower_active', 'defrost',
+    ),
+    'get_tires_info': (
+        'driver_tire', 'passenger_tire', 'driver_rear_tire', 'passenger_rear_tire',
+        'driver_temp', 'passenger_temp', 'driver_rear_temp', 'passenger_rear_temp',
+    ),
+    'get_maintenance_info': (
+        'odometer', 'days_to_service', 'distance_to_service', 'engine_hours_to_service',
+        'service_warning_status', 'brake_fluid_level', 'washer_fluid_level', 'engine_coolant_level',
+    ),
+    'get_movement_info': (
+        'speed', 'speed_valid', 'avg_speed', ('speed_numeric', 'speed'), 'gear_auto', 'gear_auto_numeric',
+        'engine_rpm', 'engine_status', 'direction', 'trip_meter_1', 'trip_meter_2',
+        'drl_active', 'hi_beam_active', 'lo_beam_active',
+    ),
+    'get_brake_status': (
+        ('is_braking', 'stop_lights'), 'brake_status', ('stop_lights_on', 'stop_lights'),
+    ),
+    'get_lights_status': (
+        'drl_active', ('hi_beam', 'hi_beam_active'), ('lo_beam', 'lo_beam_active'), 'front_fog',
+        'rear_fog', 'stop_lights', 'reverse_lights', 'corner_lights',
+    ),
+    'get_pollution_info': (
+        'interior_pm25', 'interior_pm25_level', 'exterior_pm25_level', 'relative_humidity',
+    ),
+    'get_charging_info': (
+        'charge_status', ('charge_pile_voltage', 'dc_charge_pile_voltage'),
+        ('current_power_input', 'avg_power_consumption'), ('ac_charge_status', 'charge_status'),
+        'dc_charge_status', 'dc_charge_pile_current', 'dc_charge_pile_voltage', 'dc_dc_activated',
+        'dc_dc_connect_status', 'discharge_voltage', 'discharge_current', 'discharge_connector_status',
+        'time_to_fully_charged',
+    ),
+}
+
+# ==================== СБОРКА АКСЕССОРОВ ====================
+# Поля группируются по родительским разделам JSON: раздел достается один
+# раз, затем его поля читаются одним циклом по таблице (ключ результата,
+# ключ JSON, значение по умолчанию, преобразование, таблица перевода).
+
+_EMPTY: Dict[str, Any] = {}
+
+Accessor = Callable[[Dict[str, Any]], Any]
+
+
+class _Entry(NamedTuple):
+    """Поле в таблице раздела или снимка"""
+
+    key: str  # Ключ результата (атрибут снимка)
+    leaf: str  # Ключ поля в родительском разделе
+    default: Any
+    convert: Callable[[Any], Any]
+    enum: Optional[Dict[str, str]]  # None - без перевода
+    fallback: str
+    field: str  # Имя поля схемы (для журнала)
+    invalid: Any  # Результат convert при некорректном значении
+
+
+# Группа полей одного родительского раздела: (путь раздела, поля)
+_Group = Tuple[Tuple[str, ...], Tuple[_Entry, ...]]
+
+
+def _as_code(convert: Callable[[Any], Any]) -> Callable[[Any], str]:
+    """Преобразование поля-перечисления, возвращающее код строкой"""
+    if convert is str:
+        return str
+
+    def to_code(value: Any) -> str:
+        return str(convert(value))
+
+    return to_code
+
+
+def _parent_parts(field: Field) -> Tuple[str, ...]:
+    """Путь родительского раздела поля по частям"""
+    parent_path = field.path.rpartition('.')[0]
+    return tuple(parent_path.split('.')) if parent_path else ()
+
+
+def _entry(key: str, field_name: str, field: Field, code: bool) -> _Entry:
+    leaf = field.path.rpartition('.')[2]
+    convert = field.convert
+    enum = field.enum
+    if enum is not None and code:
+        convert = _as_code(convert)
+        enum = None
+    try:
+        invalid = convert(field.default)
+    except (ValueError, TypeError):
+        invalid = None
+    return _Entry(key, leaf, field.default, convert, enum, field.fallback, field_name, invalid)
+
+
+def _invalid(field_name: str, raw: Any, invalid: Any) -> Any:
+    """Значение поля, сырое значение которого не удалось преобразовать"""
+    _LOGGER.debug("⚠️ Field %s: invalid value %r, using %r", field_name, raw, invalid)
+    return invalid
+
+
+def _plan(items: Iterable[Tuple[str, str]], code: bool = False) -> Tuple[_Group, ...]:
+    """
+    Группирует поля по родительским разделам
+
+    Args:
+        items: Пары (ключ результата, имя поля)
+        code: Перечисления - кодом, без перевода
+    """
+    groups: Dict[Tuple[str, ...], List[_Entry]] = {}
+    for key, field_name in items:
+        field = FIELDS[field_name]
+        groups.setdefault(_parent_parts(field), []).append(_entry(key, field_name, field, code))
+    return tuple((parts, tuple(entries)) for parts, entries in groups.items())
+
+
+def _get_parent(data: Dict[str, Any], parts: Tuple[str, ...]) -> Dict[str, Any]:
+    """Родительский раздел (пустой dict, если его нет)"""
+    for part in parts:
+        data = data.get(part, _EMPTY)
+    return data
+
+
+def _value(entry: _Entry, section: Dict[str, Any]) -> Any:
+    """Значение поля из родительского раздела"""
+    raw = section.get(entry.leaf, entry.default)
+    try:
+        value = entry.convert(raw)
+    except (ValueError, TypeError):
+        value = _invalid(entry.field, raw, entry.invalid)
+    if entry.enum is None:
+        return value
+    code = str(value)
+    return entry.enum.get(code) or entry.fallback.format(code=code)
+
+
+def _compile_one(name: str, field: Field, code: bool) -> Accessor:
+    parts = _parent_parts(field)
+    entry = _entry(name, name, field, code)
+
+    def accessor(data: Dict[str, Any]) -> Any:
+        return _value(entry, _get_parent(data, parts))
+
+    accessor.__name__ = accessor.__qualname__ = f"{'code' if code else 'field'}_{name}"
+    return accessor
+
+
+def compile_field(name: str, field: Field) -> Accessor:
+    """Собирает функцию data -> значение поля"""
+    return _compile_one(name, field, code=False)
+
+
+def compile_code(name: str, field: Field) -> Accessor:
+    """Собирает функцию data -> код поля-перечисления (строка)"""
+    return _compile_one(name, field, code=True)
+
+
+def compile_section(name: str, items: Tuple[Any, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Собирает функцию раздела data -> dict
+
+    Args:
+        name: Имя раздела (для трассировок)
+        items: Имена полей или пары (ключ результата, имя поля)
+    """
+    pairs = [item if isinstance(item, tuple) else (item, item) for item in items]
+    keys = tuple(key for key, _ in pairs)
+    plan = _plan(pairs)
+
+    def section(data: Dict[str, Any]) -> Dict[str, Any]:
+        # Ключи заранее - порядок как в SECTIONS, а не по разделам JSON
+        result = dict.fromkeys(keys)
+        for parts, entries in plan:
+            get = _get_parent(data, parts).get
+            for key, leaf, default, convert, enum, fallback, field, invalid in entries:
+                raw = get(leaf, default)
+                try:
+                    value = convert(raw)
+                except (ValueError, TypeError):
+                    value = _invalid(field, raw, invalid)
+                if enum is not None:
+                    code = str(value)
+                    value = enum.get(code) or fallback.format(code=code)
+                result[key] = value
+        return result
+
+    section.__name__ = section.__qualname__ = name
+    return section
+
+
+def _setter(cls: type, key: str) -> Callable[[Any, Any], None]:
+    """Функция (instance, value) записи атрибута key"""
+    descriptor = getattr(cls, key, None)
+    if hasattr(descriptor, '__set__'):
+        return descriptor.__set__
+    return lambda instance, value: setattr(instance, key, value)
+
+
+def compile_record(name: str, cls: type, names: Iterable[str]) -> Callable[[Dict[str, Any]], Any]:
+    """
+    Собирает функцию data -> экземпляр cls с заполненными атрибутами
+
+    Экземпляр создается без вызова __init__, каждое поле присваивается
+    напрямую. Для полей-перечислений сохраняется код, а не перевод.
+    """
+    # Вместо setattr - дескрипторы __slots__ класса (или setattr для обычных атрибутов)
+    plan = tuple(
+        (parts, tuple(
+            (_setter(cls, entry.key), entry.leaf, entry.default, entry.convert, entry.field, entry.invalid)
+            for entry in entries
+        ))
+        for parts, entries in _plan(((field_name, field_name) for field_name in names), code=True)
+    )
+    new = object.__new__
+
+    def record(data: Dict[str, Any]) -> Any:
+        instance = new(cls)
+        for parts, entries in plan:
+            get = _get_parent(data, parts).get
+            for store, leaf, default, convert, field, invalid in entries:
+                raw = get(leaf, default)
+                try:
+                    value = convert(raw)
+                except (ValueError, TypeError):
+                    value = _invalid(field, raw, invalid)
+                store(instance, value)
+        return instance
+
+    record.__name__ = record.__qualname__ = name
+    return record
+
+
+def translate(name: str, code: str) -> str:
+    """Переводит код поля-перечисления по таблице схемы"""
+    field = FIELDS[name]
+    value = field.enum.get(code)
+    if value is None:
+        return field.fallback.format(code=code)
+    return value
+
+
+ACCESSORS: Dict[str, Accessor] = {name: compile_field(name, field) for name, field in FIELDS.items()}
+
+CODE_ACCESSORS: Dict[str, Accessor] = {
+    name: compile_code(name, field) for name, field in FIELDS.items() if field.enum is not None
+}
+
+COMPILED_SECTIONS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    name: compile_section(name, items) for name, items in SECTIONS.items()
+}
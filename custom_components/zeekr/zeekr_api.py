@@ -2,26 +2,68 @@
 """
 Работа с Zeekr API для получения данных об автомобилях
 """
-import requests
+import asyncio
+import time
+import aiohttp
 import json
-import uuid
-import hmac
-import hashlib
-import base64
 from typing import Optional, Dict, List, Tuple
-from datetime import datetime
 from urllib.parse import urlencode
 from .zeekr_config import (
-    BASE_URL_SECURE, HMAC_SECRET, APP_VERSION, PHONE_MODEL,
-    PHONE_VERSION, REQUEST_TIMEOUT
+    BASE_URL_SECURE, REQUEST_TIMEOUT, MAX_CONCURRENT_REQUESTS,
+    REFRESH_TOKEN_PATH, AUTH_ERROR_CODES, RATE_LIMIT_PER_MINUTE,
+    RATE_LIMIT_BURST,
 )
+from .zeekr_signer import ZeekrSigner, new_nonce, new_timestamp
 from .zeekr_storage import token_storage
+from .zeekr_token import ZeekrTokenManager
+from .zeekr_logging import get_logger
+from .zeekr_metrics import ApiMetrics
+from .zeekr_ratelimit import TokenBucket
+from .zeekr_retry import (
+    CircuitBreaker, RetryPolicy, ZeekrCircuitOpenError, is_transient_failure,
+)
+
+_LOGGER = get_logger(__name__)
+
+VEHICLES_PATH = '/device-platform/user/vehicle/secure'
+VEHICLE_STATUS_PATH = '/remote-control/vehicle/status/{vin}'
+
+# Повторы по endpoint. Статус опрашивается координатором регулярно, поэтому
+# повторяем его меньше - следующий цикл опроса и так скоро
+RETRY_POLICIES = {
+    VEHICLES_PATH: RetryPolicy(),
+    VEHICLE_STATUS_PATH: RetryPolicy(attempts=2),
+    REFRESH_TOKEN_PATH: RetryPolicy(),
+}
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# Endpoint с метриками и их короткие имена (для unique_id диагностических сенсоров)
+METRIC_ENDPOINTS = {
+    VEHICLES_PATH: 'vehicles',
+    VEHICLE_STATUS_PATH: 'vehicle_status',
+    REFRESH_TOKEN_PATH: 'token_refresh',
+}
+
+
+def is_auth_error(status: int, data: Optional[Dict]) -> bool:
+    """Проверяет, отклонил ли шлюз запрос из-за недействительного accessToken"""
+    if status in (401, 403):
+        return True
+    return isinstance(data, dict) and str(data.get('code')) in AUTH_ERROR_CODES
 
 
 class ZeekrAPI:
     """Класс для работы с Zeekr API (SECURE endpoint)"""
 
-    def __init__(self, access_token: str, user_id: str, client_id: str, device_id: str):
+    def __init__(self, access_token: str, user_id: str, client_id: str, device_id: str,
+                 async_session: Optional[aiohttp.ClientSession] = None,
+                 max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+                 refresh_token: Optional[str] = None,
+                 token_expires_at: Optional[float] = None,
+                 rate_limit_per_minute: float = RATE_LIMIT_PER_MINUTE,
+                 rate_limit_burst: int = RATE_LIMIT_BURST,
+                 base_url: Optional[str] = None,
+                 token_refresh: bool = False):
         """
         Инициализация API клиента
 
@@ -30,226 +72,350 @@ class ZeekrAPI:
             user_id: ID пользователя
             client_id: Client ID
             device_id: Device ID
+            async_session: Общая aiohttp сессия (в Home Assistant - async_get_clientsession)
+            max_concurrent_requests: Максимум одновременных запросов к шлюзу
+            refresh_token: refreshToken для обновления accessToken
+            token_expires_at: Время истечения accessToken (unix секунды), если известно
+            rate_limit_per_minute: Средний предел запросов к шлюзу в минуту
+            rate_limit_burst: Сколько запросов можно отправить подряд без ожидания
+            base_url: Адрес SECURE шлюза (по умолчанию BASE_URL_SECURE)
+            token_refresh: Обновлять accessToken запросом REFRESH_TOKEN_PATH. Путь не
+                подтвержден на реальном шлюзе - без опции истекший токен требует
+                повторного входа, а refreshToken никуда не отправляется
         """
-        self.access_token = access_token
+        self.tokens = ZeekrTokenManager(access_token, refresh_token, token_expires_at)
+        if token_refresh:
+            self.tokens.set_refresher(self._async_request_token_refresh)
         self.user_id = user_id
         self.client_id = client_id
         self.device_id = device_id
-        self.base_url = BASE_URL_SECURE
-        self.session = requests.Session()
-
-    def _calculate_signature(self, method: str, path: str, timestamp: str,
-                             nonce: str, body: str = '', query_string: str = '') -> str:
+        self.base_url = (base_url or BASE_URL_SECURE).rstrip('/')
+        self.signer = ZeekrSigner(device_id, client_id)
+        self.async_session = async_session
+        self.max_concurrent_requests = max(1, int(max_concurrent_requests))
+        # Общий лимит параллельных async запросов для всех вызывающих
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        # Один breaker на шлюз: при его сбое страдают все endpoint сразу
+        self.circuit = CircuitBreaker()
+        # Общий для всех вызывающих предел частоты запросов аккаунта
+        self.rate_limiter = TokenBucket(rate_limit_per_minute, rate_limit_burst)
+        # Одинаковые GET запросы в полете: (path, params) -> задача
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Задержки, коды ответов и объем по endpoint (диагностические сенсоры)
+        self.metrics = ApiMetrics(METRIC_ENDPOINTS)
+
+    @property
+    def access_token(self) -> str:
+        """Текущий accessToken (обновляется ZeekrTokenManager)"""
+        return self.tokens.access_token
+
+    def _build_get_request(self, path: str, params: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
         """
-        Рассчитывает подпись для SECURE API запроса
+        Готовит URL и подписанные заголовки для GET запроса
 
         Args:
-            method: HTTP метод (GET, POST, PUT и т.д.)
-            path: Путь к endpoint (например /remote-control/vehicle/status/VIN)
-            timestamp: Текущее время в миллисекундах
-            nonce: Уникальный UUID
-            body: Тело запроса (JSON строка)
-            query_string: Query параметры (отсортированные)
+            path: Путь к endpoint
+            params: Query параметры
 
         Returns:
-            Base64 кодированная подпись HMAC-SHA1
+            Кортеж (полный URL, заголовки)
         """
-        # Вычисляем MD5 хеш тела запроса (Base64 кодированный)
-        if body:
-            body_md5 = base64.b64encode(
-                hashlib.md5(body.encode()).digest()
-            ).decode()
-        else:
-            body_md5 = base64.b64encode(
-                hashlib.md5(b'').digest()
-            ).decode()
-
-        # Строим строку для подписи в определенном порядке
-        # Это очень важный порядок!
-        string_to_sign = '\n'.join([
-            'application/json;responseformat=3',
-            f'x-api-signature-nonce:{nonce}',
-            'x-api-signature-version:1.0',
-            '',
-            query_string,
-            body_md5,
-            timestamp,
-            method.upper(),
-            path,
-        ])
-
-        print(f"[DEBUG] String to sign:\n{string_to_sign}\n")
-
-        # Подписываем HMAC-SHA1
-        signature = base64.b64encode(
-            hmac.new(
-                HMAC_SECRET.encode(),
-                string_to_sign.encode(),
-                hashlib.sha1
-            ).digest()
-        ).decode()
-
-        return signature
-
-    def _get_headers(self, method: str, path: str, timestamp: str,
-                     nonce: str, body: str = '', query_string: str = '') -> Dict[str, str]:
-        """
-        Подготавливает заголовки для SECURE API запроса
+        timestamp = new_timestamp()
+        nonce = new_nonce()
+
+        # Сортируем параметры и создаем query string
+        query_string = urlencode(sorted(params.items()))
+
+        url = f"{self.base_url}{path}?{query_string}"
+        headers = self.signer.headers(
+            'GET', path, '', query_string, self.access_token, timestamp, nonce
+        )
+        return url, headers
+
+    def _build_post_request(self, path: str, body: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Готовит URL и подписанные заголовки для POST запроса с JSON телом
 
         Args:
-            method: HTTP метод
             path: Путь к endpoint
-            timestamp: Текущее время в миллисекундах
-            nonce: Уникальный UUID
-            body: Тело запроса
-            query_string: Query параметры
+            body: Тело запроса (JSON строка, подписывается как есть)
 
         Returns:
-            Словарь с заголовками
+            Кортеж (полный URL, заголовки)
         """
-        signature = self._calculate_signature(
-            method, path, timestamp, nonce, body, query_string
+        timestamp = new_timestamp()
+        nonce = new_nonce()
+
+        url = f"{self.base_url}{path}"
+        headers = self.signer.headers(
+            'POST', path, body, '', self.access_token, timestamp, nonce
         )
+        return url, headers
 
+    def _vehicles_params(self) -> Dict[str, str]:
+        """Query параметры для списка автомобилей"""
         return {
-            'content-type': 'application/json',
-            'x-api-signature-version': '1.0',
-            'x-app-id': 'ZEEKRAPP',
-            'user-agent': f'ZeekrLife/{APP_VERSION} (iPhone; iOS {PHONE_VERSION}; Scale/3.00)',
-            'x-device-model': 'iPhone',
-            'x-device-manufacture': 'Apple',
-            'x-agent-type': 'iOS',
-            'x-device-type': 'mobile',
-            'platform': 'NON-CMA',
-            'x-env-type': 'production',
-            'accept-language': 'zh-Hans-CN;q=1, en-CN;q=0.9',
-            'x-agent-version': PHONE_VERSION,
-            'accept': 'application/json;responseformat=3',
-            'x-device-brand': 'Apple',
-            'x-operator-code': 'ZEEKR',
-            'x-device-identifier': self.device_id,
-            'authorization': self.access_token,
-            'x-client-id': self.client_id,
-            'x-timestamp': timestamp,
-            'x-api-signature-nonce': nonce,
-            'x-signature': signature,
+            'id': self.user_id,
+            'needSharedCar': '1'
         }
 
-    def get_vehicles(self) -> Tuple[bool, Optional[List[str]]]:
+    def _status_params(self) -> Dict[str, str]:
+        """Query параметры для статуса автомобиля"""
+        return {
+            'latest': 'Local',
+            'target': 'basic,more',
+            'userId': self.user_id,
+        }
+
+    # ==================== ASYNC (aiohttp) ====================
+
+    async def _async_send(self, method: str, path: str, params: Optional[Dict[str, str]] = None,
+                          body: str = '', endpoint: Optional[str] = None) -> Tuple[int, Optional[Dict]]:
         """
-        Получает список VIN номеров автомобилей пользователя
+        Отправляет запрос с повторами по RetryPolicy endpoint
+
+        Повторяются только временные сбои (сеть, таймаут, 429, 5xx); они же
+        считаются circuit breaker. Пауза между попытками - вне семафора.
+
+        Args:
+            endpoint: Шаблон пути для выбора RetryPolicy (по умолчанию path)
 
         Returns:
-            Кортеж (успешность, список VIN или None)
+            Кортеж (HTTP статус, разобранный JSON или None); статус 0 - сетевая ошибка
+
+        Raises:
+            ZeekrCircuitOpenError: Шлюз недоступен, запрос не отправлялся
+        """
+        endpoint = endpoint or path
+        policy = RETRY_POLICIES.get(endpoint, DEFAULT_RETRY_POLICY)
+
+        for attempt in range(policy.attempts):
+            self.circuit.before_request()
+            try:
+                status, data = await self._async_send_once(method, path, params, body, endpoint)
+            except BaseException:
+                # Отмена (например, выгрузка интеграции) - не сбой шлюза
+                self.circuit.release_probe()
+                raise
+
+            if not is_transient_failure(status):
+                self.circuit.record_success()
+                return status, data
+
+            self.circuit.record_failure()
+            if attempt + 1 < policy.attempts:
+                delay = policy.delay(attempt)
+                _LOGGER.debug(
+                    "Retrying %s in %.1fs (attempt %d/%d)", path, delay, attempt + 2, policy.attempts
+                )
+                await asyncio.sleep(delay)
+
+        return status, data
+
+    async def _async_send_once(self, method: str, path: str, params: Optional[Dict[str, str]] = None,
+                               body: str = '', endpoint: Optional[str] = None) -> Tuple[int, Optional[Dict]]:
         """
-        print("\n🚗 Получаю список автомобилей...")
+        Подписывает и отправляет один запрос через aiohttp
 
-        timestamp = str(int(datetime.now().timestamp() * 1000))
-        nonce = str(uuid.uuid4()).upper()
+        Время подписи, задержка ответа, его размер и code записываются в
+        self.metrics под endpoint (по умолчанию path).
 
-        path = '/device-platform/user/vehicle/secure'
-        params = {
-            'id': self.user_id,
-            'needSharedCar': '1'
-        }
+        Returns:
+            Кортеж (HTTP статус, разобранный JSON или None); статус 0 - сетевая ошибка
+        """
+        if self.async_session is None:
+            raise RuntimeError("ZeekrAPI was created without an aiohttp session")
+
+        # Ждем токен до семафора, чтобы ожидание не занимало слот
+        await self.rate_limiter.acquire()
+
+        endpoint = endpoint or path
+        async with self._request_semaphore:
+            # Подписываем внутри семафора, чтобы timestamp не устарел в очереди
+            started = time.perf_counter()
+            if method == 'GET':
+                url, headers = self._build_get_request(path, params or {})
+            else:
+                url, headers = self._build_post_request(path, body)
+            sent = time.perf_counter()
+            self.metrics.record_signing(endpoint, sent - started)
+
+            status, data, size = 0, None, 0
+            try:
+                async with self.async_session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=body.encode() if body else None,
+                    timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                ) as response:
+                    raw = await response.read()
+                    size = len(raw)
+                    # Шлюз отвечает с content-type application/json;responseformat=3
+                    try:
+                        status, data = response.status, json.loads(raw) if raw.strip() else None
+                    except ValueError:
+                        if response.status not in (401, 403):
+                            raise
+                        status = response.status
+
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                _LOGGER.warning("Request to %s failed: %r", path, e)
+                status, data = 0, None
+
+            self.metrics.record_response(endpoint, time.perf_counter() - sent, status, data, size)
+            return status, data
+
+    async def _async_get_json(self, path: str, params: Dict[str, str],
+                              endpoint: Optional[str] = None) -> Optional[Dict]:
+        """
+        Выполняет GET запрос, объединяя его с таким же запросом в полете
 
-        # Сортируем параметры и создаем query string
-        query_string = urlencode(sorted(params.items()))
+        Кнопка обновления, нажатая во время опроса, дождется уже идущего
+        запроса, а не отправит второй. Результат общий - не изменяйте его.
 
-        url = f"{self.base_url}{path}?{query_string}"
+        Args:
+            path: Путь к endpoint
+            params: Query параметры
+            endpoint: Шаблон пути для выбора RetryPolicy (по умолчанию path)
 
-        try:
-            response = self.session.get(
-                url,
-                headers=self._get_headers('GET', path, timestamp, nonce, '', query_string),
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-
-            if data.get('code') == '1000':
-                vehicles = [v['vin'] for v in data.get('data', {}).get('list', [])]
-                print(f"✅ Найдено {len(vehicles)} автомобилей: {vehicles}")
-                return True, vehicles
-            else:
-                error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка получения автомобилей: {error_msg}")
-                return False, None
+        Returns:
+            Разобранный JSON ответа или None при сетевой ошибке
 
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при запросе: {e}")
-            return False, None
+        Raises:
+            ZeekrCircuitOpenError: Шлюз недоступен, запрос не отправлялся
+        """
+        key = (path, tuple(sorted(params.items())))
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._async_fetch_json(path, params, endpoint))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_inflight(key, done))
+        else:
+            _LOGGER.debug("Joining in-flight request to %s", path)
+
+        # shield: отмена одного вызывающего не отменяет запрос для остальных
+        return await asyncio.shield(task)
+
+    def _finish_inflight(self, key: Tuple, task: asyncio.Future) -> None:
+        """Убирает завершенный запрос из объединяемых"""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Забираем исключение, если все вызывающие уже отменились
+        if not task.cancelled():
+            task.exception()
 
-    def get_vehicle_status(self, vin: str) -> Tuple[bool, Optional[Dict]]:
+    async def _async_fetch_json(self, path: str, params: Dict[str, str],
+                                endpoint: Optional[str] = None) -> Optional[Dict]:
         """
-        Получает статус конкретного автомобиля
+        Выполняет подписанный GET запрос через aiohttp
+
+        Истекающий accessToken обновляется заранее; при отказе авторизации
+        токен обновляется и запрос повторяется один раз.
 
         Args:
-            vin: VIN номер автомобиля
+            path: Путь к endpoint
+            params: Query параметры
+            endpoint: Шаблон пути для выбора RetryPolicy (по умолчанию path)
 
         Returns:
-            Кортеж (успешность, словарь со статусом или None)
+            Разобранный JSON ответа или None при сетевой ошибке
+
+        Raises:
+            ZeekrCircuitOpenError: Шлюз недоступен, запрос не отправлялся
         """
-        print(f"\n📊 Получаю статус автомобиля {vin}...")
+        if self.tokens.needs_refresh():
+            await self.tokens.async_refresh()
 
-        timestamp = str(int(datetime.now().timestamp() * 1000))
-        nonce = str(uuid.uuid4()).upper()
+        token = self.access_token
+        status, data = await self._async_send('GET', path, params, endpoint=endpoint)
 
-        path = f'/remote-control/vehicle/status/{vin}'
-        params = {
-            'latest': 'Local',
-            'target': 'basic,more',
-            'userId': self.user_id,
-        }
+        if is_auth_error(status, data):
+            _LOGGER.info("🔑 Request to %s rejected as unauthorized, refreshing token", path)
+            # Обновление идет вне семафора - иначе при лимите 1 запрос ждал бы сам себя
+            if await self.tokens.async_refresh(stale_token=token):
+                status, data = await self._async_send('GET', path, params, endpoint=endpoint)
 
-        # Сортируем параметры и создаем query string
-        query_string = urlencode(sorted(params.items()))
+        # Повторы исчерпаны на 429/5xx - тело ошибки не бизнес-ответ шлюза
+        if is_transient_failure(status):
+            return None
+        return data
 
-        url = f"{self.base_url}{path}?{query_string}"
+    async def _async_request_token_refresh(self, refresh_token: str) -> Optional[Dict]:
+        """
+        Запрашивает новый accessToken по refreshToken
 
+        Returns:
+            data ответа (accessToken, refreshToken, expiresIn) или None
+        """
+        body = json.dumps({'refreshToken': refresh_token}, separators=(',', ':'))
         try:
-            response = self.session.get(
-                url,
-                headers=self._get_headers('GET', path, timestamp, nonce, '', query_string),
-                timeout=REQUEST_TIMEOUT
-            )
-
-            data = response.json()
-
-            if data.get('code') == '1000':
-                vehicle_status = data.get('data', {}).get('vehicleStatus', {})
-                print(f"✅ Статус получен для {vin}")
-                return True, vehicle_status
-            else:
-                error_msg = data.get('message', 'Неизвестная ошибка')
-                print(f"❌ Ошибка получения статуса: {error_msg} (код: {data.get('code')})")
-                return False, None
+            status, data = await self._async_send('POST', REFRESH_TOKEN_PATH, body=body)
+        except ZeekrCircuitOpenError as err:
+            _LOGGER.warning("Token refresh postponed: %s", err)
+            return None
 
-        except requests.exceptions.RequestException as e:
-            print(f"❌ Ошибка при запросе: {e}")
-            return False, None
+        if data and data.get('code') == '1000' and isinstance(data.get('data'), dict):
+            return data['data']
 
-    def get_all_vehicles_status(self) -> Tuple[bool, Optional[Dict[str, Dict]]]:
+        _LOGGER.warning(
+            "Token refresh rejected: %s (HTTP %s, code: %s)",
+            data.get('message') if data else None, status, data.get('code') if data else None,
+        )
+        return None
+
+    async def async_get_vehicles(self) -> Tuple[bool, Optional[List[str]]]:
         """
-        Получает статус всех автомобилей пользователя
+        Асинхронно получает список VIN номеров автомобилей пользователя
 
         Returns:
-            Кортеж (успешность, словарь {VIN: статус} или None)
+            Кортеж (успешность, список VIN или None)
+
+        Raises:
+            ZeekrCircuitOpenError: Шлюз недоступен, запрос не отправлялся
+        """
+        data = await self._async_get_json(VEHICLES_PATH, self._vehicles_params())
+        if data is None:
+            return False, None
+
+        if data.get('code') == '1000':
+            vehicles = [v['vin'] for v in data.get('data', {}).get('list', [])]
+            _LOGGER.debug("Found %d vehicles: %s", len(vehicles), vehicles)
+            return True, vehicles
+
+        _LOGGER.warning(
+            "Failed to fetch vehicle list: %s (code: %s)", data.get('message'), data.get('code')
+        )
+        return False, None
+
+    async def async_get_vehicle_status(self, vin: str) -> Tuple[bool, Optional[Dict]]:
         """
-        print("\n" + "=" * 50)
-        print("🔄 ПОЛУЧЕНИЕ СТАТУСА ВСЕХ АВТОМОБИЛЕЙ")
-        print("=" * 50)
+        Асинхронно получает статус конкретного автомобиля
+
+        Args:
+            vin: VIN номер автомобиля
 
-        # Сначала получаем список VIN
-        success, vehicles = self.get_vehicles()
-        if not success or not vehicles:
+        Returns:
+            Кортеж (успешность, словарь со статусом или None)
+
+        Raises:
+            ZeekrCircuitOpenError: Шлюз недоступен, запрос не отправлялся
+        """
+        data = await self._async_get_json(
+            VEHICLE_STATUS_PATH.format(vin=vin), self._status_params(), VEHICLE_STATUS_PATH
+        )
+        if data is None:
             return False, None
 
-        # Затем получаем статус каждого
-        all_status = {}
-        for vin in vehicles:
-            success, status = self.get_vehicle_status(vin)
-            if success and status:
-                all_status[vin] = status
+        if data.get('code') == '1000':
+            return True, data.get('data', {}).get('vehicleStatus', {})
 
-        return True, all_status if all_status else None
\ No newline at end of file
+        # Любой бизнес-отказ - обычная ошибка опроса с backoff. Коды "машина
+        # не привязана" шлюз не документирует, поэтому список VIN по ним не
+        # сбрасывается: отвязанная машина пропадает при плановом обновлении
+        # списка (VEHICLE_LIST_CACHE_TTL)
+        code = str(data.get('code'))
+        _LOGGER.warning(
+            "Failed to fetch status for %s: %s (code: %s)", vin, data.get('message'), code
+        )
+        return False, None
@@ -0,0 +1,273 @@
+# zeekr_archive.py
+"""
+Архив ответов шлюза: сжатые JSONL сегменты с ротацией
+
+Каждая запись - одна компактная JSON строка в сегменте
+zeekr_YYYYMMDD_NN.jsonl.gz. Новый сегмент начинается с новыми сутками,
+при превышении segment_max_bytes и при каждом запуске (дописывать в
+незакрытый gzip после сбоя нельзя). Старые сегменты удаляются по
+возрасту и общему размеру.
+
+Ответы машины (записи с _metadata.vin и data) хранятся по содержимому:
+- ключевой кадр: {"hash", "data"} - ответ целиком;
+- повтор: {"same": hash} - ответ совпал с предыдущим (машина спит);
+- дельта: {"hash", "base", "patch"} - JSON Patch от ключевого кадра base.
+Хэш - SHA-1 канонического JSON (ключи отсортированы). Каждый сегмент
+начинается с ключевых кадров и читается независимо (iter_responses).
+
+Все методы блокирующие - в Home Assistant вызываются через executor.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional
+
+from .zeekr_config import (
+    ARCHIVE_RETENTION_DAYS, ARCHIVE_MAX_TOTAL_BYTES, ARCHIVE_SEGMENT_MAX_BYTES,
+    ARCHIVE_DEDUP, ARCHIVE_DELTAS, ARCHIVE_KEYFRAME_INTERVAL,
+)
+from .status_diff import json_patch, apply_json_patch
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+SEGMENT_RE = re.compile(r'^zeekr_(\d{8})_(\d+)\.jsonl\.gz$')
+
+
+def read_segment(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Читает записи сегмента
+
+    Сегмент, не закрытый из-за сбоя, читается до последней сброшенной записи.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    # Незакрытый сегмент не имеет концевика gzip - разжимаем потоково
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    text = decompressor.decompress(raw).decode('utf-8', errors='replace')
+    for line in text.splitlines():
+        if line:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def content_hash(data: Any) -> str:
+    """SHA-1 канонического JSON (ключи отсортированы, без пробелов)"""
+    canonical = json.dumps(data, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def iter_responses(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Читает сегмент, восстанавливая ответы из повторов и дельт
+
+    Каждая запись возвращается в исходном виде {"_metadata", "data"}.
+    Ссылка на кадр, которого нет в сегменте (оборванная запись), пропускается.
+    """
+    keyframes: Dict[str, Any] = {}  # hash ключевого кадра -> data
+    last: Dict[str, Any] = {}  # vin -> (hash, data) последнего ответа
+
+    for record in read_segment(path):
+        metadata = record.get('_metadata', {})
+        vin = metadata.get('vin')
+
+        if 'same' in record:
+            previous = last.get(vin)
+            if previous is None or previous[0] != record['same']:
+                continue
+            data = previous[1]
+        elif 'patch' in record:
+            base = keyframes.get(record.get('base'))
+            if base is None:
+                continue
+            data = apply_json_patch(base, record['patch'])
+        elif 'data' in record:
+            data = record['data']
+            if 'hash' in record:
+                keyframes[record['hash']] = data
+        else:
+            continue
+
+        if vin is not None:
+            last[vin] = (record.get('hash', record.get('same')), data)
+        yield {'_metadata': metadata, 'data': data}
+
+
+class _VinState:
+    """Что архив помнит о последних ответах одной машины"""
+
+    __slots__ = ('last_hash', 'keyframe_hash', 'keyframe', 'deltas')
+
+    def __init__(self, keyframe_hash: str, keyframe: Any):
+        self.last_hash = keyframe_hash
+        self.keyframe_hash = keyframe_hash
+        self.keyframe = keyframe
+        self.deltas = 0
+
+
+class ResponseArchive:
+    """Пишет записи в сжатые суточные JSONL сегменты"""
+
+    def __init__(self, directory: str,
+                 retention_days: int = ARCHIVE_RETENTION_DAYS,
+                 max_total_bytes: int = ARCHIVE_MAX_TOTAL_BYTES,
+                 segment_max_bytes: int = ARCHIVE_SEGMENT_MAX_BYTES,
+                 dedup: bool = ARCHIVE_DEDUP,
+                 deltas: bool = ARCHIVE_DELTAS,
+                 keyframe_interval: int = ARCHIVE_KEYFRAME_INTERVAL):
+        """
+        Args:
+            directory: Папка архива (не должна раздаваться веб-сервером)
+            retention_days: Сколько суток хранить сегменты
+            max_total_bytes: Предел общего размера архива
+            segment_max_bytes: Размер сегмента, после которого начинается новый
+            dedup: Записывать повтор предыдущего ответа ссылкой на хэш
+            deltas: Записывать измененный ответ дельтой от ключевого кадра
+            keyframe_interval: Сколько дельт подряд до нового ключевого кадра
+        """
+        self.directory = directory
+        self.retention_days = retention_days
+        self.max_total_bytes = max_total_bytes
+        self.segment_max_bytes = segment_max_bytes
+        self.dedup = dedup
+        self.deltas = deltas
+        self.keyframe_interval = keyframe_interval
+
+        self._lock = threading.Lock()  # Записи приходят из разных потоков executor
+        self._file: Optional[gzip.GzipFile] = None
+        self._raw = None
+        self._day: Optional[str] = None
+        self.path: Optional[str] = None
+        self._vins: Dict[str, _VinState] = {}  # Сбрасывается с каждым сегментом
+
+    def segments(self) -> List[str]:
+        """Пути сегментов архива, от старых к новым"""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+
+        found = []
+        for name in names:
+            match = SEGMENT_RE.match(name)
+            if match:
+                found.append((match.group(1), int(match.group(2)), name))
+        return [os.path.join(self.directory, name) for _, _, name in sorted(found)]
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Дописывает запись (компактный JSON, одна строка)"""
+        self.append_many([record])
+
+    def append_many(self, records: List[Dict[str, Any]]) -> None:
+        """Дописывает пачку записей с одним сбросом сжатого потока"""
+        with self._lock:
+            for record in records:
+                day = datetime.now().strftime('%Y%m%d')
+                if self._file is None or day != self._day or self._raw.tell() >= self.segment_max_bytes:
+                    self._open_segment(day)
+
+                if self.dedup:
+                    record = self._compact(record)
+                line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+                self._file.write(line.encode('utf-8'))
+
+            # Сбрасываем сжатый поток, чтобы записи пережили аварийный останов
+            if self._file is not None:
+                self._file.flush()
+
+    def _compact(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Заменяет ответ машины ссылкой на хэш или дельтой, если это возможно"""
+        vin = record.get('_metadata', {}).get('vin')
+        data = record.get('data')
+        if vin is None or not isinstance(data, dict):
+            return record
+
+        digest = content_hash(data)
+        state = self._vins.get(vin)
+        metadata = record['_metadata']
+
+        if state is not None and digest == state.last_hash:
+            return {'_metadata': metadata, 'same': digest}
+
+        if self.deltas and state is not None and state.deltas < self.keyframe_interval:
+            patch = json_patch(state.keyframe, data)
+            # Дельта больше половины ответа не окупается - пишем новый кадр
+            if len(json.dumps(patch, ensure_ascii=False)) * 2 < len(json.dumps(data, ensure_ascii=False)):
+                state.last_hash = digest
+                state.deltas += 1
+                return {'_metadata': metadata, 'hash': digest, 'base': state.keyframe_hash, 'patch': patch}
+
+        # Ключевой кадр. data не копируется: координатор заменяет ответ целиком
+        self._vins[vin] = _VinState(digest, data)
+        return {'_metadata': metadata, 'hash': digest, 'data': data}
+
+    def close(self) -> None:
+        """Закрывает текущий сегмент"""
+        with self._lock:
+            self._close_segment()
+
+    def _open_segment(self, day: str) -> None:
+        self._close_segment()
+        self._vins.clear()
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Следующий свободный номер за сутки
+        taken = [
+            int(m.group(2)) for m in map(SEGMENT_RE.match, os.listdir(self.directory))
+            if m and m.group(1) == day
+        ]
+        number = max(taken, default=0) + 1
+
+        self.path = os.path.join(self.directory, f"zeekr_{day}_{number:02d}.jsonl.gz")
+        self._raw = open(self.path, 'wb')
+        self._file = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6)
+        self._day = day
+        _LOGGER.debug("Archive segment opened: %s", self.path)
+
+        self.prune()
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._raw.close()
+            self._file = self._raw = None
+
+    def prune(self) -> None:
+        """Удаляет сегменты старше retention_days и самые старые сверх max_total_bytes"""
+        cutoff = time.time() - self.retention_days * 86400
+        segments = [p for p in self.segments() if p != self.path]
+
+        sizes = {}
+        for path in segments:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if stat.st_mtime < cutoff:
+                self._remove(path)
+            else:
+                sizes[path] = stat.st_size
+
+        total = sum(sizes.values())
+        for path in [p for p in segments if p in sizes]:
+            if total <= self.max_total_bytes:
+                break
+            self._remove(path)
+            total -= sizes[path]
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+            _LOGGER.debug("Archive segment removed: %s", path)
+        except OSError as err:
+            _LOGGER.warning("Failed to remove archive segment %s: %s", path, err)
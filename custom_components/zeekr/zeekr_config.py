@@ -2,10 +2,13 @@
 """
 Конфигурация для Zeekr API интеграции
 """
+import os
 
 # ==================== API ENDPOINTS ====================
-BASE_URL_TOC = 'https://api-gw-toc.zeekrlife.com'  # Для аутентификации
-BASE_URL_SECURE = 'https://api.zeekrline.com'      # Для получения данных об авто
+# Переменные окружения ZEEKR_BASE_URL_TOC / ZEEKR_BASE_URL_SECURE направляют
+# запросы на другой шлюз, например tools/fake_gateway.py для нагрузочных тестов
+BASE_URL_TOC = os.environ.get('ZEEKR_BASE_URL_TOC', 'https://api-gw-toc.zeekrlife.com')  # Для аутентификации
+BASE_URL_SECURE = os.environ.get('ZEEKR_BASE_URL_SECURE', 'https://api.zeekrline.com')  # Для получения данных об авто
 YIKAT_AUTH_ENDPOINT = '/zeekrlife-mp-auth2/v1/auth/accessCodeList' # Для получения YIKAT
 
 # ==================== API KEYS ====================
@@ -22,9 +25,54 @@ APP_TYPE = 'IOS'
 # ==================== REQUEST SETTINGS ====================
 REQUEST_TIMEOUT = 30  # Таймаут для запросов в секундах
 REFRESH_INTERVAL = 1  # Интервал обновления статуса в минутах
-MAX_RETRIES = 3       # Максимум попыток переподключения
+MAX_RETRIES = 3       # Максимум попыток запроса при временных сбоях (включая первую)
+RETRY_BASE_DELAY = 1.0  # Пауза перед первым повтором, секунды (дальше x2 с jitter)
+RETRY_MAX_DELAY = 10.0  # Предел паузы между повторами, секунды
+CIRCUIT_FAILURE_THRESHOLD = 5  # Подряд неудачных запросов до размыкания circuit breaker
+CIRCUIT_RESET_TIMEOUT = 120  # Пауза до пробного запроса после размыкания, секунды
+MAX_CONCURRENT_REQUESTS = 4  # Максимум одновременных запросов к шлюзу на аккаунт
+RATE_LIMIT_PER_MINUTE = 30  # Средний предел запросов к шлюзу в минуту на аккаунт
+RATE_LIMIT_BURST = 10  # Сколько запросов можно отправить подряд без ожидания
+DEBUG_LOG_SAMPLE_RATE = 1  # Писать каждую N-ю DEBUG запись с одного места (1 - все)
+
+# ==================== METRICS ====================
+# Корзины гистограмм: границы от MIN до MAX, каждая в METRICS_BUCKET_FACTOR раз больше.
+# Ошибка оценки квантиля - не больше ширины корзины (~20%)
+METRICS_BUCKET_FACTOR = 1.2
+METRICS_LATENCY_MIN_MS = 5  # Задержка ответа шлюза
+METRICS_LATENCY_MAX_MS = REQUEST_TIMEOUT * 1000
+METRICS_SIGNING_MIN_MS = 0.005  # Подпись HMAC-SHA1 - микросекунды
+METRICS_SIGNING_MAX_MS = 50
+
+# ==================== TOKENS ====================
+# НЕ ПРОВЕРЕНО: путь обновления подобран по аналогии с auth/account/session/secure
+# и на реальном шлюзе не подтвержден. Поэтому обновление выключено по умолчанию
+# (опция token_refresh): без нее refreshToken никуда не отправляется, а истекший
+# accessToken требует повторного входа. С опцией после отказа повтор
+# откладывается (см. ниже)
+REFRESH_TOKEN_PATH = '/auth/account/session/refresh'  # Обновление accessToken по refreshToken (SECURE)
+TOKEN_REFRESH_MARGIN = 600  # Обновлять accessToken за N секунд до истечения
+# Пауза после неудачного обновления - до нее обновление не запрашивается ни
+# заранее, ни по отказу авторизации. Каждая следующая неудача удваивает паузу
+TOKEN_REFRESH_RETRY_DELAY = 300
+TOKEN_REFRESH_MAX_RETRY_DELAY = 3600
+# НЕ ПРОВЕРЕНО: коды ответа шлюза, означающие недействительный accessToken
+# (помимо HTTP 401/403). Предположение по аналогии с HTTP статусами, шлюз эти
+# коды не документирует - уточняйте по логам. Влияют только на обновление
+# токена (опция token_refresh): без нее такой ответ - обычная ошибка опроса
+AUTH_ERROR_CODES = ('401', '403')
 
 # ==================== STORAGE ====================
+ARCHIVE_DIR = 'zeekr_responses'  # Папка архива ответов в конфигурации HA (не www - она публичная)
+ARCHIVE_RETENTION_DAYS = 30  # Сколько суток хранить сегменты архива
+ARCHIVE_MAX_TOTAL_BYTES = 256 * 1024 * 1024  # Предел общего размера архива
+ARCHIVE_SEGMENT_MAX_BYTES = 16 * 1024 * 1024  # Размер сегмента до начала нового
+ARCHIVE_DEDUP = True  # Повтор ответа записывается ссылкой на хэш предыдущего
+ARCHIVE_DELTAS = True  # Измененный ответ записывается JSON Patch от последнего ключевого кадра
+ARCHIVE_KEYFRAME_INTERVAL = 120  # Дельт подряд до нового ключевого кадра
+HISTORY_DIR = 'zeekr_history'  # Папка колоночной истории числовых полей в конфигурации HA
+WRITE_FLUSH_INTERVAL = 30  # Как часто фоновая задача сбрасывает накопленные записи (секунды)
+WRITE_MAX_BATCH = 100  # Сколько записей накопить до досрочного сброса
 TOKENS_FILE = '../../../../Downloads/HA_ZeekrCH/V3/HA_ZeekrCH_v3/tokens.json'  # Файл для сохранения токенов
 
 # ==================== REGION ====================
@@ -0,0 +1,274 @@
+# zeekr_history.py
+"""
+История числовых полей автомобиля: колоночное хранилище только для дописывания
+
+Для каждого VIN - папка с колонками одинаковой длины:
+- ts.i64 - время ответа (updateTime, мс), int64;
+- <поле>.f64 - значение поля схемы (vehicle_schema.FIELDS), float64,
+  отсутствующее значение - NaN.
+Порядок байт - родной для платформы. Одна строка - один ответ с новым
+updateTime: повтор ответа спящей машины не пишется.
+
+Чтение - через mmap. Если установлен NumPy, read() возвращает numpy.memmap
+срезы (без копирования), иначе - array.array копии срезов.
+
+Все методы блокирующие - в Home Assistant вызываются через executor.
+"""
+import array
+import bisect
+import mmap
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .zeekr_logging import get_logger
+
+try:
+    import numpy as np
+except ImportError:  # NumPy не обязателен
+    np = None
+
+_LOGGER = get_logger(__name__)
+
+TIMESTAMP_COLUMN = 'ts'
+
+# Числовые поля снимка (VehicleSnapshot), которые пишутся в историю
+HISTORY_FIELDS: Tuple[str, ...] = (
+    # Батарея
+    'battery_percentage', 'soc', 'soh', 'distance_to_empty', 'avg_power_consumption',
+    'aux_battery_percentage', 'aux_battery_voltage', 'hv_temp_level_numeric',
+    # Зарядка и разрядка
+    'ac_voltage', 'ac_current', 'dc_charge_pile_voltage', 'dc_charge_pile_current',
+    'discharge_voltage', 'discharge_current', 'time_to_fully_charged',
+    # Шины
+    'driver_tire', 'passenger_tire', 'driver_rear_tire', 'passenger_rear_tire',
+    'driver_temp', 'passenger_temp', 'driver_rear_temp', 'passenger_rear_temp',
+    # Положение и движение
+    'latitude', 'longitude', 'altitude', 'heading', 'speed', 'odometer',
+    'trip_meter_1', 'trip_meter_2',
+    # Климат
+    'interior_temp', 'exterior_temp', 'interior_pm25', 'relative_humidity',
+)
+
+_TS_TYPE = 'q'  # int64
+_VALUE_TYPE = 'd'  # float64
+_NAN = float('nan')
+
+
+def _column_file(directory: str, name: str) -> str:
+    suffix = 'i64' if name == TIMESTAMP_COLUMN else 'f64'
+    return os.path.join(directory, f"{name}.{suffix}")
+
+
+def _to_float(value: Any) -> float:
+    try:
+        return _NAN if value is None else float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+def _map(path: str) -> Optional[mmap.mmap]:
+    """Отображает файл в память только для чтения (None - файла нет или он пуст)"""
+    try:
+        with open(path, 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _array_from(typecode: str, data: bytes) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(data)
+    return values
+
+
+class VehicleHistory:
+    """Колонки одного автомобиля"""
+
+    def __init__(self, directory: str, fields: Iterable[str] = HISTORY_FIELDS):
+        """
+        Args:
+            directory: Папка колонок автомобиля
+            fields: Поля снимка, которые записываются
+        """
+        self.directory = directory
+        self.fields = tuple(fields)
+        self._lock = threading.Lock()
+        self._rows: Optional[int] = None  # Длина колонок (после проверки)
+        self._last_ts: Optional[int] = None
+
+    def _recover(self) -> None:
+        """
+        Выравнивает колонки по ts.i64 после аварийного останова
+
+        ts дописывается последним, поэтому строка считается записанной,
+        только если записано ее время. Хвосты длиннее ts обрезаются,
+        короткие (новое поле) дополняются NaN.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        ts_path = _column_file(self.directory, TIMESTAMP_COLUMN)
+        size = os.path.getsize(ts_path) if os.path.exists(ts_path) else 0
+        rows = size // 8
+        if size != rows * 8:
+            os.truncate(ts_path, rows * 8)
+
+        for name in self.fields:
+            path = _column_file(self.directory, name)
+            length = os.path.getsize(path) // 8 if os.path.exists(path) else 0
+            if length > rows:
+                os.truncate(path, rows * 8)
+            elif length < rows:
+                with open(path, 'ab') as f:
+                    f.write(array.array(_VALUE_TYPE, [_NAN]).tobytes() * (rows - length))
+
+        self._rows = rows
+        self._last_ts = None
+        if rows:
+            with open(ts_path, 'rb') as f:
+                f.seek((rows - 1) * 8)
+                self._last_ts = array.array(_TS_TYPE, f.read(8))[0]
+
+    @property
+    def rows(self) -> int:
+        """Сколько строк записано"""
+        with self._lock:
+            if self._rows is None:
+                self._recover()
+            return self._rows
+
+    def append(self, timestamp: int, values: Dict[str, Any]) -> bool:
+        """
+        Дописывает строку
+
+        Args:
+            timestamp: Время ответа (мс)
+            values: Значения полей (отсутствующие и нечисловые - NaN)
+
+        Returns:
+            False, если время не новее последней строки (строка не записана)
+        """
+        with self._lock:
+            if self._rows is None:
+                self._recover()
+            if self._last_ts is not None and timestamp <= self._last_ts:
+                return False
+
+            for name in self.fields:
+                with open(_column_file(self.directory, name), 'ab') as f:
+                    f.write(array.array(_VALUE_TYPE, [_to_float(values.get(name))]).tobytes())
+            with open(_column_file(self.directory, TIMESTAMP_COLUMN), 'ab') as f:
+                f.write(array.array(_TS_TYPE, [timestamp]).tobytes())
+
+            self._rows += 1
+            self._last_ts = timestamp
+            return True
+
+    def read(self, fields: Optional[Iterable[str]] = None,
+             start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Читает колонки за интервал [start, end) по времени (мс)
+
+        Args:
+            fields: Поля (по умолчанию - все)
+            start: Начало интервала (включительно)
+            end: Конец интервала (не включительно)
+
+        Returns:
+            {'ts': ..., поле: ...} - numpy массивы (memmap) или array.array
+        """
+        rows = self.rows
+        fields = self.fields if fields is None else tuple(fields)
+        if np is not None:
+            return self._read_numpy(fields, rows, start, end)
+
+        ts_map = _map(_column_file(self.directory, TIMESTAMP_COLUMN))
+        if ts_map is None:
+            result = {name: array.array(_VALUE_TYPE) for name in fields}
+            result[TIMESTAMP_COLUMN] = array.array(_TS_TYPE)
+            return result
+
+        with ts_map, memoryview(ts_map) as raw, raw[:rows * 8].cast(_TS_TYPE) as ts_view:
+            lo = 0 if start is None else bisect.bisect_left(ts_view, start)
+            hi = rows if end is None else bisect.bisect_left(ts_view, end)
+            result = {TIMESTAMP_COLUMN: _array_from(_TS_TYPE, raw[lo * 8:hi * 8])}
+
+        for name in fields:
+            column = _map(_column_file(self.directory, name))
+            if column is None:
+                result[name] = array.array(_VALUE_TYPE, [_NAN]) * (hi - lo)
+                continue
+            with column:
+                result[name] = _array_from(_VALUE_TYPE, column[lo * 8:hi * 8])
+        return result
+
+    def _read_numpy(self, fields: Tuple[str, ...], rows: int,
+                    start: Optional[int], end: Optional[int]) -> Dict[str, Any]:
+        """read() через numpy.memmap: срезы без копирования"""
+        if not rows:
+            return {TIMESTAMP_COLUMN: np.empty(0, np.int64), **{name: np.empty(0) for name in fields}}
+
+        ts = np.memmap(_column_file(self.directory, TIMESTAMP_COLUMN), np.int64, 'r', shape=(rows,))
+        lo = 0 if start is None else int(np.searchsorted(ts, start, 'left'))
+        hi = rows if end is None else int(np.searchsorted(ts, end, 'left'))
+
+        result = {TIMESTAMP_COLUMN: ts[lo:hi]}
+        for name in fields:
+            path = _column_file(self.directory, name)
+            if os.path.exists(path):
+                result[name] = np.memmap(path, np.float64, 'r', shape=(rows,))[lo:hi]
+            else:
+                result[name] = np.full(hi - lo, np.nan)
+        return result
+
+
+class HistoryStore:
+    """История всех автомобилей аккаунта: папка на VIN"""
+
+    def __init__(self, directory: str, fields: Iterable[str] = HISTORY_FIELDS):
+        """
+        Args:
+            directory: Корневая папка истории
+            fields: Поля снимка, которые записываются
+        """
+        self.directory = directory
+        self.fields = tuple(fields)
+        self._vehicles: Dict[str, VehicleHistory] = {}
+        self._lock = threading.Lock()
+
+    def vehicle(self, vin: str) -> VehicleHistory:
+        """Колонки автомобиля (создаются при первой записи)"""
+        with self._lock:
+            history = self._vehicles.get(vin)
+            if history is None:
+                history = self._vehicles[vin] = VehicleHistory(
+                    os.path.join(self.directory, vin), self.fields
+                )
+            return history
+
+    def append_snapshot(self, vin: str, snapshot: Any, fetched_at: float) -> bool:
+        """
+        Дописывает числовые поля снимка
+
+        Время строки - updateTime ответа, а если его нет - время получения.
+        Повтор ответа с тем же updateTime не пишется.
+        """
+        timestamp = snapshot.update_time or int(fetched_at * 1000)
+        values = {name: getattr(snapshot, name, None) for name in self.fields}
+        written = self.vehicle(vin).append(timestamp, values)
+        if written:
+            _LOGGER.debug("History row written for %s at %s", vin, timestamp)
+        return written
+
+    def append_many(self, rows: List[Tuple[str, Any, float]]) -> int:
+        """
+        Дописывает пачку снимков (vin, snapshot, fetched_at)
+
+        Returns:
+            Сколько строк записано
+        """
+        return sum(self.append_snapshot(vin, snapshot, fetched_at) for vin, snapshot, fetched_at in rows)
+
+    def read(self, vin: str, fields: Optional[Iterable[str]] = None,
+             start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, Any]:
+        """Колонки автомобиля за интервал (см. VehicleHistory.read)"""
+        return self.vehicle(vin).read(fields, start, end)
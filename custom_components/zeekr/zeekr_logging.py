@@ -0,0 +1,49 @@
+# zeekr_logging.py
+"""
+Логгеры модулей интеграции с выборочной отладкой
+
+Горячие пути (подпись, опрос, парсер) пишут DEBUG на каждом запросе.
+При sample_rate = N из DEBUG записей каждой строки кода проходит только
+каждая N-я; INFO и выше проходят всегда. Пока DEBUG для логгера выключен,
+записи не создаются вовсе - форматирование ленивое (%-аргументы).
+"""
+import logging
+from typing import Dict, Tuple
+
+from .zeekr_config import DEBUG_LOG_SAMPLE_RATE
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Пропускает каждую N-ю DEBUG запись с одного и того же места в коде"""
+
+    def __init__(self, sample_rate: int = DEBUG_LOG_SAMPLE_RATE):
+        super().__init__()
+        self.sample_rate = max(1, int(sample_rate))
+        self._counters: Dict[Tuple[str, int], int] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG or self.sample_rate == 1:
+            return True
+
+        # Гонка между потоками executor только сдвигает выборку - не страшно
+        key = (record.pathname, record.lineno)
+        count = self._counters.get(key, 0)
+        self._counters[key] = count + 1
+        return count % self.sample_rate == 0
+
+
+_debug_filter = DebugSamplingFilter()
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Логгер модуля с общим фильтром выборки DEBUG"""
+    logger = logging.getLogger(name)
+    if _debug_filter not in logger.filters:
+        logger.addFilter(_debug_filter)
+    return logger
+
+
+def set_debug_sample_rate(sample_rate: int) -> None:
+    """Задает выборку DEBUG записей: 1 - все, N - каждая N-я с каждой строки"""
+    _debug_filter.sample_rate = max(1, int(sample_rate))
+    _debug_filter._counters.clear()
@@ -0,0 +1,203 @@
+# zeekr_metrics.py
+"""
+Метрики запросов к шлюзу Zeekr
+
+ZeekrAPI записывает сюда каждую попытку HTTP запроса: задержку, HTTP статус
+и code ответа шлюза, размер тела и время подписи. Задержки хранятся в
+гистограмме с фиксированными логарифмическими корзинами - память не растет
+с числом запросов, а p50/p95/p99 оцениваются интерполяцией внутри корзины.
+
+Метрики читают диагностические сенсоры и выгрузка диагностики HA.
+"""
+import bisect
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from .zeekr_config import (
+    METRICS_LATENCY_MIN_MS, METRICS_LATENCY_MAX_MS, METRICS_SIGNING_MIN_MS,
+    METRICS_SIGNING_MAX_MS, METRICS_BUCKET_FACTOR,
+)
+
+CODE_SUCCESS = '1000'
+CODE_NETWORK_ERROR = 'network'  # Ответа нет: таймаут, обрыв соединения, нечитаемое тело
+
+
+def geometric_bounds(low: float, high: float, factor: float = METRICS_BUCKET_FACTOR) -> List[float]:
+    """Верхние границы корзин от low до high (каждая в factor раз больше)"""
+    bounds = [float(low)]
+    while bounds[-1] < high:
+        bounds.append(bounds[-1] * factor)
+    return bounds
+
+
+class Histogram:
+    """
+    Гистограмма с фиксированными корзинами
+
+    Значения больше последней границы попадают в корзину переполнения,
+    для нее квантиль оценивается максимумом.
+    """
+
+    def __init__(self, bounds: Iterable[float]):
+        self.bounds = sorted(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Оценка квантиля q (0..1); None - значений еще нет"""
+        if not self.count:
+            return None
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if not count or seen + count < rank:
+                seen += count
+                continue
+            if index == len(self.bounds):
+                return self.max
+            lower = self.bounds[index - 1] if index else 0.0
+            upper = self.bounds[index]
+            value = lower + (upper - lower) * (rank - seen) / count
+            return min(value, self.max)
+        return self.max
+
+    def summary(self, digits: int = 1) -> Dict[str, Any]:
+        """p50/p95/p99, среднее, максимум и число значений"""
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, digits)
+
+        return {
+            'p50': rounded(self.quantile(0.50)),
+            'p95': rounded(self.quantile(0.95)),
+            'p99': rounded(self.quantile(0.99)),
+            'mean': rounded(self.mean),
+            'max': rounded(self.max if self.count else None),
+            'samples': self.count,
+        }
+
+
+class EndpointMetrics:
+    """Счетчики одного endpoint (шаблона пути)"""
+
+    def __init__(self):
+        self.latency = Histogram(geometric_bounds(METRICS_LATENCY_MIN_MS, METRICS_LATENCY_MAX_MS))
+        self.signing = Histogram(geometric_bounds(METRICS_SIGNING_MIN_MS, METRICS_SIGNING_MAX_MS))
+        self.requests = 0
+        self.successes = 0
+        self.codes: Counter = Counter()  # code шлюза (или http_<статус> / network) -> число ответов
+        self.bytes_received = 0
+        self.last_error: Optional[str] = None
+        self.last_error_at: Optional[float] = None
+
+    @property
+    def errors(self) -> int:
+        return self.requests - self.successes
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'requests': self.requests,
+            'successes': self.successes,
+            'errors': self.errors,
+            'codes': dict(self.codes),
+            'bytes_received': self.bytes_received,
+            'latency_ms': self.latency.summary(),
+            'signing_ms': self.signing.summary(3),
+            'last_error': self.last_error,
+            'last_error_at': self.last_error_at,
+        }
+
+
+def response_code(status: int, data: Any) -> str:
+    """Код исхода запроса: code шлюза, http_<статус> без тела или network"""
+    if status == 0:
+        return CODE_NETWORK_ERROR
+    if isinstance(data, dict) and data.get('code') is not None:
+        return str(data['code'])
+    return f"http_{status}"
+
+
+class ApiMetrics:
+    """Метрики всех endpoint одного API клиента"""
+
+    def __init__(self, endpoints: Iterable[str] = ()):
+        """
+        Args:
+            endpoints: Шаблоны путей, для которых счетчики нужны сразу
+                (сенсоры создаются до первого запроса)
+        """
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        for endpoint in endpoints:
+            self.endpoint(endpoint)
+        self.started_at = time.time()
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        metrics = self.endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self.endpoints[endpoint] = EndpointMetrics()
+        return metrics
+
+    def record_signing(self, endpoint: str, seconds: float) -> None:
+        self.endpoint(endpoint).signing.record(seconds * 1000)
+
+    def record_response(self, endpoint: str, seconds: float, status: int, data: Any,
+                        size: int = 0) -> None:
+        """
+        Учитывает одну попытку запроса
+
+        Args:
+            endpoint: Шаблон пути
+            seconds: Время от отправки до прочитанного тела
+            status: HTTP статус (0 - ответа нет)
+            data: Разобранный JSON ответа
+            size: Размер тела ответа, байты
+        """
+        metrics = self.endpoint(endpoint)
+        code = response_code(status, data)
+        metrics.requests += 1
+        metrics.codes[code] += 1
+        metrics.bytes_received += size
+        metrics.latency.record(seconds * 1000)
+        if status == 200 and code == CODE_SUCCESS:
+            metrics.successes += 1
+        else:
+            metrics.last_error = code
+            metrics.last_error_at = time.time()
+
+    @property
+    def bytes_received(self) -> int:
+        return sum(metrics.bytes_received for metrics in self.endpoints.values())
+
+    def signing_summary(self) -> Dict[str, Any]:
+        """Время подписи по всем endpoint"""
+        merged = None
+        for metrics in self.endpoints.values():
+            if merged is None:
+                merged = Histogram(metrics.signing.bounds)
+            merged.counts = [a + b for a, b in zip(merged.counts, metrics.signing.counts)]
+            merged.count += metrics.signing.count
+            merged.total += metrics.signing.total
+            merged.max = max(merged.max, metrics.signing.max)
+        return (merged or Histogram(())).summary(3)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'since': self.started_at,
+            'bytes_received': self.bytes_received,
+            'signing_ms': self.signing_summary(),
+            'endpoints': {endpoint: metrics.as_dict() for endpoint, metrics in self.endpoints.items()},
+        }
@@ -0,0 +1,123 @@
+# zeekr_profiler.py
+"""
+Профилирование циклов обновления координаторов
+
+Включается опцией интеграции. Каждый цикл (обновление списка VIN или
+статуса одной машины) записывает время фаз:
+- vin_list - запрос списка VIN (или ответ из кэша);
+- fetch - запрос статуса, включая ожидание предела частоты и повторы;
+- parse - VehicleSnapshot.from_status;
+- diff - поиск изменившихся JSON путей;
+- storage - постановка в очередь кэша, архива и истории;
+- listeners - оповещение сущностей (запись состояний в HA).
+
+fetch и vin_list - в основном ожидание сети; остальные фазы синхронные и
+целиком занимают event loop. Последние max_cycles циклов хранятся в
+кольцевом буфере, сервис zeekr.dump_profile выгружает их со сводкой.
+"""
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+# Пустой контекст для фаз вне профилируемого цикла - без накладных расходов
+NULL_PHASE = nullcontext()
+
+
+class ProfiledCycle:
+    """Один цикл обновления: время фаз и счетчики"""
+
+    __slots__ = ('kind', 'vin', 'started_at', '_start', 'phases', 'counts', 'total_ms', 'success')
+
+    def __init__(self, kind: str, vin: Optional[str] = None):
+        self.kind = kind
+        self.vin = vin
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.phases: Dict[str, float] = {}  # фаза -> мс (повторные входы суммируются)
+        self.counts: Dict[str, int] = {}
+        self.total_ms: Optional[float] = None
+        self.success: Optional[bool] = None
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+    def count(self, name: str, value: int = 1) -> None:
+        self.counts[name] = self.counts.get(name, 0) + value
+
+    def finish(self, success: bool) -> None:
+        self.total_ms = (time.perf_counter() - self._start) * 1000
+        self.success = success
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'kind': self.kind,
+            'vin': self.vin,
+            'started_at': self.started_at,
+            'total_ms': round(self.total_ms, 3) if self.total_ms is not None else None,
+            'success': self.success,
+            'phases': {name: round(ms, 3) for name, ms in self.phases.items()},
+            'counts': dict(self.counts),
+        }
+
+
+def _quantile(values: List[float], q: float) -> float:
+    """Квантиль отсортированного списка (ближайший ранг)"""
+    return values[min(len(values) - 1, int(q * len(values)))]
+
+
+class CycleProfiler:
+    """Кольцевой буфер последних циклов всех координаторов аккаунта"""
+
+    def __init__(self, max_cycles: int):
+        self.cycles: deque = deque(maxlen=max(1, int(max_cycles)))
+        self.started_at = time.time()
+        self.recorded = 0  # Всего циклов с момента включения (в буфере - последние)
+
+    def start(self, kind: str, vin: Optional[str] = None) -> ProfiledCycle:
+        return ProfiledCycle(kind, vin)
+
+    def finish(self, cycle: ProfiledCycle, success: bool) -> None:
+        cycle.finish(success)
+        self.cycles.append(cycle)
+        self.recorded += 1
+
+    def clear(self) -> None:
+        self.cycles.clear()
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """p50/p95/max и сумма по фазам, отдельно для каждого вида цикла"""
+        samples: Dict[str, Dict[str, List[float]]] = {}
+        for cycle in self.cycles:
+            phases = samples.setdefault(cycle.kind, {})
+            phases.setdefault('total', []).append(cycle.total_ms)
+            for name, ms in cycle.phases.items():
+                phases.setdefault(name, []).append(ms)
+
+        result = {}
+        for kind, phases in samples.items():
+            result[kind] = {}
+            for name, values in phases.items():
+                values.sort()
+                result[kind][name] = {
+                    'samples': len(values),
+                    'p50': round(_quantile(values, 0.50), 3),
+                    'p95': round(_quantile(values, 0.95), 3),
+                    'max': round(values[-1], 3),
+                    'sum': round(sum(values), 3),
+                }
+        return result
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'since': self.started_at,
+            'recorded': self.recorded,
+            'buffered': len(self.cycles),
+            'summary': self.summary(),
+            'cycles': [cycle.as_dict() for cycle in self.cycles],
+        }
@@ -0,0 +1,65 @@
+# zeekr_ratelimit.py
+"""
+Ограничение частоты запросов к шлюзу Zeekr (token bucket)
+
+Один TokenBucket на аккаунт (ZeekrAPI) - его делят таймеры координаторов,
+кнопки обновления и сервисы. Запрос ждет, пока в ведре не появится токен.
+"""
+import asyncio
+import time
+
+from .zeekr_config import RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket: capacity токенов, пополнение rate токенов в секунду
+
+    Пачка до capacity запросов проходит сразу, дальше - не чаще rate в
+    секунду. Ожидающие обслуживаются по очереди (FIFO через asyncio.Lock).
+    """
+
+    def __init__(self, rate_per_minute: float = RATE_LIMIT_PER_MINUTE,
+                 capacity: int = RATE_LIMIT_BURST):
+        """
+        Args:
+            rate_per_minute: Средний предел запросов в минуту
+            capacity: Сколько запросов можно отправить подряд без ожидания
+        """
+        self.rate = max(float(rate_per_minute), 0.001) / 60
+        self.capacity = max(1, int(capacity))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def available(self) -> float:
+        """Сколько токенов есть прямо сейчас"""
+        self._refill()
+        return self._tokens
+
+    async def acquire(self) -> float:
+        """
+        Забирает один токен, при необходимости дожидаясь его
+
+        Returns:
+            Сколько секунд пришлось ждать
+        """
+        async with self._lock:
+            self._refill()
+            wait = 0.0
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self.rate
+                _LOGGER.debug("Rate limit reached, waiting %.1fs", wait)
+                await asyncio.sleep(wait)
+                self._refill()
+            self._tokens -= 1
+            return wait
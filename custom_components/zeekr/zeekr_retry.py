@@ -0,0 +1,127 @@
+# zeekr_retry.py
+"""
+Повторы запросов и защита шлюза Zeekr при сбоях
+
+RetryPolicy - сколько раз и с какой паузой повторять запрос к endpoint.
+CircuitBreaker - после серии сбоев перестает пускать запросы к шлюзу и
+через reset_timeout пропускает один пробный запрос.
+"""
+import random
+import time
+from typing import NamedTuple, Optional
+
+from .zeekr_config import (
+    MAX_RETRIES, RETRY_BASE_DELAY, RETRY_MAX_DELAY,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_RESET_TIMEOUT,
+)
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+CIRCUIT_CLOSED = 'closed'
+CIRCUIT_OPEN = 'open'
+CIRCUIT_HALF_OPEN = 'half_open'
+
+
+def is_transient_failure(status: int) -> bool:
+    """Сбой, который имеет смысл повторить: сеть/таймаут (0), 429 и 5xx"""
+    return status == 0 or status == 429 or status >= 500
+
+
+class RetryPolicy(NamedTuple):
+    """Политика повторов для одного endpoint"""
+
+    attempts: int = MAX_RETRIES  # Всего попыток, включая первую
+    base_delay: float = RETRY_BASE_DELAY  # Пауза перед первым повтором (секунды)
+    max_delay: float = RETRY_MAX_DELAY  # Предел паузы (секунды)
+
+    def delay(self, retry: int) -> float:
+        """
+        Пауза перед повтором номер retry (с 0): экспонента с полным jitter
+
+        Случайная пауза в [0, base * 2^retry] разносит повторы разных
+        машин и экземпляров, чтобы они не били в шлюз одновременно.
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry))
+
+
+class ZeekrCircuitOpenError(Exception):
+    """Запрос не отправлен: шлюз недоступен, circuit breaker открыт"""
+
+    def __init__(self, retry_in: float):
+        super().__init__(f"Zeekr gateway circuit is open, next probe in {retry_in:.0f}s")
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker шлюза
+
+    closed - запросы идут как обычно, подряд идущие сбои считаются;
+    open - после failure_threshold сбоев запросы отклоняются reset_timeout секунд;
+    half_open - пропускается один пробный запрос: успех закрывает цепь,
+    сбой снова открывает ее на reset_timeout.
+    """
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout = reset_timeout
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def retry_in(self, now: Optional[float] = None) -> float:
+        """Сколько секунд до пробного запроса (0 - можно отправлять)"""
+        if self.state != CIRCUIT_OPEN:
+            return 0.0
+        now = time.monotonic() if now is None else now
+        return max(0.0, self._opened_at + self.reset_timeout - now)
+
+    def before_request(self) -> None:
+        """
+        Проверяет, можно ли отправить запрос
+
+        Raises:
+            ZeekrCircuitOpenError: Цепь открыта или пробный запрос уже идет
+        """
+        if self.state == CIRCUIT_CLOSED:
+            return
+
+        if self.state == CIRCUIT_OPEN:
+            retry_in = self.retry_in()
+            if retry_in > 0:
+                raise ZeekrCircuitOpenError(retry_in)
+            self.state = CIRCUIT_HALF_OPEN
+            _LOGGER.info("🔌 Zeekr gateway circuit half-open, sending probe request")
+
+        if self._probe_in_flight:
+            raise ZeekrCircuitOpenError(0.0)
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Запрос дошел до шлюза и получил ответ"""
+        if self.state != CIRCUIT_CLOSED:
+            _LOGGER.info("✅ Zeekr gateway is back, circuit closed")
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Запрос завершился временным сбоем"""
+        self.failures += 1
+        self._probe_in_flight = False
+
+        if self.state == CIRCUIT_HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != CIRCUIT_OPEN:
+                _LOGGER.warning(
+                    "⛔ Zeekr gateway circuit opened after %d failures, pausing requests for %.0fs",
+                    self.failures, self.reset_timeout,
+                )
+            self.state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+
+    def release_probe(self) -> None:
+        """Пробный запрос отменен, не дойдя до результата"""
+        self._probe_in_flight = False
@@ -0,0 +1,147 @@
+# zeekr_signer.py
+"""
+Подпись запросов к SECURE шлюзу Zeekr (HMAC-SHA1)
+
+Общий код для ZeekrAPI и ZeekrAuth.login_with_auth_code. Все, что не
+зависит от запроса (ключ HMAC, статические заголовки, MD5 пустого тела),
+считается один раз при создании ZeekrSigner.
+"""
+import base64
+import hashlib
+import hmac
+import uuid
+from datetime import datetime
+from typing import Dict, Optional
+
+from .zeekr_config import HMAC_SECRET, APP_VERSION, PHONE_VERSION
+
+ACCEPT = 'application/json;responseformat=3'
+SIGNATURE_VERSION = '1.0'
+
+# Base64(MD5('')) - тело GET запросов
+EMPTY_BODY_MD5 = base64.b64encode(hashlib.md5(b'').digest()).decode()
+
+# Заголовки, одинаковые для всех запросов приложения
+STATIC_HEADERS = {
+    'content-type': 'application/json',
+    'x-api-signature-version': SIGNATURE_VERSION,
+    'x-app-id': 'ZEEKRAPP',
+    'user-agent': f'ZeekrLife/{APP_VERSION} (iPhone; iOS {PHONE_VERSION}; Scale/3.00)',
+    'x-device-model': 'iPhone',
+    'x-device-manufacture': 'Apple',
+    'x-agent-type': 'iOS',
+    'x-device-type': 'mobile',
+    'platform': 'NON-CMA',
+    'x-env-type': 'production',
+    'accept-language': 'zh-Hans-CN;q=1, en-CN;q=0.9',
+    'x-agent-version': PHONE_VERSION,
+    'accept': ACCEPT,
+    'x-device-brand': 'Apple',
+    'x-operator-code': 'ZEEKR',
+}
+
+
+def body_md5(body: str) -> str:
+    """Base64 кодированный MD5 тела запроса"""
+    if not body:
+        return EMPTY_BODY_MD5
+    return base64.b64encode(hashlib.md5(body.encode()).digest()).decode()
+
+
+def new_timestamp() -> str:
+    """Текущее время в миллисекундах (x-timestamp)"""
+    return str(int(datetime.now().timestamp() * 1000))
+
+
+def new_nonce() -> str:
+    """Уникальный nonce запроса (x-api-signature-nonce)"""
+    return str(uuid.uuid4()).upper()
+
+
+class ZeekrSigner:
+    """
+    Подписывает запросы SECURE шлюза одного устройства
+
+    Не зависит от сети и токенов - sign() и headers() можно вызывать
+    отдельно, например для замера стоимости подписи.
+    """
+
+    __slots__ = ('_mac', '_template')
+
+    def __init__(self, device_id: str, client_id: Optional[str] = None,
+                 secret: str = HMAC_SECRET):
+        """
+        Args:
+            device_id: Device ID (x-device-identifier)
+            client_id: Client ID (x-client-id), если уже известен
+            secret: Ключ HMAC
+        """
+        # HMAC с уже обработанным ключом - на запрос остается только copy()
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha1)
+
+        self._template = dict(STATIC_HEADERS)
+        self._template['x-device-identifier'] = device_id
+        if client_id:
+            self._template['x-client-id'] = client_id
+
+    def sign(self, method: str, path: str, timestamp: str, nonce: str,
+             body: str = '', query_string: str = '') -> str:
+        """
+        Рассчитывает подпись запроса
+
+        Args:
+            method: HTTP метод (GET, POST, PUT и т.д.)
+            path: Путь к endpoint (например /remote-control/vehicle/status/VIN)
+            timestamp: Текущее время в миллисекундах
+            nonce: Уникальный UUID
+            body: Тело запроса (JSON строка)
+            query_string: Query параметры (отсортированные)
+
+        Returns:
+            Base64 кодированная подпись HMAC-SHA1
+        """
+        # Порядок строк важен - шлюз собирает строку так же
+        string_to_sign = (
+            f'{ACCEPT}\n'
+            f'x-api-signature-nonce:{nonce}\n'
+            f'x-api-signature-version:{SIGNATURE_VERSION}\n'
+            f'\n'
+            f'{query_string}\n'
+            f'{body_md5(body)}\n'
+            f'{timestamp}\n'
+            f'{method.upper()}\n'
+            f'{path}'
+        )
+
+        mac = self._mac.copy()
+        mac.update(string_to_sign.encode())
+        return base64.b64encode(mac.digest()).decode()
+
+    def headers(self, method: str, path: str, body: str = '', query_string: str = '',
+                access_token: Optional[str] = None, timestamp: Optional[str] = None,
+                nonce: Optional[str] = None) -> Dict[str, str]:
+        """
+        Готовит подписанные заголовки запроса
+
+        Args:
+            method: HTTP метод
+            path: Путь к endpoint
+            body: Тело запроса
+            query_string: Query параметры
+            access_token: accessToken (authorization), если запрос авторизованный
+            timestamp: Время запроса (по умолчанию - текущее)
+            nonce: Nonce запроса (по умолчанию - новый UUID)
+
+        Returns:
+            Словарь с заголовками
+        """
+        timestamp = timestamp or new_timestamp()
+        nonce = nonce or new_nonce()
+
+        headers = self._template.copy()
+        if access_token:
+            headers['authorization'] = access_token
+        headers['x-timestamp'] = timestamp
+        headers['x-api-signature-nonce'] = nonce
+        headers['x-signature'] = self.sign(method, path, timestamp, nonce, body, query_string)
+        return headers
@@ -0,0 +1,180 @@
+# custom_components/zeekr/zeekr_token.py
+"""
+Управление accessToken: срок действия и обновление по refreshToken
+"""
+import asyncio
+import base64
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .zeekr_config import TOKEN_REFRESH_MARGIN, TOKEN_REFRESH_RETRY_DELAY, TOKEN_REFRESH_MAX_RETRY_DELAY
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Запрос обновления: refreshToken -> ответ шлюза (data) или None
+TokenRefresher = Callable[[str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def jwt_expiry(token: Optional[str]) -> Optional[float]:
+    """
+    Достает время истечения (exp, unix секунды) из JWT токена
+
+    Returns:
+        Время истечения или None, если токен не JWT или в нем нет exp
+    """
+    if not token or token.count('.') != 2:
+        return None
+
+    payload = token.split('.')[1]
+    try:
+        decoded = base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4))
+        exp = json.loads(decoded).get('exp')
+        return float(exp) if exp else None
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+class ZeekrTokenManager:
+    """
+    Хранит токены сессии и обновляет accessToken по refreshToken
+
+    Обновление однопоточное: параллельные запросы, получившие отказ
+    авторизации, ждут одно общее обновление, а не запускают свои.
+    После неудачного обновления следующее не запрашивается до конца паузы
+    (retry_delay, удваивается с каждой неудачей подряд до max_retry_delay) -
+    иначе каждый опрос каждой машины отправлял бы обновление заново.
+    """
+
+    def __init__(self, access_token: str, refresh_token: Optional[str] = None,
+                 expires_at: Optional[float] = None,
+                 refresh_margin: int = TOKEN_REFRESH_MARGIN,
+                 retry_delay: float = TOKEN_REFRESH_RETRY_DELAY,
+                 max_retry_delay: float = TOKEN_REFRESH_MAX_RETRY_DELAY):
+        """
+        Args:
+            access_token: Текущий accessToken
+            refresh_token: refreshToken из ответа auth/account/session/secure
+            expires_at: Время истечения accessToken (unix секунды), если известно
+            refresh_margin: За сколько секунд до истечения обновлять токен
+            retry_delay: Пауза после первой неудачи обновления, секунды
+            max_retry_delay: Предел паузы при неудачах подряд, секунды
+        """
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at = expires_at or jwt_expiry(access_token)
+        self.refresh_margin = refresh_margin
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.failures = 0  # Неудачных обновлений подряд
+        self.retry_at = 0.0  # Раньше этого времени обновление не запрашивается
+        self._relogin_logged = False  # Предупреждение о повторном входе уже записано
+
+        self._refresher: Optional[TokenRefresher] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = asyncio.Lock()
+
+    def set_refresher(self, refresher: TokenRefresher) -> None:
+        """Задает функцию запроса обновления (ZeekrAPI)"""
+        self._refresher = refresher
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> Callable[[], None]:
+        """
+        Подписка на обновление токенов (например, для сохранения в entry.data)
+
+        Returns:
+            Функция отписки
+        """
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    @property
+    def can_refresh(self) -> bool:
+        return bool(self.refresh_token) and self._refresher is not None
+
+    def seconds_until_refresh(self, now: Optional[float] = None) -> Optional[float]:
+        """Через сколько секунд пора обновлять токен (None - срок неизвестен)"""
+        if self.expires_at is None:
+            return None
+        now = time.time() if now is None else now
+        return max(0.0, self.expires_at - self.refresh_margin - now)
+
+    def seconds_until_retry(self, now: Optional[float] = None) -> float:
+        """Сколько секунд осталось до конца паузы после неудачи (0 - паузы нет)"""
+        now = time.time() if now is None else now
+        return max(0.0, self.retry_at - now)
+
+    def needs_refresh(self, now: Optional[float] = None) -> bool:
+        """Истекает ли токен в пределах refresh_margin (и можно ли уже обновлять)"""
+        delay = self.seconds_until_refresh(now)
+        return (delay is not None and delay <= 0 and self.can_refresh
+                and self.seconds_until_retry(now) <= 0)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Токены в формате entry.data"""
+        return {
+            'accessToken': self.access_token,
+            'refreshToken': self.refresh_token,
+            'tokenExpiresAt': self.expires_at,
+        }
+
+    async def async_refresh(self, stale_token: Optional[str] = None) -> bool:
+        """
+        Обновляет accessToken по refreshToken
+
+        Args:
+            stale_token: Токен, с которым запрос получил отказ. Если он уже
+                заменен другим вызывающим, повторного обновления не будет.
+
+        Returns:
+            True если текущий accessToken свежий (обновлен сейчас или ранее),
+            False при неудаче или во время паузы после предыдущей неудачи
+        """
+        async with self._lock:
+            if stale_token is not None and stale_token != self.access_token:
+                return True
+
+            if not self.can_refresh:
+                # Без обновления остается повторный вход - пишем об этом один раз, а не на каждый опрос
+                if not self._relogin_logged:
+                    self._relogin_logged = True
+                    _LOGGER.warning(
+                        "⚠️ Access token expired or rejected and token refresh is unavailable - "
+                        "re-login required (remove and add the Zeekr integration again)"
+                    )
+                return False
+
+            wait = self.seconds_until_retry()
+            if wait > 0:
+                _LOGGER.debug("Token refresh skipped: previous attempt failed, next in %.0fs", wait)
+                return False
+
+            data = await self._refresher(self.refresh_token)
+            if not data or not data.get('accessToken'):
+                self.failures += 1
+                delay = min(self.retry_delay * 2 ** (self.failures - 1), self.max_retry_delay)
+                self.retry_at = time.time() + delay
+                _LOGGER.error(
+                    "❌ Failed to refresh Zeekr access token (%d in a row), next attempt in %.0fs",
+                    self.failures, delay,
+                )
+                return False
+
+            self.failures = 0
+            self.retry_at = 0.0
+
+            self.access_token = data['accessToken']
+            self.refresh_token = data.get('refreshToken') or self.refresh_token
+            expires_in = data.get('expiresIn')
+            try:
+                self.expires_at = time.time() + float(expires_in) if expires_in else jwt_expiry(self.access_token)
+            except (TypeError, ValueError):
+                self.expires_at = jwt_expiry(self.access_token)
+
+            _LOGGER.info("🔑 Zeekr access token refreshed (expires at: %s)", self.expires_at)
+
+        tokens = self.as_dict()
+        for listener in list(self._listeners):
+            listener(tokens)
+        return True
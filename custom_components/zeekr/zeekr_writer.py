@@ -0,0 +1,100 @@
+# zeekr_writer.py
+"""
+Пакетная запись на диск вне event loop
+
+Координаторы и сервисы не пишут файлы сами: submit() кладет запись в
+очередь приемника (например ResponseArchive.append_many), а фоновая задача
+run() раз в flush_interval секунд или при накоплении max_batch записей
+передает каждому приемнику весь накопленный список одним вызовом в
+executor. flush() записывает очередь сразу - для ручного сохранения и
+выгрузки интеграции.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List
+
+from .zeekr_config import WRITE_FLUSH_INTERVAL, WRITE_MAX_BATCH
+from .zeekr_logging import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Приемник: блокирующая функция, принимающая список записей
+Sink = Callable[[List[Any]], Any]
+
+
+class BatchedWriter:
+    """Очередь записей с фоновым сбросом в executor"""
+
+    def __init__(self, run_blocking: Callable[..., Awaitable[Any]],
+                 flush_interval: float = WRITE_FLUSH_INTERVAL,
+                 max_batch: int = WRITE_MAX_BATCH):
+        """
+        Args:
+            run_blocking: Запуск блокирующей функции в executor
+                (hass.async_add_executor_job)
+            flush_interval: Сколько секунд копить записи перед сбросом
+            max_batch: Сколько записей сбрасывать сразу, не дожидаясь интервала
+        """
+        self._run_blocking = run_blocking
+        self.flush_interval = flush_interval
+        self.max_batch = max(1, int(max_batch))
+
+        self._pending: Dict[Sink, List[Any]] = {}
+        self._count = 0
+        self._has_items = asyncio.Event()
+        self._full = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Сколько записей ждут сброса"""
+        return self._count
+
+    def submit(self, sink: Sink, item: Any) -> None:
+        """Ставит запись в очередь приемника (не блокирует)"""
+        self._pending.setdefault(sink, []).append(item)
+        self._count += 1
+        self._has_items.set()
+        if self._count >= self.max_batch:
+            self._full.set()
+
+    async def run(self) -> None:
+        """Фоновая задача: сбрасывает очередь по интервалу или заполнению"""
+        while True:
+            await self._has_items.wait()
+            if not self._full.is_set():
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Записывает все накопленное
+
+        Returns:
+            Сколько записей передано приемникам
+        """
+        async with self._flush_lock:
+            pending, self._pending = self._pending, {}
+            count, self._count = self._count, 0
+            self._has_items.clear()
+            self._full.clear()
+
+            queue = list(pending.items())
+            while queue:
+                sink, items = queue.pop(0)
+                try:
+                    await self._run_blocking(sink, items)
+                except asyncio.CancelledError:
+                    # Начатая запись доделывается в executor, остальное - при следующем flush()
+                    for sink, items in queue:
+                        for item in items:
+                            self.submit(sink, item)
+                    raise
+                except Exception as err:
+                    _LOGGER.error("❌ Failed to write %d records: %s", len(items), err, exc_info=True)
+
+            if count:
+                _LOGGER.debug("Flushed %d records to %d sinks", count, len(pending))
+            return count
@@ -0,0 +1,36 @@
+"""Диагностические сенсоры API: атрибуты не меняются от успешных запросов"""
+from custom_components.zeekr.sensor import (
+    ZeekrApiBytesReceivedSensor,
+    ZeekrApiErrorsSensor,
+    ZeekrApiLatencySensor,
+    ZeekrApiSigningTimeSensor,
+)
+from custom_components.zeekr.zeekr_metrics import ApiMetrics
+
+ENDPOINT = '/status'
+
+
+def _sensors(metrics):
+    return [
+        ZeekrApiLatencySensor(metrics, 'account', ENDPOINT, 'status'),
+        ZeekrApiErrorsSensor(metrics, 'account', ENDPOINT, 'status'),
+        ZeekrApiBytesReceivedSensor(metrics, 'account'),
+        ZeekrApiSigningTimeSensor(metrics, 'account'),
+    ]
+
+
+def _attributes(metrics):
+    return [sensor.extra_state_attributes for sensor in _sensors(metrics)]
+
+
+def test_successful_requests_do_not_change_attributes():
+    metrics = ApiMetrics([ENDPOINT])
+    metrics.record_response(ENDPOINT, 0.2, 500, None)
+    before = _attributes(metrics)
+
+    for seconds in (0.1, 0.3, 0.5):
+        metrics.record_signing(ENDPOINT, seconds / 100)
+        metrics.record_response(ENDPOINT, seconds, 200, {'code': '1000'}, size=512)
+
+    assert _attributes(metrics) == before
+    assert before[1] == {'codes': {'http_500': 1}, 'last_error': metrics.endpoint(ENDPOINT).last_error}
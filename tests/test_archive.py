@@ -0,0 +1,75 @@
+"""Архив ответов: повторы и дельты восстанавливаются при чтении"""
+import copy
+import json
+import os
+
+from custom_components.zeekr.zeekr_archive import ResponseArchive, iter_responses, read_segment
+
+CORPUS = os.path.join(os.path.dirname(__file__), os.pardir, 'benchmarks', 'corpus', 'parked.json')
+
+
+def _status(charge_level=None, vin='VIN0000000000001'):
+    with open(CORPUS, encoding='utf-8') as file:
+        status = json.load(file)
+    status['configuration']['vin'] = vin
+    if charge_level is not None:
+        status['additionalVehicleStatus']['electricVehicleStatus']['chargeLevel'] = charge_level
+    return status
+
+
+def _record(data):
+    return {'_metadata': {'vin': data['configuration']['vin'], 'type': 'status'}, 'data': data}
+
+
+def _kind(record):
+    for kind in ('same', 'patch', 'data'):
+        if kind in record:
+            return kind
+    return None
+
+
+def test_archive_round_trip_from_keyframes_and_deltas(tmp_path):
+    other = _status(vin='VIN0000000000002')
+    records = [
+        _record(_status()),
+        _record(_status()),  # Повтор - ссылка на хэш
+        _record(_status('55')),  # Дельта от ключевого кадра
+        _record(other),
+        _record(_status('55')),
+        _record(_status('54')),
+        _record(_status('53')),  # Превышен keyframe_interval - новый ключевой кадр
+        _record(copy.deepcopy(other)),
+        {'_metadata': {'type': 'manual'}, 'data': {'note': 'no vin'}},
+    ]
+    archive = ResponseArchive(str(tmp_path), dedup=True, deltas=True, keyframe_interval=2)
+    archive.append_many(copy.deepcopy(records[:5]))
+    for record in copy.deepcopy(records[5:]):
+        archive.append(record)
+
+    # Незакрытый сегмент читается до последней сброшенной записи
+    assert list(iter_responses(archive.path)) == records
+    archive.close()
+
+    stored = list(read_segment(archive.path))
+    assert [_kind(record) for record in stored] == [
+        'data', 'same', 'patch', 'data', 'same', 'patch', 'data', 'same', 'data',
+    ]
+    assert list(iter_responses(archive.path)) == records
+
+
+def test_new_segment_starts_with_keyframe(tmp_path):
+    archive = ResponseArchive(str(tmp_path), dedup=True, deltas=True)
+    archive.append(_record(_status()))
+    first = archive.path
+    archive.close()
+
+    # Новый экземпляр (перезапуск) открывает новый сегмент - без ссылок на старый
+    archive = ResponseArchive(str(tmp_path), dedup=True, deltas=True)
+    archive.append(_record(_status()))
+    archive.append(_record(_status('10')))
+    archive.close()
+
+    assert archive.path != first
+    assert [_kind(record) for record in read_segment(archive.path)] == ['data', 'patch']
+    assert [record['data'] for record in iter_responses(archive.path)] == [_status(), _status('10')]
+    assert archive.segments() == [first, archive.path]
@@ -0,0 +1,189 @@
+"""Оповещение сущностей по изменившимся JSON путям (координатор машины)"""
+import asyncio
+import copy
+import inspect
+import json
+import os
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.zeekr import binary_sensor, device_tracker, sensor
+from custom_components.zeekr.binary_sensor import ZeekrDriverDoorSensor
+from custom_components.zeekr.coordinator import ZeekrAccountCoordinator, ZeekrVehicleCoordinator
+from custom_components.zeekr.entity import ZeekrStateChangeMixin
+from custom_components.zeekr.sensor import ZeekrBatterySensor
+from custom_components.zeekr.status_diff import changed_paths, path_prefixes
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), os.pardir, 'benchmarks', 'corpus')
+VIN = 'VIN0000000000001'
+
+
+def _load(name):
+    with open(os.path.join(CORPUS_DIR, f'{name}.json'), encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _status(**ev):
+    status = _load('parked')
+    status['configuration']['vin'] = VIN
+    status['additionalVehicleStatus']['electricVehicleStatus'].update(ev)
+    return status
+
+
+class _Api:
+    """Отдает статусы из очереди; None - неудачный запрос"""
+
+    def __init__(self):
+        self.responses = []
+
+    async def async_get_vehicle_status(self, vin):
+        status = self.responses.pop(0)
+        return (False, None) if status is None else (True, copy.deepcopy(status))
+
+
+class _Listener:
+    """Слушатель координатора, считающий вызовы"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+
+
+def _watch(vehicle, entity):
+    """Подписывает сущность, как CoordinatorEntity.async_added_to_hass, и считает записи состояния"""
+    writes = _Listener()
+    entity.async_write_ha_state = writes
+    vehicle.async_add_listener(entity._handle_coordinator_update, entity.coordinator_context)
+    return writes
+
+
+def _run(tmp_path, scenario):
+    async def main():
+        hass = HomeAssistant(str(tmp_path))
+        api = _Api()
+        account = ZeekrAccountCoordinator(hass, api, entry_id='test')
+        vehicle = ZeekrVehicleCoordinator(hass, account, VIN)
+        try:
+            await scenario(api, vehicle)
+        finally:
+            await vehicle.async_shutdown()
+            await hass.async_stop(force=True)
+
+    asyncio.run(main())
+
+
+def test_only_subscribed_paths_are_notified(tmp_path):
+    async def scenario(api, vehicle):
+        battery = ZeekrBatterySensor(vehicle, VIN)
+        door = ZeekrDriverDoorSensor(vehicle, VIN)
+        battery_writes = _watch(vehicle, battery)
+        doors_writes = _watch(vehicle, door)
+        every_update = _Listener()
+        vehicle.async_add_listener(every_update)
+
+        # Первое обновление - оповещаются все
+        api.responses.append(_status(chargeLevel='80'))
+        await vehicle.async_refresh()
+        assert (battery_writes.calls, doors_writes.calls, every_update.calls) == (1, 1, 1)
+
+        # Ответ не изменился - сущности с путями не вызываются
+        api.responses.append(_status(chargeLevel='80'))
+        await vehicle.async_refresh()
+        assert vehicle.changed_paths == set()
+        assert (battery_writes.calls, doors_writes.calls, every_update.calls) == (1, 1, 2)
+
+        # Изменился заряд - пишется только батарея
+        api.responses.append(_status(chargeLevel='79'))
+        await vehicle.async_refresh()
+        assert battery.native_value == 79
+        assert (battery_writes.calls, doors_writes.calls, every_update.calls) == (2, 1, 3)
+
+    _run(tmp_path, scenario)
+
+
+def test_unchanged_signature_skips_state_write(tmp_path):
+    async def scenario(api, vehicle):
+        battery = ZeekrBatterySensor(vehicle, VIN)
+        notified = _Listener()
+        handle = battery._handle_coordinator_update
+
+        def counting_handle():
+            notified()
+            handle()
+
+        writes = _Listener()
+        battery.async_write_ha_state = writes
+        vehicle.async_add_listener(counting_handle, battery.coordinator_context)
+
+        api.responses.append(_status(stateOfHealth='99'))
+        await vehicle.async_refresh()
+
+        # Поле в подписанном разделе, но не в состоянии сенсора: вызов есть, записи нет
+        api.responses.append(_status(stateOfHealth='98'))
+        await vehicle.async_refresh()
+        assert (notified.calls, writes.calls) == (2, 1)
+
+    _run(tmp_path, scenario)
+
+
+def test_failed_update_notifies_every_listener(tmp_path):
+    async def scenario(api, vehicle):
+        listeners = {}
+        for name, context in (('battery', ZeekrBatterySensor._data_paths),
+                              ('doors', ZeekrDriverDoorSensor._data_paths),
+                              ('any', None)):
+            listeners[name] = _Listener()
+            vehicle.async_add_listener(listeners[name], context)
+
+        api.responses.append(_status())
+        await vehicle.async_refresh()
+        api.responses.append(None)
+        await vehicle.async_refresh()
+        assert not vehicle.last_update_success
+        assert {name: listener.calls for name, listener in listeners.items()} == {
+            'battery': 2, 'doors': 2, 'any': 2,
+        }
+
+        # Первый успех после сбоя - снова все (меняется доступность)
+        api.responses.append(_status())
+        await vehicle.async_refresh()
+        assert vehicle.changed_paths is None
+        assert all(listener.calls == 3 for listener in listeners.values())
+
+    _run(tmp_path, scenario)
+
+
+def _entity_classes():
+    for module in (sensor, binary_sensor, device_tracker):
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            if issubclass(cls, ZeekrStateChangeMixin) and cls.__module__ == module.__name__:
+                yield cls
+
+
+@pytest.mark.parametrize('cls', [cls for cls in _entity_classes() if cls._data_paths])
+def test_data_paths_exist_in_payloads(cls):
+    """Опечатка в _data_paths означает, что сущность никогда не обновится"""
+    known = set()
+    for name in os.listdir(CORPUS_DIR):
+        known |= path_prefixes(changed_paths({}, _load(name[:-len('.json')])))
+
+    assert set(cls._data_paths) <= known
+
+
+def test_parse_failure_hides_payload_in_update_error(tmp_path, monkeypatch):
+    async def scenario(api, vehicle):
+        def broken(status):
+            raise ValueError(f"bad value {status['configuration']['vin']}")
+
+        monkeypatch.setattr('custom_components.zeekr.coordinator.VehicleSnapshot.from_status', broken)
+        api.responses.append(_status())
+        await vehicle.async_refresh()
+
+        assert not vehicle.last_update_success
+        assert str(vehicle.last_exception) == 'Failed to parse vehicle status'
+        assert isinstance(vehicle.last_exception.__cause__, ValueError)
+
+    _run(tmp_path, scenario)
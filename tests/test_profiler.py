@@ -0,0 +1,65 @@
+"""Профилирование циклов: пересекающиеся обновления не смешиваются"""
+import asyncio
+
+from custom_components.zeekr.coordinator import ZeekrProfilingMixin
+from custom_components.zeekr.zeekr_profiler import CycleProfiler
+
+
+class _Refreshing:
+    """Вместо DataUpdateCoordinator: _async_refresh вызывает update()"""
+
+    last_update_success = True
+
+    async def _async_refresh(self):
+        await self.update()
+
+
+class _Coordinator(ZeekrProfilingMixin, _Refreshing):
+    def __init__(self, profiler, kind, children=()):
+        self._profiler = profiler
+        self._cycle_kind = kind
+        self.children = children
+        self.delays = []
+
+    @property
+    def profiler(self):
+        return self._profiler
+
+    async def update(self):
+        delay = self.delays.pop(0) if self.delays else 0
+        with self._profile_phase('fetch'):
+            await asyncio.sleep(delay)
+        self._profile_count('fetched', 1)
+        # Дочерние координаторы в своих задачах - как gather машин в обновлении аккаунта
+        await asyncio.gather(*(child._async_refresh() for child in self.children))
+        self._profile_count('children', len(self.children))
+
+
+def test_overlapping_refreshes_record_separate_cycles():
+    profiler = CycleProfiler(10)
+    coordinator = _Coordinator(profiler, 'vehicle')
+    coordinator.delays = [0.2, 0.01]
+
+    async def run():
+        await asyncio.gather(coordinator._async_refresh(), coordinator._async_refresh())
+
+    asyncio.run(run())
+
+    cycles = list(profiler.cycles)
+    assert len(cycles) == 2
+    assert [cycle.counts for cycle in cycles] == [{'fetched': 1, 'children': 0}] * 2
+    # Короткое обновление закончилось первым, длинное записало свою фазу целиком
+    assert cycles[0].phases['fetch'] < 150 <= cycles[1].phases['fetch']
+
+
+def test_child_coordinator_does_not_write_into_parent_cycle():
+    profiler = CycleProfiler(10)
+    child = _Coordinator(None, 'vehicle')  # Без профилировщика
+    parent = _Coordinator(profiler, 'account', children=(child,))
+
+    asyncio.run(parent._async_refresh())
+
+    (cycle,) = profiler.cycles
+    assert cycle.kind == 'account'
+    assert cycle.counts == {'fetched': 1, 'children': 1}
+    assert list(cycle.phases) == ['fetch']
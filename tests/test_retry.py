@@ -0,0 +1,134 @@
+"""Повторы, circuit breaker и ограничение частоты запросов"""
+import asyncio
+import types
+
+import pytest
+
+from custom_components.zeekr import zeekr_ratelimit, zeekr_retry
+from custom_components.zeekr.zeekr_ratelimit import TokenBucket
+from custom_components.zeekr.zeekr_retry import (
+    CIRCUIT_CLOSED, CIRCUIT_HALF_OPEN, CIRCUIT_OPEN, CircuitBreaker, RetryPolicy,
+    ZeekrCircuitOpenError, is_transient_failure,
+)
+
+
+class _Clock:
+    """Подменяет time.monotonic модуля"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    fake_time = types.SimpleNamespace(monotonic=clock.monotonic)
+    monkeypatch.setattr(zeekr_retry, 'time', fake_time)
+    monkeypatch.setattr(zeekr_ratelimit, 'time', fake_time)
+    return clock
+
+
+def test_transient_failures():
+    assert is_transient_failure(0)
+    assert is_transient_failure(429)
+    assert is_transient_failure(503)
+    assert not is_transient_failure(200)
+    assert not is_transient_failure(401)
+
+
+def test_retry_delay_is_full_jitter_capped_exponent():
+    policy = RetryPolicy(attempts=5, base_delay=1.0, max_delay=5.0)
+
+    for retry, limit in enumerate((1.0, 2.0, 4.0, 5.0, 5.0)):
+        delays = [policy.delay(retry) for _ in range(200)]
+        assert all(0 <= delay <= limit for delay in delays)
+        # Полный jitter - паузы разбросаны по всему интервалу
+        assert min(delays) < limit / 4 and max(delays) > limit * 3 / 4
+
+
+def test_circuit_opens_after_threshold(clock):
+    circuit = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+
+    for _ in range(2):
+        circuit.before_request()
+        circuit.record_failure()
+    assert circuit.state == CIRCUIT_CLOSED
+
+    circuit.before_request()
+    circuit.record_failure()
+    assert circuit.state == CIRCUIT_OPEN
+
+    clock.now += 30
+    with pytest.raises(ZeekrCircuitOpenError) as err:
+        circuit.before_request()
+    assert err.value.retry_in == pytest.approx(30)
+
+
+def test_circuit_half_open_probe_closes_on_success(clock):
+    circuit = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    circuit.before_request()
+    circuit.record_failure()
+    assert circuit.state == CIRCUIT_OPEN
+
+    clock.now += 60
+    circuit.before_request()
+    assert circuit.state == CIRCUIT_HALF_OPEN
+
+    # Пока идет пробный запрос, остальные не пропускаются
+    with pytest.raises(ZeekrCircuitOpenError):
+        circuit.before_request()
+
+    circuit.record_success()
+    assert circuit.state == CIRCUIT_CLOSED
+    assert circuit.failures == 0
+    circuit.before_request()
+
+
+def test_circuit_half_open_probe_failure_reopens(clock):
+    circuit = CircuitBreaker(failure_threshold=5, reset_timeout=60)
+    for _ in range(5):
+        circuit.record_failure()
+
+    clock.now += 60
+    circuit.before_request()
+    circuit.record_failure()
+    assert circuit.state == CIRCUIT_OPEN
+    assert circuit.retry_in() == pytest.approx(60)
+
+
+def test_circuit_released_probe_allows_next(clock):
+    circuit = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    circuit.record_failure()
+
+    clock.now += 60
+    circuit.before_request()
+    circuit.release_probe()
+    circuit.before_request()
+    assert circuit.state == CIRCUIT_HALF_OPEN
+
+
+def test_token_bucket_burst_then_rate(clock, monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(zeekr_ratelimit.asyncio, 'sleep', fake_sleep)
+
+    async def run():
+        bucket = TokenBucket(rate_per_minute=60, capacity=3)
+        waits = [await bucket.acquire() for _ in range(5)]
+        return bucket, waits
+
+    bucket, waits = asyncio.run(run())
+    # Пачка из capacity запросов проходит сразу, дальше - раз в секунду
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert waits[3:] == pytest.approx([1.0, 1.0])
+    assert sleeps == pytest.approx([1.0, 1.0])
+
+    clock.now += 10
+    assert bucket.available == pytest.approx(3)
@@ -0,0 +1,48 @@
+"""Сравнение ответов vehicleStatus и JSON Patch"""
+import copy
+
+from custom_components.zeekr.status_diff import (
+    apply_json_patch, changed_paths, json_patch, path_prefixes,
+)
+
+OLD = {
+    'basicVehicleStatus': {'speed': '0', 'position': {'latitude': '1', 'longitude': '2'}},
+    'additionalVehicleStatus': {'electricVehicleStatus': {'chargeLevel': '80'}},
+    'removed': {'a': '1', 'b': {'c': '2'}},
+    'list': [1, 2],
+}
+NEW = {
+    'basicVehicleStatus': {'speed': '42', 'position': {'latitude': '1', 'longitude': '3'}},
+    'additionalVehicleStatus': {'electricVehicleStatus': {'chargeLevel': '80'}},
+    'added': {'x': {'y': '1'}},
+    'list': [1, 2, 3],
+    'a/b~c': 'special',
+}
+
+
+def test_changed_paths_expands_added_and_removed_subtrees():
+    assert changed_paths(OLD, NEW) == {
+        'basicVehicleStatus.speed',
+        'basicVehicleStatus.position.longitude',
+        'removed.a',
+        'removed.b.c',
+        'added.x.y',
+        'list',
+        'a/b~c',
+    }
+    assert changed_paths(OLD, copy.deepcopy(OLD)) == set()
+
+
+def test_path_prefixes():
+    assert path_prefixes(['a.b.c', 'a.d', 'e']) == {'a', 'a.b', 'a.b.c', 'a.d', 'e'}
+    assert path_prefixes([]) == set()
+
+
+def test_json_patch_round_trip_keeps_source_intact():
+    original = copy.deepcopy(OLD)
+    patch = json_patch(OLD, NEW)
+
+    assert apply_json_patch(OLD, patch) == NEW
+    assert OLD == original
+    assert json_patch(NEW, NEW) == []
+    assert apply_json_patch(NEW, json_patch(NEW, OLD)) == OLD
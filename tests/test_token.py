@@ -0,0 +1,73 @@
+"""Обновление accessToken: пауза после неудачи"""
+import asyncio
+import time
+
+from custom_components.zeekr.zeekr_token import ZeekrTokenManager
+
+
+class _Refresher:
+    """Считает запросы обновления и отвечает заданным результатом"""
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self, refresh_token):
+        self.calls += 1
+        return self.result
+
+
+def _manager(refresher):
+    # Токен уже истек - обновление нужно
+    tokens = ZeekrTokenManager('access', 'refresh', expires_at=time.time() - 1,
+                               retry_delay=300, max_retry_delay=1000)
+    tokens.set_refresher(refresher)
+    return tokens
+
+
+def test_failed_refresh_is_not_repeated_until_retry_delay():
+    refresher = _Refresher()
+    tokens = _manager(refresher)
+
+    assert tokens.needs_refresh()
+    assert not asyncio.run(tokens.async_refresh())
+    assert refresher.calls == 1
+
+    # Ни плановое обновление, ни обновление по отказу авторизации не отправляют запрос
+    assert not tokens.needs_refresh()
+    assert not asyncio.run(tokens.async_refresh(stale_token='access'))
+    assert refresher.calls == 1
+    assert 299 < tokens.seconds_until_retry() <= 300
+
+
+def test_retry_delay_doubles_up_to_limit_and_resets_on_success():
+    refresher = _Refresher()
+    tokens = _manager(refresher)
+
+    for expected in (300, 600, 1000, 1000):
+        tokens.retry_at = 0.0
+        asyncio.run(tokens.async_refresh())
+        assert expected - 1 < tokens.seconds_until_retry() <= expected
+
+    refresher.result = {'accessToken': 'new', 'expiresIn': 3600}
+    tokens.retry_at = 0.0
+    assert asyncio.run(tokens.async_refresh())
+    assert tokens.access_token == 'new'
+    assert tokens.failures == 0
+    assert tokens.seconds_until_retry() == 0
+
+
+def test_api_without_token_refresh_option_never_refreshes():
+    from custom_components.zeekr.zeekr_api import ZeekrAPI
+
+    api = ZeekrAPI('access', 'user', 'client', 'device', refresh_token='refresh',
+                   token_expires_at=time.time() - 1)
+
+    # Путь обновления не подтвержден - без опции остается повторный вход
+    assert not api.tokens.can_refresh
+    assert not api.tokens.needs_refresh()
+    assert not asyncio.run(api.tokens.async_refresh(stale_token='access'))
+
+    enabled = ZeekrAPI('access', 'user', 'client', 'device', refresh_token='refresh',
+                       token_expires_at=time.time() - 1, token_refresh=True)
+    assert enabled.tokens.can_refresh
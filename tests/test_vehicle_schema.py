@@ -0,0 +1,69 @@
+"""Разбор vehicleStatus с некорректными значениями отдельных полей"""
+import copy
+import json
+import os
+
+from custom_components.zeekr.vehicle_parser import VehicleSnapshot
+from custom_components.zeekr.vehicle_schema import (
+    ACCESSORS, COMPILED_SECTIONS, Field, compile_code, compile_field,
+)
+
+CORPUS = os.path.join(os.path.dirname(__file__), os.pardir, 'benchmarks', 'corpus', 'parked.json')
+
+
+def _status():
+    with open(CORPUS, encoding='utf-8') as file:
+        return json.load(file)
+
+
+def _broken_status():
+    status = copy.deepcopy(_status())
+    additional = status['additionalVehicleStatus']
+    additional['electricVehicleStatus']['chargeLevel'] = ''
+    additional['maintenanceStatus']['odometer'] = ''
+    additional['maintenanceStatus']['daysToService'] = '12.5'
+    return status
+
+
+def test_snapshot_survives_invalid_values():
+    good = VehicleSnapshot.from_status(_status())
+    snapshot = VehicleSnapshot.from_status(_broken_status())
+
+    # Пустые значения - значение поля по умолчанию, дробь в целом поле - целая часть
+    assert snapshot.battery_percentage == 0
+    assert snapshot.odometer == 0.0
+    assert snapshot.days_to_service == 12
+
+    # Остальные поля разобраны как обычно
+    assert snapshot.vin == good.vin
+    assert snapshot.distance_to_service == good.distance_to_service
+    assert snapshot.charge_status == good.charge_status
+
+
+def test_sections_and_accessors_survive_invalid_values():
+    status = _broken_status()
+
+    assert ACCESSORS['battery_percentage'](status) == 0
+    assert ACCESSORS['odometer'](status) == 0.0
+    assert COMPILED_SECTIONS['get_maintenance_info'](status)['days_to_service'] == 12
+    assert COMPILED_SECTIONS['get_battery_info'](status)['battery_percentage'] == 0
+
+
+def test_garbage_values_fall_back_to_default():
+    status = _status()
+    status['basicVehicleStatus']['position']['altitude'] = 'n/a'
+    status['additionalVehicleStatus']['maintenanceStatus']['mainBatteryStatus']['chargeLevel'] = None
+
+    snapshot = VehicleSnapshot.from_status(status)
+    assert snapshot.altitude == 0
+    assert snapshot.aux_battery_percentage == 0.0
+
+
+def test_compile_uses_given_field():
+    """Поле не обязано быть в FIELDS - используется переданное описание"""
+    level = compile_field('custom_level', Field('a.b', int, default='7'))
+    code = compile_code('custom_mode', Field('a.mode', default='1', enum={'1': 'One'}))
+
+    assert level({'a': {'b': '3'}}) == 3
+    assert level({}) == 7
+    assert code({'a': {'mode': '2'}}) == '2'
@@ -0,0 +1,270 @@
+# tools/fake_gateway.py
+"""
+Локальный заменитель SECURE шлюза Zeekr для нагрузочных и интеграционных тестов
+
+Запуск из корня репозитория:
+
+    python -m tools.fake_gateway --vins 300 --latency 150 --jitter 100 \\
+        --error-rate 0.02 --rate-limit 600
+
+    ZEEKR_BASE_URL_SECURE=http://127.0.0.1:8765 hass -c config
+
+Шлюз проверяет подпись HMAC-SHA1 (zeekr_signer) и accessToken и отвечает:
+- GET  /device-platform/user/vehicle/secure - список VIN;
+- GET  /remote-control/vehicle/status/{vin} - vehicleStatus;
+- POST /auth/account/session/refresh - новый accessToken по refreshToken;
+- GET  /__stats - счетчики запросов (для отчетов нагрузочного теста).
+
+Ответы берутся из benchmarks/corpus (записанные vehicleStatus, по кругу на
+VIN) или, с --fleet, из tools.fleet - машины ездят и заряжаются по реальным
+часам. Задержка, доля ошибок 5xx и предел частоты (429) задаются ключами.
+"""
+import argparse
+import asyncio
+import copy
+import glob
+import json
+import os
+import random
+import secrets
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode
+
+from aiohttp import web
+
+from custom_components.zeekr.zeekr_api import VEHICLES_PATH
+from custom_components.zeekr.zeekr_config import REFRESH_TOKEN_PATH
+from custom_components.zeekr.zeekr_ratelimit import TokenBucket
+from custom_components.zeekr.zeekr_signer import ZeekrSigner
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'corpus')
+STATUS_PREFIX = '/remote-control/vehicle/status/'
+
+CODE_OK = '1000'
+CODE_UNAUTHORIZED = '401'
+CODE_BAD_SIGNATURE = '4001'
+CODE_THROTTLED = '429'
+CODE_UNKNOWN_VIN = '4004'
+
+
+def load_payloads(directory: str = CORPUS_DIR) -> List[Dict[str, Any]]:
+    """vehicleStatus из папки корпуса"""
+    payloads = []
+    for path in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(path, encoding='utf-8') as f:
+            payloads.append(json.load(f))
+    return payloads
+
+
+class CorpusSource:
+    """
+    Ответы для count VIN: записанные vehicleStatus по кругу
+
+    VIN в ответе заменяется на выданный, updateTime - на время запроса,
+    чтобы координатор видел свежие данные.
+    """
+
+    def __init__(self, payloads: List[Dict[str, Any]], count: int, prefix: str = 'FAKE'):
+        self._payloads = payloads
+        self._vins = [f"{prefix}{number:0{17 - len(prefix)}d}" for number in range(count)]
+        self._index = {vin: number for number, vin in enumerate(self._vins)}
+
+    def vins(self) -> List[str]:
+        return list(self._vins)
+
+    def status(self, vin: str) -> Optional[Dict[str, Any]]:
+        number = self._index.get(vin)
+        if number is None:
+            return None
+        status = copy.deepcopy(self._payloads[number % len(self._payloads)])
+        status.setdefault('configuration', {})['vin'] = vin
+        status['updateTime'] = str(int(time.time() * 1000))
+        return status
+
+
+class FakeGateway:
+    """aiohttp приложение шлюза с внесением задержек, ошибок и ограничений"""
+
+    def __init__(self, source, access_token: str = 'fake-access-token',
+                 refresh_token: str = 'fake-refresh-token', token_ttl: float = 0,
+                 latency: float = 0, jitter: float = 0, error_rate: float = 0,
+                 rate_limit: float = 0, verify_signature: bool = True):
+        """
+        Args:
+            source: Источник ответов (vins() и status(vin))
+            access_token: Начальный accessToken
+            refresh_token: Начальный refreshToken
+            token_ttl: Срок жизни accessToken, секунды (0 - бессрочно)
+            latency: Задержка ответа, мс
+            jitter: Случайная добавка к задержке, мс (0..jitter)
+            error_rate: Доля запросов, получающих HTTP 503
+            rate_limit: Предел запросов в минуту (0 - без предела), сверх - HTTP 429
+            verify_signature: Проверять x-signature
+        """
+        self.source = source
+        self.token_ttl = token_ttl
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.error_rate = error_rate
+        self.rate_limiter = TokenBucket(rate_limit, max(1, int(rate_limit / 60) or 1)) if rate_limit else None
+        self.verify_signature = verify_signature
+
+        self.access_tokens: Dict[str, float] = {}  # accessToken -> истекает (0 - никогда)
+        self.refresh_tokens = {refresh_token}
+        self._issue(access_token)
+
+        self.stats: Counter = Counter()
+        self.started_at = time.time()
+
+    def _issue(self, access_token: str) -> None:
+        self.access_tokens[access_token] = time.time() + self.token_ttl if self.token_ttl else 0
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get(VEHICLES_PATH, self.handle_vehicles)
+        app.router.add_get(STATUS_PREFIX + '{vin}', self.handle_status)
+        app.router.add_post(REFRESH_TOKEN_PATH, self.handle_refresh)
+        app.router.add_get('/__stats', self.handle_stats)
+        return app
+
+    @staticmethod
+    def reply(code: str, data: Any = None, message: str = 'success', status: int = 200) -> web.Response:
+        body = {'code': code, 'msg': message, 'message': message, 'data': data}
+        return web.json_response(body, status=status, content_type='application/json')
+
+    def _endpoint(self, path: str) -> str:
+        return STATUS_PREFIX + '{vin}' if path.startswith(STATUS_PREFIX) else path
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        if request.path == '/__stats':
+            return await handler(request)
+
+        endpoint = self._endpoint(request.path)
+        response = await self._check(request)
+        if response is None:
+            delay = self.latency + random.uniform(0, self.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            if self.error_rate and random.random() < self.error_rate:
+                response = web.json_response({'code': '503', 'message': 'injected error'}, status=503)
+            else:
+                response = await handler(request)
+
+        self.stats[f"{endpoint} {response.status}"] += 1
+        return response
+
+    async def _check(self, request: web.Request) -> Optional[web.Response]:
+        """Предел частоты, подпись и токен; None - запрос проходит"""
+        if self.rate_limiter is not None:
+            if self.rate_limiter.available < 1:
+                return self.reply(CODE_THROTTLED, message='too many requests', status=429)
+            await self.rate_limiter.acquire()
+
+        body = await request.text()
+        if self.verify_signature and not self._signature_valid(request, body):
+            return self.reply(CODE_BAD_SIGNATURE, message='signature verification failed')
+
+        if request.path != REFRESH_TOKEN_PATH:
+            expires = self.access_tokens.get(request.headers.get('authorization', ''))
+            if expires is None or (expires and expires < time.time()):
+                return self.reply(CODE_UNAUTHORIZED, message='token invalid or expired', status=401)
+        return None
+
+    @staticmethod
+    def _signature_valid(request: web.Request, body: str) -> bool:
+        headers = request.headers
+        try:
+            signer = ZeekrSigner(headers['x-device-identifier'])
+            query_string = urlencode(sorted(parse_qsl(request.query_string, keep_blank_values=True)))
+            expected = signer.sign(
+                request.method, request.path, headers['x-timestamp'],
+                headers['x-api-signature-nonce'], body, query_string,
+            )
+        except KeyError:
+            return False
+        return secrets.compare_digest(expected, headers.get('x-signature', ''))
+
+    async def handle_vehicles(self, request: web.Request) -> web.Response:
+        return self.reply(CODE_OK, {'list': [{'vin': vin} for vin in self.source.vins()]})
+
+    async def handle_status(self, request: web.Request) -> web.Response:
+        status = self.source.status(request.match_info['vin'])
+        if status is None:
+            return self.reply(CODE_UNKNOWN_VIN, message='vehicle not bound to user')
+        return self.reply(CODE_OK, {'vehicleStatus': status})
+
+    async def handle_refresh(self, request: web.Request) -> web.Response:
+        try:
+            refresh_token = json.loads(await request.text()).get('refreshToken')
+        except ValueError:
+            refresh_token = None
+        if refresh_token not in self.refresh_tokens:
+            return self.reply(CODE_UNAUTHORIZED, message='refresh token invalid', status=401)
+
+        access_token = f"fake-access-{secrets.token_hex(8)}"
+        self._issue(access_token)
+        return self.reply(CODE_OK, {
+            'accessToken': access_token,
+            'refreshToken': refresh_token,
+            'expiresIn': self.token_ttl or None,
+        })
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response({
+            'uptime': round(time.time() - self.started_at, 1),
+            'requests': dict(sorted(self.stats.items())),
+        })
+
+
+def make_source(args: argparse.Namespace):
+    """Источник ответов по ключам командной строки"""
+    if args.fleet:
+        from tools.fleet import FleetGenerator
+        return FleetGenerator(args.vins, args.seed)
+
+    payloads = load_payloads(args.corpus)
+    if not payloads:
+        raise SystemExit(f"No payloads in {args.corpus}")
+    return CorpusSource(payloads, args.vins)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--vins', type=int, default=10, help='Сколько машин в аккаунте')
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='Папка с vehicleStatus')
+    parser.add_argument('--fleet', action='store_true', help='Синтетический парк tools.fleet вместо корпуса')
+    parser.add_argument('--seed', type=int, default=0, help='Зерно синтетического парка')
+    parser.add_argument('--access-token', default='fake-access-token')
+    parser.add_argument('--refresh-token', default='fake-refresh-token')
+    parser.add_argument('--token-ttl', type=float, default=0, help='Срок жизни accessToken, с (0 - бессрочно)')
+    parser.add_argument('--latency', type=float, default=0, help='Задержка ответа, мс')
+    parser.add_argument('--jitter', type=float, default=0, help='Случайная добавка к задержке, мс')
+    parser.add_argument('--error-rate', type=float, default=0, help='Доля ответов HTTP 503 (0..1)')
+    parser.add_argument('--rate-limit', type=float, default=0, help='Запросов в минуту до HTTP 429 (0 - без предела)')
+    parser.add_argument('--no-verify-signature', action='store_true', help='Не проверять x-signature')
+    return parser
+
+
+def main(argv: List[str] = None) -> None:
+    args = build_parser().parse_args(argv)
+    gateway = FakeGateway(
+        make_source(args),
+        access_token=args.access_token,
+        refresh_token=args.refresh_token,
+        token_ttl=args.token_ttl,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        rate_limit=args.rate_limit,
+        verify_signature=not args.no_verify_signature,
+    )
+    web.run_app(gateway.app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+# tools/fleet.py
+"""
+Генератор синтетического парка: правдоподобные потоки vehicleStatus
+
+Каждая машина - простой автомат состояний: стоит, едет, заряжается (AC или
+DC), раздает энергию (V2L). Между шагами меняются поля, которые читает
+парсер: координаты движутся по маршруту, одометр и расход растут в
+поездке, chargeLevel растет при chargerState 2/3, parkTime сбрасывается
+при каждой парковке, температура и давление шин следуют за движением.
+Шаблон ответа - benchmarks/corpus/parked.json, то есть структура та же,
+что у записанных ответов.
+
+Запуск из корня репозитория:
+
+    # 1000 машин, сутки с шагом в минуту - в сжатый JSONL
+    python -m tools.fleet --vins 1000 --steps 1440 --interval 60 --out fleet.jsonl.gz
+
+    # По одному ответу на машину - корпус для бенчмарка
+    python -m tools.fleet --vins 50 --warmup 600 --corpus-out /tmp/fleet_corpus
+    python -m benchmarks.run --corpus /tmp/fleet_corpus
+
+FleetGenerator можно передать в tools.fake_gateway как источник ответов
+(--fleet): каждая машина живет по реальным часам.
+"""
+import argparse
+import copy
+import gzip
+import json
+import math
+import os
+import random
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'corpus')
+TEMPLATE_FILE = os.path.join(CORPUS_DIR, 'parked.json')
+
+PARKED = 'parked'
+DRIVING = 'driving'
+AC_CHARGING = 'ac_charging'
+DC_CHARGING = 'dc_charging'
+V2L = 'v2l_discharging'
+
+BATTERY_KWH = 75.0  # Емкость тяговой батареи
+CONSUMPTION_KWH_PER_KM = 0.17
+AC_POWER_KW = 7.4
+DC_POWER_KW = 150.0
+V2L_POWER_KW = 2.0
+NO_CHARGE_TIME = 2047  # timeToFullyCharged без зарядки
+KM_PER_DEGREE = 111.32
+
+
+def load_template(path: str = TEMPLATE_FILE) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+class VehicleSimulator:
+    """Одна машина: состояние и его изменение во времени"""
+
+    def __init__(self, vin: str, template: Dict[str, Any], rng: random.Random, now: float):
+        """
+        Args:
+            vin: VIN машины
+            template: Шаблон vehicleStatus
+            rng: Генератор случайных чисел (свой на машину - поток воспроизводим)
+            now: Начальное время (unix секунды)
+        """
+        self.vin = vin
+        self.rng = rng
+        self.template = template
+        self.now = now
+
+        # Дом - точка, вокруг которой строятся маршруты
+        self.home = (rng.uniform(30.0, 60.0), rng.uniform(20.0, 120.0))
+        self.lat, self.lon = self.home
+        self.altitude = rng.uniform(0, 300)
+        self.heading = rng.uniform(0, 360)
+
+        self.mode = PARKED
+        self.mode_until = now + rng.uniform(600, 4 * 3600)
+        self.parked_since = now - rng.uniform(0, 12 * 3600)
+
+        self.soc = rng.uniform(25, 95)
+        self.soh = rng.uniform(93, 100)
+        self.odometer = rng.uniform(500, 80000)
+        self.trip = rng.uniform(0, 500)
+        self.speed = 0.0
+        self.ambient = rng.uniform(-10, 30)
+        self.interior = self.ambient
+        self.tire_temp = [self.ambient] * 4
+        self.tire_cold = [rng.uniform(235, 255) for _ in range(4)]
+        self.aux_voltage = rng.uniform(12.2, 12.7)
+
+    # ==================== ПЕРЕХОДЫ ====================
+
+    def _enter(self, mode: str) -> None:
+        rng = self.rng
+        if mode == PARKED:
+            self.parked_since = self.now
+            self.mode_until = self.now + rng.uniform(15 * 60, 10 * 3600)
+        elif mode == DRIVING:
+            self.mode_until = self.now + rng.uniform(5 * 60, 90 * 60)
+            self.heading = rng.uniform(0, 360)
+        elif mode == V2L:
+            self.mode_until = self.now + rng.uniform(20 * 60, 3 * 3600)
+        else:
+            self.mode_until = float('inf')  # Зарядка - до целевого уровня
+        self.mode = mode
+
+    def _next_mode(self) -> str:
+        rng = self.rng
+        if self.mode in (DRIVING, AC_CHARGING, DC_CHARGING, V2L):
+            return PARKED
+        if self.soc < 30:
+            return DC_CHARGING if rng.random() < 0.4 else AC_CHARGING
+        roll = rng.random()
+        if roll < 0.75:
+            return DRIVING
+        if roll < 0.9:
+            return AC_CHARGING
+        return V2L if self.soc > 50 else AC_CHARGING
+
+    # ==================== ШАГ ====================
+
+    def advance(self, dt: float) -> None:
+        """Сдвигает время машины на dt секунд (большие шаги дробятся по минуте)"""
+        while dt > 0:
+            step = min(dt, 60.0)
+            self._step(step)
+            dt -= step
+
+    def _step(self, dt: float) -> None:
+        rng = self.rng
+        self.now += dt
+        hours = dt / 3600
+
+        if self.mode == DRIVING:
+            target = rng.uniform(20, 120)
+            self.speed += (target - self.speed) * min(1.0, dt / 120)
+            self.heading = (self.heading + rng.gauss(0, 15)) % 360
+            # Уехав далеко от дома, поворачиваем обратно
+            distance_home = math.hypot(self.lat - self.home[0], self.lon - self.home[1])
+            if distance_home > 0.3:
+                self.heading = math.degrees(math.atan2(self.home[1] - self.lon, self.home[0] - self.lat)) % 360
+
+            km = self.speed * hours
+            self.lat += km * math.cos(math.radians(self.heading)) / KM_PER_DEGREE
+            self.lon += km * math.sin(math.radians(self.heading)) / (KM_PER_DEGREE * math.cos(math.radians(self.lat)))
+            self.altitude = max(0.0, self.altitude + rng.gauss(0, 2))
+            self.odometer += km
+            self.trip += km
+            self.soc = max(0.0, self.soc - km * CONSUMPTION_KWH_PER_KM / BATTERY_KWH * 100)
+            tire_target = self.ambient + 10 + self.speed / 6
+        else:
+            self.speed = 0.0
+            tire_target = self.ambient
+            if self.mode == AC_CHARGING:
+                self.soc = min(100.0, self.soc + AC_POWER_KW * hours / BATTERY_KWH * 100)
+            elif self.mode == DC_CHARGING:
+                # Мощность падает после 80%
+                power = DC_POWER_KW if self.soc < 80 else DC_POWER_KW * 0.3
+                self.soc = min(100.0, self.soc + power * hours / BATTERY_KWH * 100)
+            elif self.mode == V2L:
+                self.soc = max(0.0, self.soc - V2L_POWER_KW * hours / BATTERY_KWH * 100)
+
+        # Шины и салон тянутся к целевой температуре
+        factor = min(1.0, dt / 900)
+        self.tire_temp = [t + (tire_target + rng.gauss(0, 0.3) - t) * factor for t in self.tire_temp]
+        self.interior += ((21.0 if self.mode == DRIVING else self.ambient) - self.interior) * factor
+        self.ambient += rng.gauss(0, 0.05)
+
+        charging_done = self.mode in (AC_CHARGING, DC_CHARGING) and self.soc >= (
+            100 if self.mode == AC_CHARGING else 85)
+        if self.now >= self.mode_until or charging_done or (self.mode == V2L and self.soc < 20):
+            self._enter(self._next_mode())
+
+    # ==================== ОТВЕТ ====================
+
+    def status(self) -> Dict[str, Any]:
+        """Текущий vehicleStatus в формате шлюза (все значения - строки)"""
+        s = copy.deepcopy(self.template)
+        ev = s['additionalVehicleStatus']['electricVehicleStatus']
+        maintenance = s['additionalVehicleStatus']['maintenanceStatus']
+        climate = s['additionalVehicleStatus']['climateStatus']
+        running = s['additionalVehicleStatus']['runningStatus']
+        driving = s['additionalVehicleStatus']['drivingBehaviourStatus']
+        safety = s['additionalVehicleStatus']['drivingSafetyStatus']
+        basic = s['basicVehicleStatus']
+        position = basic['position']
+        moving = self.mode == DRIVING
+
+        s['updateTime'] = str(int(self.now * 1000))
+        s['configuration']['vin'] = self.vin
+        s['parkTime']['status'] = '0' if moving else str(int(self.parked_since * 1000))
+
+        basic['engineStatus'] = 'engine_running' if moving else 'engine_off'
+        basic['speed'] = f"{self.speed:.1f}"
+        basic['direction'] = position['direction'] = str(int(self.heading))
+        position['latitude'] = str(int(self.lat * 1e7))
+        position['longitude'] = str(int(self.lon * 1e7))
+        position['altitude'] = str(int(self.altitude))
+
+        level = int(self.soc)
+        ev['chargeLevel'] = str(level)
+        ev['stateOfCharge'] = f"{self.soc:.1f}"
+        ev['stateOfHealth'] = f"{self.soh:.0f}"
+        ev['distanceToEmptyOnBatteryOnly'] = str(int(self.soc / 100 * BATTERY_KWH / CONSUMPTION_KWH_PER_KM))
+        ev['hvTempLevel'] = '0' if self.ambient > 15 else '1' if self.ambient > 0 else '2'
+
+        charging = self.mode in (AC_CHARGING, DC_CHARGING)
+        ev['chargeSts'] = '1' if charging else '0'
+        ev['chargerState'] = {AC_CHARGING: '2', DC_CHARGING: '3'}.get(self.mode, '0')
+        ev['chargeUAct'], ev['chargeIAct'] = ('230.0', f"{AC_POWER_KW * 1000 / 230:.1f}") \
+            if self.mode == AC_CHARGING else ('0', '0')
+        ev['dcChargeSts'] = '2' if self.mode == DC_CHARGING else '0'
+        ev['dcChargePileUAct'], ev['dcChargePileIAct'] = ('650.0', f"{DC_POWER_KW * 1000 / 650:.1f}") \
+            if self.mode == DC_CHARGING else ('0', '0')
+        if charging:
+            power = AC_POWER_KW if self.mode == AC_CHARGING else DC_POWER_KW
+            ev['timeToFullyCharged'] = str(int((100 - self.soc) / 100 * BATTERY_KWH / power * 60))
+        else:
+            ev['timeToFullyCharged'] = str(NO_CHARGE_TIME)
+
+        if self.mode == V2L:
+            ev['disChargeConnectStatus'] = '1'
+            ev['disChargeUAct'], ev['disChargeIAct'] = '220.0', f"{V2L_POWER_KW * 1000 / 220:.1f}"
+        elif moving:
+            ev['disChargeConnectStatus'] = '0'
+            ev['disChargeUAct'] = '398.0'
+            ev['disChargeIAct'] = f"{-self.speed * CONSUMPTION_KWH_PER_KM * 1000 / 398:.1f}"
+        else:
+            ev['disChargeConnectStatus'], ev['disChargeUAct'], ev['disChargeIAct'] = '0', '0', '0'
+
+        maintenance['odometer'] = f"{self.odometer:.1f}"
+        maintenance['mainBatteryStatus']['voltage'] = f"{self.aux_voltage + (1.6 if moving else 0):.2f}"
+        for side, temp, cold in zip(('Driver', 'Passenger', 'DriverRear', 'PassengerRear'),
+                                    self.tire_temp, self.tire_cold):
+            maintenance[f'tyreTemp{side}'] = f"{temp:.1f}"
+            # Давление растет примерно на 1 кПа на градус
+            maintenance[f'tyreStatus{side}'] = f"{cold + (temp - self.ambient):.1f}"
+
+        climate['interiorTemp'] = f"{self.interior:.1f}"
+        climate['exteriorTemp'] = f"{self.ambient:.1f}"
+        climate['airBlowerActive'] = 'true' if moving else 'false'
+
+        running['tripMeter1'] = f"{self.trip:.1f}"
+        running['avgSpeed'] = str(int(self.speed))
+        running['drl'] = '1' if moving else '0'
+        driving['engineSpeed'] = str(int(self.speed * 60)) if moving else '0'
+        safety['electricParkBrakeStatus'] = '0' if moving else '1'
+        safety['centralLockingStatus'] = '1'
+        return s
+
+
+class FleetGenerator:
+    """Парк машин с общим временем"""
+
+    def __init__(self, count: int, seed: int = 0, start: Optional[float] = None,
+                 template: Optional[Dict[str, Any]] = None, prefix: str = 'SIM'):
+        """
+        Args:
+            count: Сколько машин
+            seed: Зерно генератора (одинаковое зерно - одинаковый поток)
+            start: Начальное время (unix секунды, по умолчанию - сейчас)
+            template: Шаблон vehicleStatus (по умолчанию - корпус parked.json)
+            prefix: Начало VIN
+        """
+        template = template or load_template()
+        start = time.time() if start is None else start
+        self.vehicles: Dict[str, VehicleSimulator] = {}
+        for number in range(count):
+            vin = f"{prefix}{number:0{17 - len(prefix)}d}"
+            self.vehicles[vin] = VehicleSimulator(vin, template, random.Random(f"{seed}:{vin}"), start)
+
+    def vins(self) -> List[str]:
+        return list(self.vehicles)
+
+    def advance(self, dt: float) -> None:
+        for vehicle in self.vehicles.values():
+            vehicle.advance(dt)
+
+    def status(self, vin: str) -> Optional[Dict[str, Any]]:
+        """Ответ машины на текущий момент (источник для tools.fake_gateway)"""
+        vehicle = self.vehicles.get(vin)
+        if vehicle is None:
+            return None
+        now = time.time()
+        if now > vehicle.now:
+            vehicle.advance(now - vehicle.now)
+        return vehicle.status()
+
+    def stream(self, steps: int, interval: float) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """steps шагов по interval секунд: (vin, vehicleStatus) для каждой машины на каждом шаге"""
+        for _ in range(steps):
+            self.advance(interval)
+            for vin, vehicle in self.vehicles.items():
+                yield vin, vehicle.status()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--vins', type=int, default=10, help='Сколько машин')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--steps', type=int, default=60, help='Сколько шагов')
+    parser.add_argument('--interval', type=float, default=60, help='Шаг, секунды')
+    parser.add_argument('--warmup', type=float, default=0, help='Прогнать машины вперед перед записью, минуты')
+    parser.add_argument('--out', help='JSONL (или .jsonl.gz) с записями {"vin", "data"}')
+    parser.add_argument('--corpus-out', help='Папка: по одному vehicleStatus.json на машину')
+    args = parser.parse_args(argv)
+
+    fleet = FleetGenerator(args.vins, args.seed, start=time.time() - args.warmup * 60)
+    if args.warmup:
+        fleet.advance(args.warmup * 60)
+
+    if args.corpus_out:
+        os.makedirs(args.corpus_out, exist_ok=True)
+        for vin, vehicle in fleet.vehicles.items():
+            with open(os.path.join(args.corpus_out, f"{vin}_{vehicle.mode}.json"), 'w', encoding='utf-8') as f:
+                json.dump(vehicle.status(), f, ensure_ascii=False, indent=2)
+        print(f"{len(fleet.vehicles)} payloads written to {args.corpus_out}")
+
+    if args.out:
+        opener = gzip.open if args.out.endswith('.gz') else open
+        written = 0
+        with opener(args.out, 'wt', encoding='utf-8') as f:
+            for vin, status in fleet.stream(args.steps, args.interval):
+                f.write(json.dumps({'vin': vin, 'data': status}, ensure_ascii=False, separators=(',', ':')) + '\n')
+                written += 1
+        print(f"{written} records written to {args.out}")
+
+
+if __name__ == '__main__':
+    main()
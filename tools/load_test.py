@@ -0,0 +1,139 @@
+# tools/load_test.py
+"""
+Нагрузочный тест координаторов против tools/fake_gateway.py
+
+Запуск из корня репозитория:
+
+    python -m tools.fake_gateway --vins 300 --latency 150 &
+    python -m tools.load_test --url http://127.0.0.1:8765 --duration 120
+
+Без --url шлюз поднимается в том же процессе (--vins, --latency и т.д.
+передаются ему) - удобно, но шлюз делит event loop с координаторами.
+
+Тест поднимает Home Assistant во временной папке, создает ZeekrAPI и
+ZeekrAccountCoordinator как async_setup_entry и опрашивает все машины по
+их обычному расписанию. В конце печатает число успешных и неудачных
+обновлений, задержку event loop и счетчики шлюза.
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from typing import List
+
+from aiohttp import ClientSession, web
+from homeassistant.core import HomeAssistant
+
+from custom_components.zeekr.coordinator import ZeekrAccountCoordinator, ZeekrPollingScheduler
+from custom_components.zeekr.zeekr_api import ZeekrAPI
+from tools.fake_gateway import FakeGateway, build_parser, make_source
+
+LOOP_LAG_INTERVAL = 0.1  # Шаг замера задержки event loop, секунды
+
+
+async def measure_loop_lag(samples: List[float], stop: asyncio.Event) -> None:
+    """Насколько позже запланированного просыпается event loop (мс)"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        samples.append((loop.time() - start - LOOP_LAG_INTERVAL) * 1000)
+
+
+async def run(args: argparse.Namespace) -> None:
+    runner = None
+    url = args.url
+    if url is None:
+        gateway = FakeGateway(
+            make_source(args),
+            access_token=args.access_token, refresh_token=args.refresh_token,
+            token_ttl=args.token_ttl, latency=args.latency, jitter=args.jitter,
+            error_rate=args.error_rate, rate_limit=args.rate_limit,
+            verify_signature=not args.no_verify_signature,
+        )
+        runner = web.AppRunner(gateway.app())
+        await runner.setup()
+        await web.TCPSite(runner, args.host, args.port).start()
+        url = f"http://{args.host}:{args.port}"
+
+    hass = HomeAssistant(tempfile.mkdtemp(prefix='zeekr_load_'))
+    await hass.async_start()
+    session = ClientSession()
+
+    api = ZeekrAPI(
+        access_token=args.access_token, user_id='load-test', client_id='load-test',
+        device_id='load-test-device', async_session=session,
+        max_concurrent_requests=args.max_concurrent, refresh_token=args.refresh_token,
+        rate_limit_per_minute=args.client_rate_limit, rate_limit_burst=args.client_burst,
+        base_url=url, token_refresh=True,
+    )
+    scheduler = ZeekrPollingScheduler(default_interval=args.interval)
+    account = ZeekrAccountCoordinator(hass, api, entry_id='load_test', scheduler=scheduler)
+
+    stop = asyncio.Event()
+    lag: List[float] = []
+    lag_task = asyncio.create_task(measure_loop_lag(lag, stop))
+
+    started = time.monotonic()
+    await account.async_refresh()
+    account.create_vehicle_coordinators()
+    vehicles = list(account.vehicles.values())
+    print(f"{len(vehicles)} vehicles from {url}")
+
+    # Счетчики обновлений по слушателям координаторов
+    results = {'ok': 0, 'failed': 0}
+
+    def listener(coordinator):
+        def update():
+            results['ok' if coordinator.last_update_success else 'failed'] += 1
+        return update
+
+    unsubs = [vehicle.async_add_listener(listener(vehicle)) for vehicle in vehicles]
+    await account.async_refresh_coordinators(vehicles)
+    first_cycle = time.monotonic() - started
+    print(f"First cycle for all vehicles: {first_cycle:.1f}s")
+
+    await asyncio.sleep(args.duration)
+
+    stop.set()
+    await lag_task
+    for unsub in unsubs:
+        unsub()
+
+    async with session.get(f"{url}/__stats") as response:
+        gateway_stats = await response.json()
+
+    print(f"Updates: {results['ok']} ok, {results['failed']} failed in {time.monotonic() - started:.0f}s")
+    if lag:
+        lag.sort()
+        print(
+            f"Event loop lag, ms: median {statistics.median(lag):.1f}, "
+            f"p99 {lag[int(len(lag) * 0.99) - 1]:.1f}, max {lag[-1]:.1f}"
+        )
+    print(f"Circuit: {api.circuit.state}, failures {api.circuit.failures}")
+    for key, count in gateway_stats['requests'].items():
+        print(f"  {key}: {count}")
+
+    for coordinator in [*vehicles, account]:
+        await coordinator.async_shutdown()
+    await session.close()
+    await hass.async_stop()
+    if runner is not None:
+        await runner.cleanup()
+
+
+def main(argv: List[str] = None) -> None:
+    parser = build_parser()
+    parser.description = __doc__.split('\n')[1]
+    parser.add_argument('--url', help='Адрес уже запущенного шлюза (иначе - поднять в процессе)')
+    parser.add_argument('--duration', type=float, default=60, help='Длительность теста после первого цикла, с')
+    parser.add_argument('--interval', type=int, default=60, help='Интервал опроса машины, с')
+    parser.add_argument('--max-concurrent', type=int, default=4, help='max_concurrent_requests клиента')
+    parser.add_argument('--client-rate-limit', type=float, default=600, help='Предел запросов клиента в минуту')
+    parser.add_argument('--client-burst', type=int, default=50, help='Пачка запросов клиента без ожидания')
+    asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == '__main__':
+    main()